@@ -5,7 +5,7 @@ Implementation of various compliance checks.
 """
 
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from src.agents.compliance.models import (
@@ -17,6 +17,12 @@ from src.agents.policy.models import RecommendedAction
 logger = logging.getLogger(__name__)
 
 
+def _parse_utc(value: str) -> datetime:
+    """Parse an ISO timestamp, treating naive values as UTC."""
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
 class ComplianceChecker:
     """
     Performs various compliance checks on recommended actions.
@@ -177,12 +183,13 @@ class ComplianceChecker:
         recent_actions = recent_actions or []
 
         # Count actions on same node in last hour
-        one_hour_ago = datetime.utcnow() - timedelta(hours=1)
+        # Execution records carry UTC timestamps, with or without an offset
+        one_hour_ago = datetime.now(timezone.utc) - timedelta(hours=1)
 
         node_actions = [
             a for a in recent_actions
             if a.get("target_node_id") == action.target_node_id
-               and datetime.fromisoformat(a.get("completed_at", "2000-01-01")) > one_hour_ago
+               and _parse_utc(a.get("completed_at", "2000-01-01")) > one_hour_ago
         ]
 
         if len(node_actions) >= self.rate_limit_per_hour:
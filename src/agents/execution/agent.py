@@ -86,6 +86,10 @@ class ExecutionAgent(BaseAgent):
         # Initialize Audit Logger
         self.audit = audit_logger or AuditLogger()
         self._audit_connected = False
+        self._log_intent = self.audit.make_intent_logger(
+            agent_name="execution",
+            compliance_status="approved",
+        )
 
         # Execution settings
         self.verify_after_execution = True
@@ -238,7 +242,7 @@ class ExecutionAgent(BaseAgent):
             self.logger.info(f"Logging intent:  {execution.action_type} on {execution.target_node_id}")
 
             if not dry_run:
-                intent_result = self.audit.log_intent(
+                intent_result = self._log_intent(
                     action_type=execution.action_type,
                     target_node_id=execution.target_node_id,
                     target_node_name=execution.target_node_name,
@@ -246,14 +250,12 @@ class ExecutionAgent(BaseAgent):
                     reason=execution.reason or "Automated remediation",
                     original_issue_type=execution.source_issue_type,
                     policy_ids=[execution.source_policy_id] if execution.source_policy_id else [],
-                    compliance_status="approved",
                     approved_by=validation.approved_by,
                     diagnosis_id=compliance_result.diagnosis_id if compliance_result else "",
                     recommendation_id=compliance_result.recommendation_id if compliance_result else "",
                     compliance_id=compliance_result.id if compliance_result else "",
                     action_id=execution.action_id,
                     execution_id=execution.id,
-                    agent_name="execution",
                 )
                 intent_record_id = intent_result.get("record_id", "")
                 self.logger.info(f"Intent logged: {intent_record_id}")
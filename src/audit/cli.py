@@ -11,8 +11,6 @@ from typing import Optional
 
 import click
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
 
 from src.audit.logger import AuditLogger
 from src.audit.models import AuditRecordType
@@ -33,6 +31,8 @@ def cli():
 @cli.command()
 def status():
     """Show audit system status."""
+    from rich.panel import Panel
+
     audit = AuditLogger()
     audit.connect()
 
@@ -64,6 +64,9 @@ def status():
 @click.option("--verbose", "-v", is_flag=True, help="Show full details")
 def list(record_type: str, limit: int, verbose: bool):
     """List audit records."""
+    from rich.panel import Panel
+    from rich.table import Table
+
     audit = AuditLogger()
     audit.connect()
 
@@ -110,6 +113,8 @@ def list(record_type: str, limit: int, verbose: bool):
 @click.option("--limit", "-l", default=20, help="Number of records to show")
 def intents(limit: int):
     """List intent records."""
+    from rich.table import Table
+
     audit = AuditLogger()
     audit.connect()
 
@@ -145,6 +150,8 @@ def intents(limit: int):
 @click.option("--limit", "-l", default=20, help="Number of records to show")
 def results(limit: int):
     """List result records."""
+    from rich.table import Table
+
     audit = AuditLogger()
     audit.connect()
 
@@ -186,6 +193,8 @@ def results(limit: int):
 @click.option("--limit", "-l", default=20, help="Number of records to show")
 def denials(limit: int):
     """List denial records."""
+    from rich.table import Table
+
     audit = AuditLogger()
     audit.connect()
 
@@ -222,6 +231,8 @@ def denials(limit: int):
 @click.option("--verify", "-v", is_flag=True, help="Verify cryptographically")
 def get(key: str, verify: bool):
     """Get a specific audit record by key."""
+    from rich.panel import Panel
+
     audit = AuditLogger()
     audit.connect()
 
@@ -249,6 +260,8 @@ def get(key: str, verify: bool):
 @cli.command()
 def summary():
     """Show audit summary report."""
+    from rich.panel import Panel
+
     audit = AuditLogger()
     audit.connect()
 
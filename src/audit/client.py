@@ -11,11 +11,21 @@ from datetime import datetime
 from typing import Optional, List
 from dataclasses import dataclass
 
-from dotenv import load_dotenv
+logger = logging.getLogger(__name__)
 
-load_dotenv()
+_env_loaded = False
 
-logger = logging.getLogger(__name__)
+
+def load_env() -> None:
+    """Load the .env file once, on first use instead of at import time."""
+    global _env_loaded
+    if _env_loaded:
+        return
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    _env_loaded = True
 
 
 @dataclass
@@ -30,6 +40,7 @@ class ImmudbConfig:
     @classmethod
     def from_env(cls) -> "ImmudbConfig":
         """Create config from environment variables."""
+        load_env()
         return cls(
             host=os. getenv("IMMUDB_HOST", "localhost"),
             port=int(os.getenv("IMMUDB_PORT", "3322")),
@@ -5,13 +5,13 @@ Service for logging audit records to immudb.
 """
 
 import os
+import inspect
 import logging
 from datetime import datetime, timedelta
-from typing import Optional, List
+from functools import partial
+from typing import Callable, Optional, List
 
-from dotenv import load_dotenv
-
-from src.audit.client import ImmudbClient, ImmudbConfig
+from src.audit.client import ImmudbClient, ImmudbConfig, load_env
 from src.audit.models import (
     AuditRecord,
     AuditRecordType,
@@ -21,8 +21,6 @@ from src.audit.models import (
     AuditQuery,
 )
 
-load_dotenv()
-
 logger = logging.getLogger(__name__)
 
 
@@ -49,6 +47,7 @@ class AuditLogger:
         Args:
             client: immudb client (creates one if not provided)
         """
+        load_env()
         self.client = client or ImmudbClient()
         self.enabled = os.getenv("AUDIT_ENABLED", "true").lower() == "true"
         self.log_intents = os.getenv("AUDIT_LOG_INTENTS", "true").lower() == "true"
@@ -190,6 +189,25 @@ class AuditLogger:
 
         return self.log_record(record)
 
+    def make_intent_logger(self, **frozen_kwargs) -> Callable[..., dict]:
+        """
+        Build an intent logger with some arguments fixed up front.
+
+        Call sites that always log with the same agent name, compliance
+        status, etc. bind those once instead of passing them every time.
+
+        Args:
+            **frozen_kwargs: log_intent arguments to fix
+
+        Returns:
+            Callable accepting the remaining log_intent arguments
+        """
+        unknown = set(frozen_kwargs) - set(inspect.signature(self.log_intent).parameters)
+        if unknown:
+            raise TypeError(f"Unknown log_intent arguments: {', '.join(sorted(unknown))}")
+
+        return partial(self.log_intent, **frozen_kwargs)
+
     def log_result(
             self,
             action_type: str,
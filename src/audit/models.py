@@ -12,6 +12,21 @@ import uuid
 import json
 import hashlib
 
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:
+    _parse_datetime = datetime.fromisoformat
+
+
+def parse_timestamp(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp (uses ciso8601 when installed)."""
+    return _parse_datetime(value)
+
+
+# json.dumps builds a new encoder whenever non-default options are passed;
+# reuse one for the canonical (sorted-key) form that content hashes cover.
+_HASH_ENCODER = json.JSONEncoder(sort_keys=True)
+
 
 class AuditRecordType(str, Enum):
     """Types of audit records."""
@@ -67,8 +82,8 @@ class AuditRecord:
             "summary": self.summary,
             "details": self.details,
         }
-        content_str = json.dumps(content, sort_keys=True)
-        self.content_hash = hashlib.sha256(content_str.encode()).hexdigest()
+        content_bytes = _HASH_ENCODER.encode(content).encode()
+        self.content_hash = hashlib.sha256(content_bytes).hexdigest()
         return self.content_hash
 
     def to_dict(self) -> dict:
@@ -115,7 +130,7 @@ class AuditRecord:
         )
 
         if data.get("timestamp"):
-            record.timestamp = datetime.fromisoformat(data["timestamp"])
+            record.timestamp = parse_timestamp(data["timestamp"])
 
         return record
 
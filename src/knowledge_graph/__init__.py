@@ -4,12 +4,34 @@ Knowledge Graph Package
 Provides Neo4j-based storage for network topology and policy rules. 
 """
 
-from src.knowledge_graph.client import Neo4jClient
-from src.knowledge_graph.topology import TopologyManager
-from src.knowledge_graph.policies import PolicyManager
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.knowledge_graph.client import AsyncNeo4jClient, Neo4jClient
+    from src.knowledge_graph.topology import AsyncTopologyManager, TopologyManager
+    from src.knowledge_graph.policies import PolicyManager
 
 __all__ = [
     "Neo4jClient",
+    "AsyncNeo4jClient",
     "TopologyManager",
+    "AsyncTopologyManager",
     "PolicyManager",
-]
\ No newline at end of file
+]
+
+# Exports are resolved on first access so that importing a submodule (e.g. the
+# CLI) does not pull in the Neo4j driver until it is actually needed.
+_EXPORTS = {
+    "Neo4jClient": "src.knowledge_graph.client",
+    "AsyncNeo4jClient": "src.knowledge_graph.client",
+    "TopologyManager": "src.knowledge_graph.topology",
+    "AsyncTopologyManager": "src.knowledge_graph.topology",
+    "PolicyManager": "src.knowledge_graph.policies",
+}
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        return getattr(import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
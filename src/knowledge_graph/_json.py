@@ -0,0 +1,26 @@
+"""
+Knowledge Graph JSON Encoding
+
+Compact JSON for values stored as string properties (node metadata,
+policy conditions and actions, rule parameters).
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any) -> str:
+    """Serialize obj to a compact JSON string, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, default=str, separators=(",", ":"))
+
+
+# One decoder shared by every record when orjson is unavailable.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the latter
+loads = orjson.loads if orjson is not None else json.JSONDecoder().decode
@@ -2,37 +2,69 @@
 CLI for Knowledge Graph operations. 
 """
 
+import atexit
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
 import click
 from rich. console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.tree import Tree
 
-from src.knowledge_graph.client import Neo4jClient
-from src.knowledge_graph.topology import TopologyManager
-from src. knowledge_graph.policies import PolicyManager
-from src.simulator.network_sim import NetworkSimulator
-from src. models.network import NodeStatus
-from src. models.policy import PolicyStatus
+# Heavier modules (Neo4j driver, simulator, Rich widgets) are imported inside
+# the commands that use them so `--help` and simple commands start quickly.
+if TYPE_CHECKING:
+    from src.knowledge_graph.client import Neo4jClient
+    from src.simulator.network_sim import NetworkSimulator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 console = Console()
 
+# Rich styles for node status, keyed by raw status string
+_STATUS_STYLE_STR = MappingProxyType({
+    "healthy": "green",
+    "warning": "yellow",
+    "critical": "red",
+    "down": "red bold",
+})
+
+
+def _dumps_indented(data) -> str:
+    """Serialize data as indented JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+@lru_cache(maxsize=None)
+def get_client() -> "Neo4jClient":
+    """
+    Get the shared Neo4j client.
 
-def get_client() -> Neo4jClient:
-    """Get Neo4j client."""
+    The client (and its driver connection pool) is created once per process
+    and reused by every command; it is closed at interpreter exit.
+    """
+    from src.knowledge_graph.client import Neo4jClient
+    
     client = Neo4jClient()
     try:
         client.connect()
-        return client
     except Exception as e:
         console.print(f"[red]✗ Failed to connect to Neo4j: {e}[/red]")
         console.print("[dim]Make sure Neo4j is running and credentials are correct.[/dim]")
         raise click.Abort()
 
+    atexit.register(client.close)
+    return client
+
 
 @click.group()
 @click.version_option(version="0.1.0")
@@ -51,6 +83,9 @@ def cli():
 @cli.command()
 def status():
     """Check Neo4j connection status."""
+    from rich.panel import Panel
+    from src.knowledge_graph.client import Neo4jClient
+    
     client = Neo4jClient()
     
     try:
@@ -84,14 +119,15 @@ def status():
 @cli.command()
 def init():
     """Initialize database with indexes."""
+    from src.knowledge_graph.topology import TopologyManager
+    
     client = get_client()
     
-    try:
-        console.print("[bold]Creating indexes...[/bold]")
-        client. create_indexes()
-        console. print("[green]✓ Indexes created successfully[/green]")
-    finally:
-        client. close()
+    console.print("[bold]Creating indexes...[/bold]")
+    client. create_indexes()
+    # Nodes written by older versions have no stored degree yet
+    TopologyManager(client).refresh_degrees(missing_only=True)
+    console. print("[green]✓ Indexes created successfully[/green]")
 
 
 @cli.command()
@@ -100,11 +136,8 @@ def clear():
     """Clear all data from the database."""
     client = get_client()
     
-    try:
-        client.clear_database()
-        console.print("[green]✓ Database cleared[/green]")
-    finally:
-        client.close()
+    client.clear_database()
+    console.print("[green]✓ Database cleared[/green]")
 
 
 # =============================================================================
@@ -120,155 +153,154 @@ def topology():
 @topology.command("import")
 def import_topology():
     """Import topology from simulator into Neo4j."""
+    from rich.panel import Panel
+    from src.knowledge_graph.topology import TopologyManager
+    
     client = get_client()
     
-    try:
-        # Create simulator topology
-        console.print("[bold]Creating network topology...[/bold]")
-        sim = NetworkSimulator()
-        sim.create_default_topology()
-        
-        # Import into Neo4j
-        console.print("[bold]Importing into Neo4j...[/bold]")
-        topo_mgr = TopologyManager(client)
-        result = topo_mgr.import_from_simulator(sim)
-        
-        console.print(Panel(
-            f"[green]✓ Import complete[/green]\n\n"
-            f"[bold]Nodes imported:[/bold] {result['nodes']}\n"
-            f"[bold]Links imported:[/bold] {result['links']}",
-            title="Topology Import",
-            border_style="green"
-        ))
-    finally:
-        client. close()
+    # Create simulator topology
+    console.print("[bold]Creating network topology...[/bold]")
+    sim = _create_default_simulator()
+    
+    # Import into Neo4j
+    console.print("[bold]Importing into Neo4j...[/bold]")
+    topo_mgr = TopologyManager(client)
+    result = topo_mgr.import_from_simulator(sim)
+    
+    lines = [
+        "[green]✓ Import complete[/green]",
+        "",
+        f"[bold]Nodes imported:[/bold] {result['nodes']}",
+        f"[bold]Links imported:[/bold] {result['links']}",
+    ]
+    console.print(Panel(
+        "\n".join(lines),
+        title="Topology Import",
+        border_style="green"
+    ))
 
 
 @topology.command("show")
 @click.option("--format", "output_format", type=click.Choice(["table", "json", "tree"]), default="table")
-def show_topology(output_format: str):
+@click.option("--limit", type=click.IntRange(min=1), default=500, show_default=True, help="Nodes per page (table format)")
+@click.option("--page", type=click.IntRange(min=0), default=0, show_default=True, help="Page number, starting at 0 (table format)")
+def show_topology(output_format: str, limit: int, page: int):
     """Display network topology."""
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.tree import Tree
+    from src.knowledge_graph.topology import TopologyManager
+    
     client = get_client()
     
-    try:
-        topo_mgr = TopologyManager(client)
-        nodes = topo_mgr.get_all_nodes()
-        links = topo_mgr.get_all_links()
+    topo_mgr = TopologyManager(client)
+    
+    if output_format == "tree":
+        tree = Tree("[bold]Network Topology[/bold]")
         
-        if output_format == "json":
-            data = {
-                "nodes": [{"id": n.id, "name": n.name, "type": n. type. value, "status": n. status.value} for n in nodes],
-                "links": [{"source": l. source_node_id, "target": l.target_node_id} for l in links],
-            }
-            console.print_json(json.dumps(data, indent=2))
+        for type_name, type_nodes in topo_mgr.get_nodes_grouped_by_type().items():
+            type_branch = tree.add(f"[cyan]{type_name}[/cyan] ({len(type_nodes)})")
+            for node in type_nodes:
+                status_color = _STATUS_STYLE_STR.get(node["status"], "white")
+                type_branch.add(f"{node['name']} [{status_color}]{node['status']}[/{status_color}]")
         
-        elif output_format == "tree":
-            tree = Tree("[bold]Network Topology[/bold]")
-            
-            # Group nodes by type
-            by_type = {}
-            for node in nodes:
-                type_name = node. type.value
-                if type_name not in by_type:
-                    by_type[type_name] = []
-                by_type[type_name].append(node)
-            
-            for type_name, type_nodes in sorted(by_type. items()):
-                type_branch = tree.add(f"[cyan]{type_name}[/cyan] ({len(type_nodes)})")
-                for node in type_nodes:
-                    status_color = {
-                        "healthy": "green",
-                        "warning": "yellow",
-                        "critical": "red",
-                        "down": "red bold",
-                    }. get(node.status.value, "white")
-                    type_branch.add(f"{node.name} [{status_color}]{node.status.value}[/{status_color}]")
-            
-            console.print(tree)
+        console.print(tree)
+        return
+    
+    if output_format == "json":
+        bundle = topo_mgr.get_topology_bundle()
+        nodes = bundle["nodes"]
+        links = bundle["links"]
+        data = {
+            "nodes": [{"id": n.id, "name": n.name, "type": n. type. value, "status": n. status.value} for n in nodes],
+            "links": [{"source": l. source_node_id, "target": l.target_node_id} for l in links],
+        }
+        console.print_json(_dumps_indented(data))
+    
+    else:  # table
+        summary = topo_mgr.get_topology_summary()
+        console.print(Panel(
+            f"[bold]Total Nodes:[/bold] {summary['nodes']}\n"
+            f"[bold]Total Links:[/bold] {summary['links']}\n"
+            f"[bold]Node Types:[/bold] {', '.join(summary['types'])}\n"
+            f"[bold]Locations:[/bold] {', '.join(summary['locations'])}",
+            title="Topology Summary"
+        ))
         
-        else:  # table
-            summary = topo_mgr.get_topology_summary()
-            console.print(Panel(
-                f"[bold]Total Nodes:[/bold] {summary['nodes']}\n"
-                f"[bold]Total Links:[/bold] {summary['links']}\n"
-                f"[bold]Node Types:[/bold] {', '.join(summary['types'])}\n"
-                f"[bold]Locations:[/bold] {', '.join(summary['locations'])}",
-                title="Topology Summary"
-            ))
-            
-            table = Table(title="Network Nodes")
-            table. add_column("ID", style="cyan")
-            table.add_column("Name", style="green")
-            table. add_column("Type", style="yellow")
-            table.add_column("IP Address", style="blue")
-            table.add_column("Status", style="magenta")
-            table.add_column("Vendor")
-            
-            for node in nodes:
-                status_style = {
-                    NodeStatus.HEALTHY: "green",
-                    NodeStatus.WARNING: "yellow",
-                    NodeStatus. CRITICAL: "red",
-                    NodeStatus.DOWN: "red bold",
-                }.get(node. status, "white")
-                
-                table.add_row(
-                    node.id,
-                    node.name,
-                    node. type.value,
-                    node.ip_address,
-                    f"[{status_style}]{node. status.value}[/{status_style}]",
-                    node.vendor,
-                )
+        table = Table(title="Network Nodes")
+        table. add_column("ID", style="cyan")
+        table.add_column("Name", style="green")
+        table. add_column("Type", style="yellow")
+        table.add_column("IP Address", style="blue")
+        table.add_column("Status", style="magenta")
+        table.add_column("Vendor")
+        
+        shown = 0
+        for node in topo_mgr.iter_nodes(page=page, size=limit):
+            shown += 1
+            node_type = node.type.value
+            status = node.status.value
+            status_style = _STATUS_STYLE_STR.get(status, "white")
             
-            console.print(table)
-    finally:
-        client.close()
+            table.add_row(
+                node.id,
+                node.name,
+                node_type,
+                node.ip_address,
+                f"[{status_style}]{status}[/{status_style}]",
+                node.vendor,
+            )
+        
+        console.print(table)
+        
+        if shown == limit and (page + 1) * limit < summary["nodes"]:
+            console.print(f"[dim]Showing page {page} ({shown} nodes). Use --page {page + 1} for more.[/dim]")
 
 
 @topology.command("node")
 @click. argument("node_id")
 def show_node(node_id: str):
     """Show details for a specific node."""
+    from rich.panel import Panel
+    from rich.table import Table
+    from src.knowledge_graph.topology import TopologyManager
+    
     client = get_client()
     
-    try:
-        topo_mgr = TopologyManager(client)
-        node = topo_mgr.get_node(node_id)
-        
-        if not node:
-            console.print(f"[red]✗ Node not found: {node_id}[/red]")
-            return
-        
-        # Get connected nodes
-        connected = topo_mgr.get_connected_nodes(node_id)
+    topo_mgr = TopologyManager(client)
+    node, connected = topo_mgr.get_node_with_neighbors(node_id)
+    
+    if not node:
+        console.print(f"[red]✗ Node not found: {node_id}[/red]")
+        return
+    
+    lines = [
+        f"[bold]ID:[/bold] {node.id}",
+        f"[bold]Name:[/bold] {node.name}",
+        f"[bold]Type:[/bold] {node. type.value}",
+        f"[bold]IP Address:[/bold] {node.ip_address}",
+        f"[bold]Status:[/bold] {node.status. value}",
+        f"[bold]Location:[/bold] {node.location}",
+        f"[bold]Vendor:[/bold] {node.vendor}",
+        f"[bold]Model:[/bold] {node.model}",
+        f"[bold]Interfaces:[/bold] {', '.join(node. interfaces[:5])}{'...' if len(node.interfaces) > 5 else ''}",
+    ]
+    console.print(Panel(
+        "\n".join(lines),
+        title=f"Node: {node.name}",
+        border_style="cyan"
+    ))
+    
+    if connected:
+        table = Table(title="Connected Nodes")
+        table.add_column("ID", style="cyan")
+        table.add_column("Name", style="green")
+        table.add_column("Type", style="yellow")
         
-        console.print(Panel(
-            f"[bold]ID:[/bold] {node.id}\n"
-            f"[bold]Name:[/bold] {node.name}\n"
-            f"[bold]Type:[/bold] {node. type.value}\n"
-            f"[bold]IP Address:[/bold] {node.ip_address}\n"
-            f"[bold]Status:[/bold] {node.status. value}\n"
-            f"[bold]Location:[/bold] {node.location}\n"
-            f"[bold]Vendor:[/bold] {node.vendor}\n"
-            f"[bold]Model:[/bold] {node.model}\n"
-            f"[bold]Interfaces:[/bold] {', '.join(node. interfaces[:5])}{'...' if len(node.interfaces) > 5 else ''}",
-            title=f"Node: {node.name}",
-            border_style="cyan"
-        ))
+        for conn in connected:
+            table. add_row(conn.id, conn. name, conn.type.value)
         
-        if connected:
-            table = Table(title="Connected Nodes")
-            table.add_column("ID", style="cyan")
-            table.add_column("Name", style="green")
-            table.add_column("Type", style="yellow")
-            
-            for conn in connected:
-                table. add_row(conn.id, conn. name, conn.type.value)
-            
-            console.print(table)
-    finally:
-        client.close()
+        console.print(table)
 
 
 @topology.command("path")
@@ -276,58 +308,59 @@ def show_node(node_id: str):
 @click. argument("target_id")
 def find_path(source_id: str, target_id: str):
     """Find path between two nodes."""
+    from src.knowledge_graph.topology import TopologyManager
+    
     client = get_client()
     
-    try:
-        topo_mgr = TopologyManager(client)
-        path = topo_mgr.find_path(source_id, target_id)
-        
-        if not path:
-            console.print(f"[yellow]No path found between {source_id} and {target_id}[/yellow]")
-            return
-        
-        console. print(f"\n[bold]Path ({len(path)} hops):[/bold]\n")
-        
-        for i, node in enumerate(path):
-            prefix = "  " if i == 0 else "  │\n  ▼\n  "
-            console. print(f"{prefix}[cyan]{node.name}[/cyan] ({node.type. value})")
-        
-        console.print()
-    finally:
-        client.close()
+    topo_mgr = TopologyManager(client)
+    path = topo_mgr.find_path(source_id, target_id)
+    
+    if not path:
+        console.print(f"[yellow]No path found between {source_id} and {target_id}[/yellow]")
+        return
+    
+    console. print(f"\n[bold]Path ({len(path)} hops):[/bold]\n")
+    
+    for i, node in enumerate(path):
+        prefix = "  " if i == 0 else "  │\n  ▼\n  "
+        console. print(f"{prefix}[cyan]{node.name}[/cyan] ({node.type. value})")
+    
+    console.print()
 
 
 @topology.command("critical")
 def show_critical_nodes():
     """Show critical nodes in the network."""
+    from rich.table import Table
+    from src.knowledge_graph.topology import TopologyManager
+    
     client = get_client()
     
-    try:
-        topo_mgr = TopologyManager(client)
-        critical = topo_mgr.get_critical_nodes()
-        
-        if not critical:
-            console.print("[yellow]No critical nodes found[/yellow]")
-            return
-        
-        table = Table(title="Critical Nodes")
-        table.add_column("ID", style="cyan")
-        table.add_column("Name", style="green")
-        table.add_column("Type", style="yellow")
-        table. add_column("Status", style="magenta")
-        
-        for node in critical:
-            status_style = "green" if node.status == NodeStatus.HEALTHY else "red"
-            table. add_row(
-                node.id,
-                node.name,
-                node. type.value,
-                f"[{status_style}]{node.status.value}[/{status_style}]",
-            )
-        
-        console.print(table)
-    finally:
-        client. close()
+    topo_mgr = TopologyManager(client)
+    critical = topo_mgr.get_critical_nodes()
+    
+    if not critical:
+        console.print("[yellow]No critical nodes found[/yellow]")
+        return
+    
+    table = Table(title="Critical Nodes")
+    table.add_column("ID", style="cyan")
+    table.add_column("Name", style="green")
+    table.add_column("Type", style="yellow")
+    table. add_column("Status", style="magenta")
+    
+    for node in critical:
+        node_type = node.type.value
+        status = node.status.value
+        status_style = _STATUS_STYLE_STR.get(status, "white")
+        table. add_row(
+            node.id,
+            node.name,
+            node_type,
+            f"[{status_style}]{status}[/{status_style}]",
+        )
+    
+    console.print(table)
 
 
 # =============================================================================
@@ -344,6 +377,8 @@ def policies():
 @click. argument("file_path", type=click.Path(exists=True))
 def load_policies(file_path: str):
     """Load policies from a YAML file."""
+    from src.knowledge_graph.policies import PolicyManager
+    
     client = get_client()
     
     try:
@@ -353,95 +388,103 @@ def load_policies(file_path: str):
         console.print(f"[green]✓ Loaded {count} policies from {file_path}[/green]")
     except Exception as e:
         console.print(f"[red]✗ Failed to load policies: {e}[/red]")
-    finally:
-        client.close()
 
 
 @policies. command("list")
 @click.option("--status", type=click.Choice(["active", "inactive", "draft"]), default=None)
 def list_policies(status: str):
     """List all policies."""
+    from rich.table import Table
+    from src.knowledge_graph.policies import PolicyManager
+    from src.models.policy import PolicyStatus
+    
     client = get_client()
     
-    try:
-        policy_mgr = PolicyManager(client)
-        
-        if status:
-            policy_list = policy_mgr.get_all_policies(PolicyStatus(status))
-        else:
-            policy_list = policy_mgr.get_all_policies()
-        
-        if not policy_list:
-            console.print("[yellow]No policies found[/yellow]")
-            return
-        
-        table = Table(title=f"Policies ({len(policy_list)} total)")
-        table.add_column("ID", style="cyan")
-        table.add_column("Name", style="green")
-        table. add_column("Type", style="yellow")
-        table.add_column("Priority", style="blue")
-        table. add_column("Status", style="magenta")
-        table.add_column("Conditions", style="white")
-        
-        for policy in policy_list:
-            status_style = "green" if policy.status == PolicyStatus. ACTIVE else "dim"
-            table. add_row(
-                policy.id,
-                policy.name,
-                policy. policy_type.value,
-                str(policy.priority),
-                f"[{status_style}]{policy.status. value}[/{status_style}]",
-                str(len(policy.conditions)),
-            )
-        
-        console.print(table)
-    finally:
-        client.close()
+    policy_mgr = PolicyManager(client)
+    
+    if status:
+        policy_list = policy_mgr.get_policy_listing(PolicyStatus(status))
+    else:
+        policy_list = policy_mgr.get_policy_listing()
+    
+    if not policy_list:
+        console.print("[yellow]No policies found[/yellow]")
+        return
+    
+    table = Table(title=f"Policies ({len(policy_list)} total)")
+    table.add_column("ID", style="cyan")
+    table.add_column("Name", style="green")
+    table. add_column("Type", style="yellow")
+    table.add_column("Priority", style="blue")
+    table. add_column("Status", style="magenta")
+    table.add_column("Conditions", style="white")
+    
+    for policy in policy_list:
+        status_style = "green" if policy["status"] == PolicyStatus. ACTIVE else "dim"
+        table. add_row(
+            policy["id"],
+            policy["name"],
+            policy["policy_type"],
+            str(policy["priority"]),
+            f"[{status_style}]{policy['status']}[/{status_style}]",
+            str(policy["condition_count"]),
+        )
+    
+    console.print(table)
 
 
 @policies.command("show")
 @click. argument("policy_id")
 def show_policy(policy_id: str):
     """Show details for a specific policy."""
+    from rich.panel import Panel
+    from src.knowledge_graph.policies import PolicyManager
+    
     client = get_client()
     
-    try:
-        policy_mgr = PolicyManager(client)
-        policy = policy_mgr.get_policy(policy_id)
-        
-        if not policy:
-            console.print(f"[red]✗ Policy not found: {policy_id}[/red]")
-            return
-        
-        # Build conditions string
-        conditions_str = "\n".join([
-            f"  • {c.field} {c.operator. value} {c. value}"
-            for c in policy.conditions
-        ]) or "  (none)"
-        
-        # Build actions string
-        actions_str = "\n". join([
-            f"  • {a.action_type.value}" + (f" → {a.target}" if a.target else "")
-            for a in policy.actions
-        ]) or "  (none)"
-        
-        console.print(Panel(
-            f"[bold]ID:[/bold] {policy.id}\n"
-            f"[bold]Name:[/bold] {policy.name}\n"
-            f"[bold]Description:[/bold] {policy.description or '(none)'}\n"
-            f"[bold]Type:[/bold] {policy.policy_type.value}\n"
-            f"[bold]Status:[/bold] {policy.status.value}\n"
-            f"[bold]Priority:[/bold] {policy.priority}\n"
-            f"[bold]Version:[/bold] {policy.version}\n\n"
-            f"[bold]Conditions:[/bold]\n{conditions_str}\n\n"
-            f"[bold]Actions:[/bold]\n{actions_str}\n\n"
-            f"[bold]Applies to Node Types:[/bold] {', '.join(policy.applies_to_node_types) or 'All'}\n"
-            f"[bold]Tags:[/bold] {', '.join(policy.tags) or '(none)'}",
-            title=f"Policy: {policy.name}",
-            border_style="cyan"
-        ))
-    finally:
-        client. close()
+    policy_mgr = PolicyManager(client)
+    policy = policy_mgr.get_policy(policy_id)
+    
+    if not policy:
+        console.print(f"[red]✗ Policy not found: {policy_id}[/red]")
+        return
+    
+    lines = [
+        f"[bold]ID:[/bold] {policy.id}",
+        f"[bold]Name:[/bold] {policy.name}",
+        f"[bold]Description:[/bold] {policy.description or '(none)'}",
+        f"[bold]Type:[/bold] {policy.policy_type.value}",
+        f"[bold]Status:[/bold] {policy.status.value}",
+        f"[bold]Priority:[/bold] {policy.priority}",
+        f"[bold]Version:[/bold] {policy.version}",
+        "",
+        "[bold]Conditions:[/bold]",
+    ]
+    lines.extend(
+        f"  • {c.field} {c.operator. value} {c. value}"
+        for c in policy.conditions
+    )
+    if not policy.conditions:
+        lines.append("  (none)")
+    
+    lines.extend(["", "[bold]Actions:[/bold]"])
+    lines.extend(
+        f"  • {a.action_type.value}" + (f" → {a.target}" if a.target else "")
+        for a in policy.actions
+    )
+    if not policy.actions:
+        lines.append("  (none)")
+    
+    lines.extend([
+        "",
+        f"[bold]Applies to Node Types:[/bold] {', '.join(policy.applies_to_node_types) or 'All'}",
+        f"[bold]Tags:[/bold] {', '.join(policy.tags) or '(none)'}",
+    ])
+    console.print(Panel(
+        "\n".join(lines),
+        title=f"Policy: {policy.name}",
+        border_style="cyan"
+    ))
 
 
 @policies.command("evaluate")
@@ -452,91 +495,97 @@ def show_policy(policy_id: str):
 @click. option("--memory", type=float, default=None, help="Memory utilization value")
 def evaluate_policies(anomaly_type: str, severity: str, node_type: str, cpu: float, memory: float):
     """Evaluate policies against a context."""
+    from src.knowledge_graph.policies import PolicyManager
+    
     client = get_client()
     
-    try:
-        policy_mgr = PolicyManager(client)
-        
-        # Build context
-        context = {
-            "anomaly_type": anomaly_type,
-            "severity": severity,
-        }
-        if cpu is not None:
-            context["cpu_utilization"] = cpu
-        if memory is not None:
-            context["memory_utilization"] = memory
-        if node_type:
-            context["node_type"] = node_type
-        
-        console.print(f"[bold]Evaluating policies with context:[/bold]")
-        console. print_json(json.dumps(context, indent=2))
-        console.print()
-        
-        results = policy_mgr.evaluate_policies(context, node_type)
-        
-        if not results:
-            console. print("[yellow]No policies to evaluate[/yellow]")
-            return
-        
-        # Show matching policies
-        matched = [r for r in results if r.matched]
-        not_matched = [r for r in results if not r.matched]
-        
-        if matched:
-            console.print(f"[green bold]✓ {len(matched)} policies matched:[/green bold]\n")
-            
-            for result in matched:
-                actions_str = ", ".join([a.action_type. value for a in result.recommended_actions])
-                console.print(f"  [green]• {result.policy_name}[/green] (ID: {result.policy_id})")
-                console.print(f"    Actions: [cyan]{actions_str}[/cyan]")
-                console.print()
-        else:
-            console. print("[yellow]No policies matched[/yellow]\n")
-        
-        if not_matched and click.confirm("Show non-matching policies?", default=False):
-            console.print(f"\n[dim]{len(not_matched)} policies did not match:[/dim]\n")
-            for result in not_matched[:5]:
-                console.print(f"  [dim]• {result. policy_name}[/dim]")
-                if result.conditions_not_met:
-                    console.print(f"    [dim]Missing: {result.conditions_not_met[0]}[/dim]")
-    finally:
-        client.close()
+    policy_mgr = PolicyManager(client)
+    
+    # Build context
+    context = {
+        "anomaly_type": anomaly_type,
+        "severity": severity,
+    }
+    if cpu is not None:
+        context["cpu_utilization"] = cpu
+    if memory is not None:
+        context["memory_utilization"] = memory
+    if node_type:
+        context["node_type"] = node_type
+    
+    console.print(f"[bold]Evaluating policies with context:[/bold]")
+    console. print_json(_dumps_indented(context))
+    console.print()
+    
+    results = policy_mgr.evaluate_policies(context, node_type)
+    
+    if not results:
+        console. print("[yellow]No policies to evaluate[/yellow]")
+        return
+    
+    # Show matching policies
+    matched = [r for r in results if r.matched]
+    not_matched = [r for r in results if not r.matched]
+    
+    if matched:
+        console.print(f"[green bold]✓ {len(matched)} policies matched:[/green bold]\n")
+        
+        for result in matched:
+            actions_str = ", ".join([a.action_type. value for a in result.recommended_actions])
+            console.print(f"  [green]• {result.policy_name}[/green] (ID: {result.policy_id})")
+            console.print(f"    Actions: [cyan]{actions_str}[/cyan]")
+            console.print()
+    else:
+        console. print("[yellow]No policies matched[/yellow]\n")
+    
+    if not_matched and click.confirm("Show non-matching policies?", default=False):
+        console.print(f"\n[dim]{len(not_matched)} policies did not match:[/dim]\n")
+        for result in not_matched[:5]:
+            console.print(f"  [dim]• {result. policy_name}[/dim]")
+            if result.conditions_not_met:
+                console.print(f"    [dim]Missing: {result.conditions_not_met[0]}[/dim]")
 
 
 @policies.command("seed")
 def seed_default_policies():
     """Seed database with default policies."""
+    from src.knowledge_graph.policies import PolicyManager
+    
     client = get_client()
     
+    policy_mgr = PolicyManager(client)
+    
+    # One directory scan covers both the existence checks and the file listing
+    policies_dir = Path("policies")
     try:
-        policy_mgr = PolicyManager(client)
-        
-        # Check if policies directory exists
-        policies_dir = Path("policies")
-        if not policies_dir. exists():
-            policies_dir.mkdir(parents=True)
-            console.print(f"[dim]Created policies directory: {policies_dir}[/dim]")
-        
-        # Create default policy file if it doesn't exist
-        default_file = policies_dir / "network_policies.yaml"
-        if not default_file.exists():
-            console.print("[yellow]No policy files found.  Creating default policies.. .[/yellow]")
-            _create_default_policy_file(default_file)
-        
-        # Load all YAML files in policies directory
-        total_loaded = 0
-        for yaml_file in policies_dir.glob("*. yaml"):
-            try:
-                count = policy_mgr.load_policies_from_yaml(str(yaml_file))
-                console.print(f"[green]✓ Loaded {count} policies from {yaml_file. name}[/green]")
-                total_loaded += count
-            except Exception as e:
-                console. print(f"[red]✗ Failed to load {yaml_file.name}: {e}[/red]")
-        
-        console. print(f"\n[bold green]✓ Total policies loaded: {total_loaded}[/bold green]")
-    finally:
-        client.close()
+        with os.scandir(policies_dir) as entries:
+            yaml_files = sorted(
+                Path(entry.path) for entry in entries
+                if entry.name.endswith(".yaml") and entry.is_file()
+            )
+    except FileNotFoundError:
+        policies_dir.mkdir(parents=True)
+        console.print(f"[dim]Created policies directory: {policies_dir}[/dim]")
+        yaml_files = []
+    
+    # Create default policy file if it doesn't exist
+    default_file = policies_dir / "network_policies.yaml"
+    if default_file not in yaml_files:
+        console.print("[yellow]No policy files found.  Creating default policies.. .[/yellow]")
+        _create_default_policy_file(default_file)
+        yaml_files.append(default_file)
+    
+    # Load all YAML files in policies directory
+    total_loaded = 0
+    for yaml_file in yaml_files:
+        try:
+            count = policy_mgr.load_policies_from_yaml(str(yaml_file))
+            console.print(f"[green]✓ Loaded {count} policies from {yaml_file. name}[/green]")
+            total_loaded += count
+        except Exception as e:
+            console. print(f"[red]✗ Failed to load {yaml_file.name}: {e}[/red]")
+    
+    console. print(f"\n[bold green]✓ Total policies loaded: {total_loaded}[/bold green]")
 
 
 def _create_default_policy_file(file_path: Path):
@@ -826,6 +875,26 @@ compliance_rules:
     console.print(f"[green]✓ Created default policy file: {file_path}[/green]")
 
 
+def _create_default_simulator() -> "NetworkSimulator":
+    """Create a simulator populated with the default topology."""
+    from src.simulator.network_sim import NetworkSimulator
+    
+    sim = NetworkSimulator()
+    sim.create_default_topology()
+    return sim
+
+
+def _ensure_default_policy_file(policies_dir: Path) -> Path:
+    """Return the default policy file, creating it if it doesn't exist."""
+    policies_dir.mkdir(exist_ok=True)
+    
+    default_file = policies_dir / "network_policies.yaml"
+    if not default_file.exists():
+        _create_default_policy_file(default_file)
+    
+    return default_file
+
+
 # =============================================================================
 # Combined Commands
 # =============================================================================
@@ -833,53 +902,64 @@ compliance_rules:
 @cli.command("setup")
 def setup_all():
     """Setup everything: init, import topology, seed policies."""
+    from rich.panel import Panel
+    from src.knowledge_graph.topology import TopologyManager
+    from src.knowledge_graph.policies import PolicyManager
+    
     client = get_client()
     
-    try:
-        console.print("[bold]Setting up Knowledge Graph...[/bold]\n")
+    console.print("[bold]Setting up Knowledge Graph...[/bold]\n")
+    
+    # Neo4j's driver is thread-safe and every query uses its own session, so
+    # independent stages run concurrently. Indexes are awaited before the
+    # topology import so its MERGE lookups can use them; building the
+    # simulator topology and the policy file needs no database at all.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        indexes_future = executor.submit(client.create_indexes)
+        sim_future = executor.submit(_create_default_simulator)
+        policy_file_future = executor.submit(_ensure_default_policy_file, Path("policies"))
         
         # Create indexes
         console.print("1. Creating indexes...")
-        client.create_indexes()
+        indexes_future.result()
         console.print("[green]   ✓ Indexes created[/green]\n")
         
+        topo_mgr = TopologyManager(client)
+        policy_mgr = PolicyManager(client)
+        import_future = executor.submit(topo_mgr.import_from_simulator, sim_future.result())
+        seed_future = executor.submit(
+            policy_mgr.load_policies_from_yaml, str(policy_file_future.result())
+        )
+        
         # Import topology
         console.print("2. Importing network topology...")
-        sim = NetworkSimulator()
-        sim. create_default_topology()
-        topo_mgr = TopologyManager(client)
-        result = topo_mgr.import_from_simulator(sim)
+        result = import_future.result()
         console.print(f"[green]   ✓ Imported {result['nodes']} nodes and {result['links']} links[/green]\n")
         
         # Seed policies
         console. print("3.  Seeding policies...")
-        policy_mgr = PolicyManager(client)
-        policies_dir = Path("policies")
-        policies_dir.mkdir(exist_ok=True)
-        
-        default_file = policies_dir / "network_policies.yaml"
-        if not default_file.exists():
-            _create_default_policy_file(default_file)
-        
-        count = policy_mgr.load_policies_from_yaml(str(default_file))
+        count = seed_future.result()
         console.print(f"[green]   ✓ Loaded {count} policies[/green]\n")
-        
-        # Summary
-        stats = client.get_database_stats()
-        console.print(Panel(
-            f"[bold green]✓ Setup Complete![/bold green]\n\n"
-            f"[bold]Database Stats:[/bold]\n"
-            f"  • Nodes: {stats['node_count']}\n"
-            f"  • Relationships: {stats['relationship_count']}\n\n"
-            f"[bold]Next Steps:[/bold]\n"
-            f"  • View topology: [cyan]knowledge-graph topology show[/cyan]\n"
-            f"  • View policies: [cyan]knowledge-graph policies list[/cyan]\n"
-            f"  • Evaluate policies: [cyan]knowledge-graph policies evaluate --anomaly-type HIGH_CPU --severity critical[/cyan]",
-            title="Knowledge Graph Setup",
-            border_style="green"
-        ))
-    finally:
-        client.close()
+    
+    # Summary
+    stats = client.get_database_stats()
+    lines = [
+        "[bold green]✓ Setup Complete![/bold green]",
+        "",
+        "[bold]Database Stats:[/bold]",
+        f"  • Nodes: {stats['node_count']}",
+        f"  • Relationships: {stats['relationship_count']}",
+        "",
+        "[bold]Next Steps:[/bold]",
+        "  • View topology: [cyan]knowledge-graph topology show[/cyan]",
+        "  • View policies: [cyan]knowledge-graph policies list[/cyan]",
+        "  • Evaluate policies: [cyan]knowledge-graph policies evaluate --anomaly-type HIGH_CPU --severity critical[/cyan]",
+    ]
+    console.print(Panel(
+        "\n".join(lines),
+        title="Knowledge Graph Setup",
+        border_style="green"
+    ))
 
 
 if __name__ == "__main__":
@@ -4,10 +4,23 @@ Neo4j Client
 Manages connections to Neo4j database. 
 """
 
+import hashlib
 import os
-from typing import Any, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Iterator, Optional
 from contextlib import contextmanager
-from neo4j import GraphDatabase, Driver, Session, Result
+from neo4j import (
+    AsyncDriver,
+    AsyncGraphDatabase,
+    GraphDatabase,
+    Driver,
+    Session,
+    Result,
+    ResultSummary,
+    READ_ACCESS,
+)
+from neo4j.exceptions import Neo4jError
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -27,8 +40,15 @@ class Neo4jClient:
     Or using context manager:
         >>> with Neo4jClient() as client:
         ...     result = client.execute_query("MATCH (n) RETURN n LIMIT 5")
+    
+    Clients connecting to the same URI with the same credentials share one
+    driver (and connection pool); it is closed when the last of them closes.
     """
     
+    # (uri, user, password hash) -> [driver, number of clients using it]
+    _driver_registry: dict[tuple[str, str, str], list] = {}
+    _registry_lock = threading.Lock()
+    
     def __init__(
         self,
         uri: Optional[str] = None,
@@ -49,21 +69,83 @@ class Neo4jClient:
         self.user = user or os.getenv("NEO4J_USER", "neo4j")
         self.password = password or os. getenv("NEO4J_PASSWORD", "password")
         self.database = database or os.getenv("NEO4J_DATABASE", "neo4j")
+        
+        # Driver tuning
+        self.pool_size = int(os.getenv("NEO4J_POOL_SIZE", "50"))
+        self.acquisition_timeout = float(os.getenv("NEO4J_ACQ_TIMEOUT", "60"))
+        self.fetch_size = int(os.getenv("NEO4J_FETCH_SIZE", "1000"))
+        
         self._driver: Optional[Driver] = None
+        self._server_version: Optional[tuple[int, int]] = None
+        self._indexes_created = False
+    
+    def _driver_key(self) -> tuple[str, str, str]:
+        """Registry key identifying the connection target and credentials."""
+        password_hash = hashlib.sha256(self.password.encode()).hexdigest()
+        return (self.uri, self.user, password_hash)
     
     def connect(self) -> "Neo4jClient":
-        """Establish connection to Neo4j."""
+        """
+        Establish connection to Neo4j.
+        
+        Reuses the driver of another connected client with the same URI and
+        credentials; the pool settings of the client that created it apply.
+        """
         if self._driver is None:
-            self._driver = GraphDatabase. driver(
-                self.uri,
-                auth=(self.user, self. password),
-            )
+            key = self._driver_key()
+            with self._registry_lock:
+                entry = self._driver_registry.get(key)
+                if entry is None:
+                    driver = GraphDatabase. driver(
+                        self.uri,
+                        auth=(self.user, self. password),
+                        max_connection_pool_size=self.pool_size,
+                        connection_acquisition_timeout=self.acquisition_timeout,
+                        max_connection_lifetime=3600,
+                        connection_timeout=15.0,
+                        fetch_size=self.fetch_size,
+                        keep_alive=True,
+                    )
+                    entry = self._driver_registry[key] = [driver, 0]
+                entry[1] += 1
+                self._driver = entry[0]
         return self
     
+    def warmup(self, connections: Optional[int] = None) -> None:
+        """
+        Pre-fill the connection pool so first requests skip connection setup.
+        
+        Args:
+            connections: Number of connections to open (default: the pool size)
+        """
+        count = min(connections or self.pool_size, self.pool_size)
+        sessions = []
+        transactions = []
+        try:
+            # Each open transaction holds its own pooled connection
+            for _ in range(count):
+                session = self.driver.session(database=self.database)
+                sessions.append(session)
+                transactions.append(session.begin_transaction())
+        finally:
+            for tx in transactions:
+                tx.close()
+            for session in sessions:
+                session.close()
+    
     def close(self) -> None:
         """Close the Neo4j connection."""
         if self._driver:
-            self._driver.close()
+            with self._registry_lock:
+                key = self._driver_key()
+                entry = self._driver_registry.get(key)
+                if entry is not None and entry[0] is self._driver:
+                    entry[1] -= 1
+                    if entry[1] <= 0:
+                        del self._driver_registry[key]
+                        self._driver.close()
+                else:
+                    self._driver.close()
             self._driver = None
     
     def __enter__(self) -> "Neo4jClient":
@@ -153,6 +235,130 @@ class Neo4jClient:
         with self.session() as session:
             return session.execute_read(_read_tx, query, parameters or {})
     
+    def execute_read_single(
+        self,
+        query: str,
+        parameters: Optional[dict[str, Any]] = None,
+    ) -> Optional[dict[str, Any]]:
+        """
+        Execute a read transaction that returns at most one record.
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+        
+        Returns:
+            The single result record as a dictionary, or None if there is none
+        """
+        def _read_tx(tx, query: str, parameters: dict):
+            record = tx.run(query, parameters).single()
+            return record.data() if record else None
+        
+        with self.session() as session:
+            return session.execute_read(_read_tx, query, parameters or {})
+    
+    def execute_write_single(
+        self,
+        query: str,
+        parameters: Optional[dict[str, Any]] = None,
+    ) -> Optional[dict[str, Any]]:
+        """
+        Execute a write transaction that returns at most one record.
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+        
+        Returns:
+            The single result record as a dictionary, or None if there is none
+        """
+        def _write_tx(tx, query: str, parameters: dict):
+            record = tx.run(query, parameters).single()
+            return record.data() if record else None
+        
+        with self.session() as session:
+            return session.execute_write(_write_tx, query, parameters or {})
+    
+    def execute_write_summary(
+        self,
+        query: str,
+        parameters: Optional[dict[str, Any]] = None,
+    ) -> ResultSummary:
+        """
+        Execute a write transaction and return its summary instead of records.
+        
+        Useful for writes whose outcome is fully described by the update
+        counters (e.g. summary.counters.nodes_deleted).
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+        
+        Returns:
+            ResultSummary of the query
+        """
+        def _write_tx(tx, query: str, parameters: dict):
+            return tx.run(query, parameters).consume()
+        
+        with self.session() as session:
+            return session.execute_write(_write_tx, query, parameters or {})
+    
+    def execute_write_many(
+        self,
+        queries: list[tuple[str, Optional[dict[str, Any]]]],
+        max_workers: int = 8,
+    ) -> list[Any]:
+        """
+        Run independent write queries concurrently.
+        
+        Each query gets its own session and transaction (the driver is
+        thread-safe), so wall time is roughly one round trip instead of one
+        per query. Failures are returned in place of results rather than
+        raised, so one failing query does not hide the others.
+        
+        Args:
+            queries: (query, parameters) pairs
+            max_workers: Maximum number of concurrent sessions
+        
+        Returns:
+            Per-query result lists, or the exception raised by that query
+        """
+        def _run(query: str, parameters: Optional[dict[str, Any]]) -> Any:
+            try:
+                return self.execute_write(query, parameters)
+            except Exception as e:
+                return e
+        
+        if not queries:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(queries))) as executor:
+            return list(executor.map(lambda q: _run(*q), queries))
+    
+    def execute_read_iter(
+        self,
+        query: str,
+        parameters: Optional[dict[str, Any]] = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Execute a read query and yield records as they arrive.
+        
+        Unlike execute_read, records are not collected into a list first, so
+        callers that consume the result once avoid holding every row twice.
+        The query runs as an auto-commit transaction (no automatic retry) and
+        the session stays open until the iterator is exhausted or closed.
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+        
+        Yields:
+            Result records as dictionaries
+        """
+        with self.driver.session(database=self.database, default_access_mode=READ_ACCESS) as session:
+            for record in session.run(query, parameters or {}):
+                yield record.data()
+    
     def verify_connectivity(self) -> bool:
         """Verify connection to Neo4j is working."""
         try:
@@ -161,42 +367,265 @@ class Neo4jClient:
         except Exception:
             return False
     
+    def get_server_version(self) -> tuple[int, int]:
+        """
+        Get the (major, minor) version of the connected Neo4j server.
+        
+        The version is read once from the server agent string
+        (e.g. "Neo4j/5.21.0") and cached; (0, 0) is returned if it cannot
+        be parsed.
+        """
+        if self._server_version is None:
+            agent = self.driver.get_server_info().agent or ""
+            try:
+                major, minor = agent.split("/", 1)[1].split(".")[:2]
+                self._server_version = (int(major), int(minor))
+            except (IndexError, ValueError):
+                self._server_version = (0, 0)
+        return self._server_version
+    
     def clear_database(self) -> None:
         """Clear all nodes and relationships from the database."""
         self.execute_write("MATCH (n) DETACH DELETE n")
     
     def get_node_count(self) -> int:
         """Get total number of nodes in the database."""
-        result = self.execute_read("MATCH (n) RETURN count(n) as count")
-        return result[0]["count"] if result else 0
+        record = self.execute_read_single("MATCH (n) RETURN count(n) as count")
+        return record["count"] if record else 0
     
     def get_relationship_count(self) -> int:
         """Get total number of relationships in the database."""
-        result = self.execute_read("MATCH ()-[r]->() RETURN count(r) as count")
-        return result[0]["count"] if result else 0
+        record = self.execute_read_single("MATCH ()-[r]->() RETURN count(r) as count")
+        return record["count"] if record else 0
     
     def create_indexes(self) -> None:
-        """Create indexes for better query performance."""
+        """
+        Create indexes and constraints for better query performance.
+        
+        Raises:
+            Neo4jError: If a statement fails for a reason other than the
+                index or constraint already existing
+        """
+        # Unique ID constraints. Their backing index replaces the plain ID index
+        # created by earlier versions; if the constraint cannot be created
+        # (e.g. duplicate IDs in existing data) the plain index is kept.
+        id_constraints = [
+            (
+                "node_id",
+                "CREATE CONSTRAINT node_id_unique IF NOT EXISTS FOR (n:NetworkNode) REQUIRE n.id IS UNIQUE",
+                "CREATE INDEX node_id IF NOT EXISTS FOR (n:NetworkNode) ON (n.id)",
+            ),
+            (
+                "policy_id",
+                "CREATE CONSTRAINT policy_id_unique IF NOT EXISTS FOR (p:Policy) REQUIRE p.id IS UNIQUE",
+                "CREATE INDEX policy_id IF NOT EXISTS FOR (p:Policy) ON (p.id)",
+            ),
+            (
+                "compliance_id",
+                "CREATE CONSTRAINT compliance_id_unique IF NOT EXISTS FOR (c:ComplianceRule) REQUIRE c.id IS UNIQUE",
+                "CREATE INDEX compliance_id IF NOT EXISTS FOR (c:ComplianceRule) ON (c.id)",
+            ),
+        ]
         indexes = [
-            "CREATE INDEX node_id IF NOT EXISTS FOR (n:NetworkNode) ON (n.id)",
             "CREATE INDEX node_type IF NOT EXISTS FOR (n:NetworkNode) ON (n.type)",
             "CREATE INDEX node_status IF NOT EXISTS FOR (n:NetworkNode) ON (n. status)",
-            "CREATE INDEX policy_id IF NOT EXISTS FOR (p:Policy) ON (p. id)",
+            # Text index serves the CONTAINS filter in get_nodes_by_location
+            "CREATE TEXT INDEX node_location IF NOT EXISTS FOR (n:NetworkNode) ON (n.location)",
+            "CREATE INDEX link_id IF NOT EXISTS FOR ()-[r:CONNECTS_TO]-() ON (r.id)",
             "CREATE INDEX policy_type IF NOT EXISTS FOR (p:Policy) ON (p.policy_type)",
             "CREATE INDEX policy_status IF NOT EXISTS FOR (p:Policy) ON (p.status)",
-            "CREATE INDEX compliance_id IF NOT EXISTS FOR (c:ComplianceRule) ON (c.id)",
+            # Composite indexes for the combined filters used by the CLI and agents
+            "CREATE INDEX node_type_status IF NOT EXISTS FOR (n:NetworkNode) ON (n.type, n.status)",
+            # Degree maintained on link writes, used by the critical node query
+            "CREATE INDEX node_degree IF NOT EXISTS FOR (n:NetworkNode) ON (n.degree)",
+            "CREATE INDEX policy_type_status_priority IF NOT EXISTS "
+            "FOR (p:Policy) ON (p.policy_type, p.status, p.priority)",
+            # Lets status-filtered policy reads return rows already ordered by priority
+            "CREATE INDEX policy_status_priority IF NOT EXISTS FOR (p:Policy) ON (p.status, p.priority)",
         ]
-        for index_query in indexes:
+        # Schema statements run one at a time: concurrent schema transactions
+        # contend for the schema lock, and any failure must leave
+        # _indexes_created unset so ensure_indexes() tries again.
+        for legacy_index, constraint_query, index_query in id_constraints:
+            self._run_schema(f"DROP INDEX {legacy_index} IF EXISTS")
             try:
-                self. execute_write(index_query)
-            except Exception:
-                pass  # Index might already exist
+                self._run_schema(constraint_query)
+            except Neo4jError:
+                self._run_schema(index_query)
+        for index_query in indexes:
+            self._run_schema(index_query)
+        self._indexes_created = True
+    
+    def _run_schema(self, query: str) -> None:
+        """Run a schema statement; an equivalent existing index or constraint is not an error."""
+        try:
+            self.execute_write(query)
+        except Neo4jError as e:
+            if not (e.code or "").endswith("AlreadyExists"):
+                raise
+    
+    def ensure_indexes(self) -> None:
+        """Create indexes and constraints unless this client already has."""
+        if not self._indexes_created:
+            self.create_indexes()
     
     def get_database_stats(self) -> dict[str, Any]:
-        """Get database statistics."""
+        """
+        Get database statistics.
+        
+        Both counts come from one query (answered from the count store); if it
+        succeeds the connection is known to work, so no separate connectivity
+        check is made.
+        """
+        counts = self.execute_read_single("""
+        CALL { MATCH (n) RETURN count(n) as node_count }
+        CALL { MATCH ()-[r]->() RETURN count(r) as relationship_count }
+        RETURN node_count, relationship_count
+        """) or {}
         return {
-            "node_count": self. get_node_count(),
-            "relationship_count": self. get_relationship_count(),
-            "connected": self.verify_connectivity(),
+            "node_count": counts.get("node_count", 0),
+            "relationship_count": counts.get("relationship_count", 0),
+            "connected": True,
             "database": self.database,
-        }
\ No newline at end of file
+        }
+
+
+class AsyncNeo4jClient:
+    """
+    Asyncio Neo4j client for callers running on an event loop.
+    
+    Uses the same connection settings (and environment defaults) as
+    Neo4jClient, but queries are awaited instead of blocking the loop, so
+    concurrent callers (e.g. MCP tool handlers) can overlap their round trips.
+    
+    Example:
+        >>> client = AsyncNeo4jClient().connect()
+        >>> result = await client.execute_read("MATCH (n) RETURN count(n) as count")
+        >>> await client.close()
+    """
+    
+    def __init__(
+        self,
+        uri: Optional[str] = None,
+        user: Optional[str] = None,
+        password: Optional[str] = None,
+        database: Optional[str] = None,
+    ):
+        """
+        Initialize async Neo4j client.
+        
+        Args:
+            uri: Neo4j connection URI (default: from NEO4J_URI env var)
+            user: Neo4j username (default: from NEO4J_USER env var)
+            password: Neo4j password (default: from NEO4J_PASSWORD env var)
+            database: Neo4j database name (default: from NEO4J_DATABASE env var)
+        """
+        self.uri = uri or os.getenv("NEO4J_URI", "bolt://localhost:7687")
+        self.user = user or os.getenv("NEO4J_USER", "neo4j")
+        self.password = password or os.getenv("NEO4J_PASSWORD", "password")
+        self.database = database or os.getenv("NEO4J_DATABASE", "neo4j")
+        
+        # Driver tuning
+        self.pool_size = int(os.getenv("NEO4J_POOL_SIZE", "50"))
+        self.acquisition_timeout = float(os.getenv("NEO4J_ACQ_TIMEOUT", "60"))
+        self.fetch_size = int(os.getenv("NEO4J_FETCH_SIZE", "1000"))
+        
+        self._driver: Optional[AsyncDriver] = None
+    
+    def connect(self) -> "AsyncNeo4jClient":
+        """Create the async driver (connections are opened on first use)."""
+        if self._driver is None:
+            self._driver = AsyncGraphDatabase.driver(
+                self.uri,
+                auth=(self.user, self.password),
+                max_connection_pool_size=self.pool_size,
+                connection_acquisition_timeout=self.acquisition_timeout,
+                max_connection_lifetime=3600,
+                connection_timeout=15.0,
+                fetch_size=self.fetch_size,
+                keep_alive=True,
+            )
+        return self
+    
+    async def close(self) -> None:
+        """Close the Neo4j connection."""
+        if self._driver:
+            await self._driver.close()
+            self._driver = None
+    
+    @property
+    def driver(self) -> AsyncDriver:
+        """Get the async Neo4j driver, connecting if necessary."""
+        if self._driver is None:
+            self.connect()
+        return self._driver
+    
+    async def execute_read(
+        self,
+        query: str,
+        parameters: Optional[dict[str, Any]] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Execute a read transaction.
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+        
+        Returns:
+            List of result records as dictionaries
+        """
+        async def _read_tx(tx, query: str, parameters: dict):
+            result = await tx.run(query, parameters)
+            return [record.data() async for record in result]
+        
+        async with self.driver.session(database=self.database) as session:
+            return await session.execute_read(_read_tx, query, parameters or {})
+    
+    async def execute_write(
+        self,
+        query: str,
+        parameters: Optional[dict[str, Any]] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Execute a write transaction.
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+        
+        Returns:
+            List of result records as dictionaries
+        """
+        async def _write_tx(tx, query: str, parameters: dict):
+            result = await tx.run(query, parameters)
+            return [record.data() async for record in result]
+        
+        async with self.driver.session(database=self.database) as session:
+            return await session.execute_write(_write_tx, query, parameters or {})
+    
+    async def execute_read_iter(
+        self,
+        query: str,
+        parameters: Optional[dict[str, Any]] = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Execute a read query and yield records as they arrive.
+        
+        Async counterpart of Neo4jClient.execute_read_iter: an auto-commit
+        transaction (no automatic retry) whose session stays open until the
+        iterator is exhausted or closed.
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+        
+        Yields:
+            Result records as dictionaries
+        """
+        async with self.driver.session(
+            database=self.database, default_access_mode=READ_ACCESS
+        ) as session:
+            result = await session.run(query, parameters or {})
+            async for record in result:
+                yield record.data()
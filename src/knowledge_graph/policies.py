@@ -4,11 +4,17 @@ Policy Manager
 Manages policy rules in Neo4j knowledge graph.
 """
 
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
+import heapq
+import json
+import os
+import time
 import yaml
 
+from src.knowledge_graph._json import dumps as _dumps, loads as _loads
 from src.knowledge_graph.client import Neo4jClient
 from src.models.policy import (
     Policy,
@@ -24,6 +30,37 @@ from src.models.policy import (
 from src.models. network import AnomalyType, AnomalySeverity, NodeType
 
 
+@lru_cache(maxsize=32)
+def _parse_yaml_file(path: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse a YAML file. The mtime is part of the cache key only."""
+    with open(path, "r") as f:
+        return yaml.safe_load(f) or {}
+
+
+def _load_yaml_cached(path: str | Path) -> dict[str, Any]:
+    """
+    Load a YAML file, reusing the parsed result until the file changes.
+    
+    The returned dict is shared between callers and must not be mutated.
+    
+    Args:
+        path: Path to the YAML file
+    
+    Returns:
+        Parsed YAML content
+    """
+    mtime_ns = os.stat(path).st_mtime_ns
+    return _parse_yaml_file(str(path), mtime_ns)
+
+
+def _condition_labels(policy: Policy) -> list[str]:
+    """Format each condition of a policy as "field operator value"."""
+    return [
+        f"{condition.field} {condition.operator.value} {condition.value}"
+        for condition in policy.conditions
+    ]
+
+
 class PolicyManager:
     """
     Manages policy rules storage and evaluation in Neo4j. 
@@ -46,6 +83,9 @@ class PolicyManager:
         >>> results = policy_mgr.evaluate_policies(context)
     """
     
+    # Seconds between checks that cached policies still match the database
+    CACHE_CHECK_INTERVAL = 30.0
+    
     def __init__(self, client: Neo4jClient):
         """
         Initialize PolicyManager.
@@ -54,6 +94,71 @@ class PolicyManager:
             client: Neo4jClient instance
         """
         self.client = client
+        
+        # Policy lists keyed by (status, node_type). Writes through this
+        # manager invalidate it; changes made elsewhere are picked up by the
+        # periodic version check.
+        self._policy_cache: dict[tuple[Optional[str], Optional[str]], list[Policy]] = {}
+        self._cache_version: Optional[tuple] = None
+        self._cache_checked_at = float("-inf")
+        
+        # Inverted index over cached policy lists: status -> node type ->
+        # policies, with catch-all policies (no node types) under "*"
+        self._node_type_index: dict[Optional[str], dict[str, list[Policy]]] = {}
+        
+        # Compiled condition evaluators for cached policies, keyed by policy ID
+        self._compiled_conditions: dict[str, list[Callable[[dict[str, Any]], bool]]] = {}
+        
+        # Pre-formatted "field operator value" strings used in evaluation
+        # diagnostics, keyed by policy ID
+        self._condition_labels: dict[str, list[str]] = {}
+    
+    def invalidate_cache(self) -> None:
+        """Drop cached policy lists."""
+        self._policy_cache.clear()
+        self._node_type_index.clear()
+        self._compiled_conditions.clear()
+        self._condition_labels.clear()
+        self._cache_checked_at = float("-inf")
+    
+    def _cached_policies(
+        self,
+        key: tuple[Optional[str], Optional[str]],
+        loader: Callable[[], list[Policy]],
+    ) -> list[Policy]:
+        """Return the cached policy list for key, loading it on a miss."""
+        now = time.monotonic()
+        if now - self._cache_checked_at >= self.CACHE_CHECK_INTERVAL:
+            version = self._get_policy_version()
+            if version != self._cache_version:
+                self._policy_cache.clear()
+                self._node_type_index.clear()
+                self._compiled_conditions.clear()
+                self._condition_labels.clear()
+                self._cache_version = version
+            self._cache_checked_at = now
+        
+        policies = self._policy_cache.get(key)
+        if policies is None:
+            policies = self._policy_cache[key] = loader()
+            for policy in policies:
+                self._compiled_conditions[policy.id] = [
+                    condition.compile_evaluator() for condition in policy.conditions
+                ]
+                self._condition_labels[policy.id] = _condition_labels(policy)
+        return list(policies)
+    
+    def _get_policy_version(self) -> tuple:
+        """Cheap fingerprint of the stored policies (count and last update)."""
+        query = """
+        MATCH (p:Policy)
+        RETURN count(p) as count, max(p.updated_at) as updated_at
+        """
+        
+        result = self.client.execute_read(query)
+        if not result:
+            return (0, None)
+        return (result[0].get("count"), result[0].get("updated_at"))
     
     # =========================================================================
     # Policy CRUD Operations
@@ -78,6 +183,7 @@ class PolicyManager:
             p.status = $status,
             p.priority = $priority,
             p.conditions = $conditions,
+            p.condition_count = $condition_count,
             p.actions = $actions,
             p.applies_to_node_types = $applies_to_node_types,
             p.applies_to_locations = $applies_to_locations,
@@ -88,15 +194,57 @@ class PolicyManager:
             p.updated_at = datetime(),
             p.created_by = $created_by,
             p.tags = $tags
+        FOREACH (node_type IN $applies_to_node_types |
+            MERGE (nt:NodeType {name: node_type})
+            MERGE (p)-[:APPLIES_TO]->(nt)
+        )
         RETURN p
         """
         
+        parameters = self._policy_parameters(policy)
+        
+        # The APPLIES_TO edges are created in the same query
+        result = self.client. execute_write(query, parameters)
+        
+        self.invalidate_cache()
+        return result[0]["p"] if result else {}
+    
+    def create_policies(self, policies: list[Policy]) -> int:
+        """
+        Create many policies (and their APPLIES_TO edges) in one query.
+        
+        Args:
+            policies: Policy objects to create
+        
+        Returns:
+            Number of policies written
+        """
+        if not policies:
+            return 0
+        
+        query = """
+        UNWIND $rows AS row
+        MERGE (p:Policy {id: row.id})
+        SET p += row, p.updated_at = datetime()
+        FOREACH (node_type IN row.applies_to_node_types |
+            MERGE (nt:NodeType {name: node_type})
+            MERGE (p)-[:APPLIES_TO]->(nt)
+        )
+        RETURN p.id as id
+        """
+        
+        rows = [self._policy_parameters(policy) for policy in policies]
+        result = self.client.execute_write(query, {"rows": rows})
+        self.invalidate_cache()
+        return len(result)
+    
+    def _policy_parameters(self, policy: Policy) -> dict[str, Any]:
+        """Build the stored property map for a policy."""
         # Serialize conditions and actions to JSON strings
-        import json
-        conditions_json = json.dumps([c.model_dump() for c in policy.conditions])
-        actions_json = json.dumps([a.model_dump() for a in policy.actions])
+        conditions_json = _dumps([c.model_dump() for c in policy.conditions])
+        actions_json = _dumps([a.model_dump() for a in policy.actions])
         
-        parameters = {
+        return {
             "id": policy.id,
             "name": policy.name,
             "description": policy. description,
@@ -105,6 +253,7 @@ class PolicyManager:
             "status": policy.status. value,
             "priority": policy.priority,
             "conditions": conditions_json,
+            "condition_count": len(policy.conditions),
             "actions": actions_json,
             "applies_to_node_types": policy.applies_to_node_types,
             "applies_to_locations": policy. applies_to_locations,
@@ -115,27 +264,6 @@ class PolicyManager:
             "created_by": policy.created_by,
             "tags": policy. tags,
         }
-        
-        result = self.client. execute_write(query, parameters)
-        
-        # Create relationships to node types this policy applies to
-        if policy.applies_to_node_types:
-            for node_type in policy.applies_to_node_types:
-                self._create_applies_to_relationship(policy.id, node_type)
-        
-        return result[0]["p"] if result else {}
-    
-    def _create_applies_to_relationship(self, policy_id: str, node_type: str) -> None:
-        """Create APPLIES_TO relationship between policy and node type."""
-        query = """
-        MATCH (p:Policy {id: $policy_id})
-        MERGE (nt:NodeType {name: $node_type})
-        MERGE (p)-[:APPLIES_TO]->(nt)
-        """
-        self.client.execute_write(query, {
-            "policy_id": policy_id,
-            "node_type": node_type,
-        })
     
     def get_policy(self, policy_id: str) -> Optional[Policy]:
         """
@@ -163,29 +291,77 @@ class PolicyManager:
         """
         Get all policies, optionally filtered by status.
         
+        Results are cached in-process (see invalidate_cache()).
+        
         Args:
             status: Optional status filter
         
         Returns:
             List of Policy objects
         """
+        key = (status.value if status else None, None)
+        return self._cached_policies(key, lambda: self._fetch_all_policies(status))
+    
+    def _fetch_all_policies(self, status: Optional[PolicyStatus] = None) -> list[Policy]:
+        """Query all policies, optionally filtered by status (uncached)."""
         if status:
             query = """
             MATCH (p:Policy {status: $status})
             RETURN p
             ORDER BY p.priority ASC, p.name
             """
-            result = self.client. execute_read(query, {"status": status. value})
+            result = self.client. execute_read_iter(query, {"status": status. value})
         else:
             query = """
             MATCH (p:Policy)
             RETURN p
             ORDER BY p.priority ASC, p.name
             """
-            result = self.client.execute_read(query)
+            result = self.client.execute_read_iter(query)
         
         return [self._policy_from_record(r["p"]) for r in result]
     
+    def get_policy_listing(self, status: Optional[PolicyStatus] = None) -> list[dict[str, Any]]:
+        """
+        Get lightweight policy rows for listings.
+        
+        Only the scalar columns and the condition count are returned, so
+        conditions and actions are not decoded into Policy objects.
+        
+        Args:
+            status: Optional status filter
+        
+        Returns:
+            List of dicts with id, name, policy_type, priority, status
+            and condition_count
+        """
+        query = """
+        MATCH (p:Policy)
+        WHERE $status IS NULL OR p.status = $status
+        RETURN p {
+            .id, .name, .policy_type, .priority, .status, .condition_count,
+            conditions: CASE WHEN p.condition_count IS NULL THEN p.conditions END
+        } as policy
+        ORDER BY p.priority ASC, p.name
+        """
+        
+        result = self.client.execute_read(
+            query, {"status": status.value if status else None}
+        )
+        
+        rows = []
+        for r in result:
+            row = r["policy"]
+            conditions = row.pop("conditions", None)
+            if row.get("condition_count") is None:
+                # Policies written before condition_count was stored
+                try:
+                    row["condition_count"] = len(_loads(conditions or "[]"))
+                except (json.JSONDecodeError, TypeError):
+                    row["condition_count"] = 0
+            rows.append(row)
+        return rows
+    
     def get_policies_by_type(self, policy_type: PolicyType) -> list[Policy]:
         """Get all policies of a specific type."""
         query = """
@@ -197,44 +373,60 @@ class PolicyManager:
         result = self. client.execute_read(query, {"type": policy_type. value})
         return [self._policy_from_record(r["p"]) for r in result]
     
-    def get_policies_for_node_type(self, node_type: str) -> list[Policy]:
-        """Get all policies that apply to a specific node type."""
-        query = """
-        MATCH (p:Policy)
-        WHERE $node_type IN p.applies_to_node_types
-           OR size(p.applies_to_node_types) = 0
-        RETURN p
-        ORDER BY p.priority ASC
+    def get_policies_for_node_type(
+        self,
+        node_type: str,
+        status: Optional[PolicyStatus] = None,
+    ) -> list[Policy]:
         """
+        Get all policies that apply to a specific node type, optionally filtered by status.
         
-        result = self.client.execute_read(query, {"node_type": node_type})
-        return [self._policy_from_record(r["p"]) for r in result]
+        Served from a node type index built over the cached get_all_policies()
+        list, so no query is made once the cache is warm.
+        """
+        policies = self.get_all_policies(status)
+        
+        key = status.value if status else None
+        index = self._node_type_index.get(key)
+        if index is None:
+            index = self._node_type_index[key] = {}
+            for policy in policies:
+                for applies_to in policy.applies_to_node_types or ["*"]:
+                    index.setdefault(applies_to, []).append(policy)
+        
+        # Both buckets keep the (priority, name) order of the cached list
+        return list(heapq.merge(
+            index.get(node_type, []),
+            index.get("*", []),
+            key=lambda p: (p.priority, p.name),
+        ))
     
     def update_policy_status(self, policy_id: str, status: PolicyStatus) -> bool:
         """Update a policy's status."""
         query = """
         MATCH (p:Policy {id: $id})
         SET p.status = $status, p.updated_at = datetime()
-        RETURN p
+        RETURN p.id as id
         """
         
-        result = self.client.execute_write(query, {
+        record = self.client.execute_write_single(query, {
             "id": policy_id,
             "status": status.value,
         })
         
-        return len(result) > 0
+        self.invalidate_cache()
+        return record is not None
     
     def delete_policy(self, policy_id: str) -> bool:
         """Delete a policy."""
         query = """
         MATCH (p:Policy {id: $id})
         DETACH DELETE p
-        RETURN count(p) as deleted
         """
         
-        result = self.client.execute_write(query, {"id": policy_id})
-        return result[0]["deleted"] > 0 if result else False
+        summary = self.client.execute_write_summary(query, {"id": policy_id})
+        self.invalidate_cache()
+        return summary.counters.nodes_deleted > 0
     
     # =========================================================================
     # Compliance Rules Operations
@@ -256,23 +448,49 @@ class PolicyManager:
         RETURN c
         """
         
-        import json
+        parameters = self._compliance_rule_parameters(rule)
+        
+        result = self.client.execute_write(query, parameters)
+        return result[0]["c"] if result else {}
+    
+    def create_compliance_rules(self, rules: list[ComplianceRule]) -> int:
+        """
+        Create many compliance rules in one query.
+        
+        Args:
+            rules: ComplianceRule objects to create
+        
+        Returns:
+            Number of rules written
+        """
+        if not rules:
+            return 0
+        
+        query = """
+        UNWIND $rows AS row
+        MERGE (c:ComplianceRule {id: row.id})
+        SET c += row
+        RETURN c.id as id
+        """
         
-        parameters = {
+        rows = [self._compliance_rule_parameters(rule) for rule in rules]
+        result = self.client.execute_write(query, {"rows": rows})
+        return len(result)
+    
+    def _compliance_rule_parameters(self, rule: ComplianceRule) -> dict[str, Any]:
+        """Build the stored property map for a compliance rule."""
+        return {
             "id": rule.id,
             "name": rule.name,
             "description": rule.description,
             "regulation": rule.regulation,
             "severity": rule. severity,
             "check_type": rule.check_type,
-            "parameters": json.dumps(rule.parameters),
+            "parameters": _dumps(rule.parameters),
             "enforcement": rule. enforcement,
             "created_at": rule.created_at. isoformat(),
             "tags": rule.tags,
         }
-        
-        result = self.client.execute_write(query, parameters)
-        return result[0]["c"] if result else {}
     
     def get_compliance_rules(self, regulation: Optional[str] = None) -> list[ComplianceRule]:
         """Get all compliance rules, optionally filtered by regulation."""
@@ -282,14 +500,14 @@ class PolicyManager:
             RETURN c
             ORDER BY c.severity DESC, c.name
             """
-            result = self.client.execute_read(query, {"regulation": regulation})
+            result = self.client.execute_read_iter(query, {"regulation": regulation})
         else:
             query = """
             MATCH (c:ComplianceRule)
             RETURN c
             ORDER BY c.regulation, c.name
             """
-            result = self.client.execute_read(query)
+            result = self.client.execute_read_iter(query)
         
         return [self._compliance_rule_from_record(r["c"]) for r in result]
     
@@ -301,6 +519,7 @@ class PolicyManager:
         self,
         context: dict[str, Any],
         node_type: Optional[str] = None,
+        collect_diagnostics: bool = True,
     ) -> list[PolicyEvaluationResult]:
         """
         Evaluate all applicable policies against a context.
@@ -308,55 +527,25 @@ class PolicyManager:
         Args:
             context: Dictionary with evaluation context (e.g., anomaly_type, severity, metrics)
             node_type: Optional node type to filter policies
+            collect_diagnostics: Fill conditions_met / conditions_not_met. When
+                False, each policy stops at its first failing condition and
+                both lists are left empty.
         
         Returns:
             List of PolicyEvaluationResult objects
         """
-        # Get applicable policies
-        if node_type:
-            policies = self. get_policies_for_node_type(node_type)
-        else:
-            policies = self.get_all_policies(status=PolicyStatus. ACTIVE)
-        
-        results = []
+        matched = []
+        not_matched = []
         now = datetime.now(timezone.utc)
         
-        for policy in policies:
-            # Check if policy is active at current time
-            if not policy.is_active_at(now):
-                continue
-            
-            # Evaluate conditions
-            conditions_met = []
-            conditions_not_met = []
-            
-            for condition in policy. conditions:
-                if condition.evaluate(context):
-                    conditions_met. append(f"{condition.field} {condition.operator. value} {condition. value}")
-                else:
-                    conditions_not_met. append(f"{condition.field} {condition.operator.value} {condition.value}")
-            
-            # Policy matches if all conditions are met
-            matched = len(conditions_not_met) == 0 and len(policy.conditions) > 0
-            
-            results.append(PolicyEvaluationResult(
-                policy_id=policy.id,
-                policy_name=policy.name,
-                policy_version=policy.version,
-                matched=matched,
-                conditions_met=conditions_met,
-                conditions_not_met=conditions_not_met,
-                recommended_actions=policy.actions if matched else [],
-                metadata={
-                    "priority": policy.priority,
-                    "policy_type": policy. policy_type.value,
-                }
-            ))
-        
-        # Sort by match status and priority
-        results. sort(key=lambda r: (not r.matched, r.metadata. get("priority", 100)))
+        # Status and schedule are filtered in the query. Policies arrive in
+        # priority order, so partitioning by match status keeps each group
+        # sorted by priority without a sort.
+        for policy in self.get_active_policies_at(now, node_type):
+            result = self._evaluate_policy(policy, context, collect_diagnostics)
+            (matched if result.matched else not_matched).append(result)
         
-        return results
+        return matched + not_matched
     
     def get_matching_policies(
         self,
@@ -373,10 +562,129 @@ class PolicyManager:
         Returns:
             List of matching Policy objects
         """
-        results = self.evaluate_policies(context, node_type)
-        matching_ids = [r.policy_id for r in results if r.matched]
+        now = datetime.now(timezone.utc)
+        
+        return [
+            policy for policy in self.get_active_policies_at(now, node_type)
+            if self._policy_matches(policy, context)
+        ]
+    
+    def get_active_policies_at(
+        self,
+        at: datetime,
+        node_type: Optional[str] = None,
+    ) -> list[Policy]:
+        """
+        Get active policies whose schedule includes a given time.
         
-        return [p for p in self. get_all_policies() if p.id in matching_ids]
+        The status, weekday and hour checks of Policy.is_active_at run in
+        Cypher, so only candidate policies are transferred and decoded.
+        Results are cached per (weekday, hour) bucket; when the bucket
+        changes, lists for older buckets are dropped.
+        
+        Args:
+            at: Time to check the policy schedules against
+            node_type: Optional node type the policies must apply to
+        
+        Returns:
+            List of Policy objects ordered by priority
+        """
+        bucket = f"active@{at.weekday()}:{at.hour}"
+        stale = [
+            key for key in self._policy_cache
+            if key[0] and key[0].startswith("active@") and key[0] != bucket
+        ]
+        for key in stale:
+            del self._policy_cache[key]
+        
+        return self._cached_policies(
+            (bucket, node_type),
+            lambda: self._fetch_active_policies_at(at.weekday(), at.hour, node_type),
+        )
+    
+    def _fetch_active_policies_at(
+        self,
+        weekday: int,
+        hour: int,
+        node_type: Optional[str] = None,
+    ) -> list[Policy]:
+        """Query active policies scheduled for a weekday and hour (uncached)."""
+        query = """
+        MATCH (p:Policy {status: $status})
+        WHERE ($node_type IS NULL
+               OR $node_type IN p.applies_to_node_types
+               OR size(p.applies_to_node_types) = 0)
+          AND (p.active_days IS NULL OR $weekday IN p.active_days)
+          AND (p.active_hours_start IS NULL OR p.active_hours_end IS NULL
+               OR (p.active_hours_start <= $hour AND $hour < p.active_hours_end))
+        RETURN p
+        ORDER BY p.priority ASC, p.name
+        """
+        
+        result = self.client.execute_read_iter(query, {
+            "status": PolicyStatus.ACTIVE.value,
+            "node_type": node_type,
+            "weekday": weekday,
+            "hour": hour,
+        })
+        return [self._policy_from_record(r["p"]) for r in result]
+    
+    def _condition_evaluators(self, policy: Policy) -> list[Callable[[dict[str, Any]], bool]]:
+        """Get the compiled condition evaluators for a policy."""
+        evaluators = self._compiled_conditions.get(policy.id)
+        if evaluators is None:
+            evaluators = [condition.compile_evaluator() for condition in policy.conditions]
+        return evaluators
+    
+    def _condition_label_list(self, policy: Policy) -> list[str]:
+        """Get the diagnostic strings for a policy's conditions."""
+        labels = self._condition_labels.get(policy.id)
+        if labels is None:
+            labels = _condition_labels(policy)
+        return labels
+    
+    def _policy_matches(self, policy: Policy, context: dict[str, Any]) -> bool:
+        """Check whether all of a policy's conditions hold, stopping at the first miss."""
+        evaluators = self._condition_evaluators(policy)
+        return bool(evaluators) and all(evaluate(context) for evaluate in evaluators)
+    
+    def _evaluate_policy(
+        self,
+        policy: Policy,
+        context: dict[str, Any],
+        collect_diagnostics: bool = True,
+    ) -> PolicyEvaluationResult:
+        """Evaluate one policy's conditions against a context."""
+        conditions_met = []
+        conditions_not_met = []
+        
+        if collect_diagnostics:
+            evaluators = self._condition_evaluators(policy)
+            labels = self._condition_label_list(policy)
+            for label, evaluate in zip(labels, evaluators):
+                if evaluate(context):
+                    conditions_met.append(label)
+                else:
+                    conditions_not_met.append(label)
+            
+            # Policy matches if all conditions are met
+            matched = len(conditions_not_met) == 0 and len(policy.conditions) > 0
+        else:
+            matched = self._policy_matches(policy, context)
+        
+        return PolicyEvaluationResult(
+            policy_id=policy.id,
+            policy_name=policy.name,
+            policy_version=policy.version,
+            matched=matched,
+            conditions_met=conditions_met,
+            conditions_not_met=conditions_not_met,
+            recommended_actions=policy.actions if matched else [],
+            metadata={
+                "priority": policy.priority,
+                "policy_type": policy. policy_type.value,
+            }
+        )
     
     def get_recommended_actions(
         self,
@@ -393,7 +701,7 @@ class PolicyManager:
         Returns:
             List of PolicyAction objects from matching policies
         """
-        results = self.evaluate_policies(context, node_type)
+        results = self.evaluate_policies(context, node_type, collect_diagnostics=False)
         
         actions = []
         for result in results:
@@ -420,22 +728,14 @@ class PolicyManager:
         if not path.exists():
             raise FileNotFoundError(f"Policy file not found: {file_path}")
         
-        with open(path, "r") as f:
-            data = yaml.safe_load(f)
-        
-        count = 0
-        policies = data.get("policies", [])
+        data = _load_yaml_cached(path)
         
-        for policy_data in policies:
-            policy = self._policy_from_yaml(policy_data)
-            self.create_policy(policy)
-            count += 1
+        policies = [self._policy_from_yaml(p) for p in data.get("policies", [])]
+        count = self.create_policies(policies)
         
         # Load compliance rules if present
-        compliance_rules = data.get("compliance_rules", [])
-        for rule_data in compliance_rules:
-            rule = self._compliance_rule_from_yaml(rule_data)
-            self.create_compliance_rule(rule)
+        rules = [self._compliance_rule_from_yaml(r) for r in data.get("compliance_rules", [])]
+        self.create_compliance_rules(rules)
         
         return count
     
@@ -499,25 +799,40 @@ class PolicyManager:
     # =========================================================================
     
     def _policy_from_record(self, record: dict) -> Policy:
-        """Convert a Neo4j record to Policy object."""
-        import json
+        """
+        Convert a Neo4j record to Policy object.
         
+        Stored policies were validated when written, so the models are built
+        with model_construct (no validation); enum fields are converted here
+        since model_construct does not coerce them.
+        """
         # Parse conditions and actions from JSON
         conditions = []
         try:
-            conditions_data = json.loads(record. get("conditions", "[]"))
-            conditions = [Condition(**c) for c in conditions_data]
+            conditions_data = _loads(record. get("conditions", "[]"))
+            conditions = [
+                Condition.model_construct(
+                    field=c["field"],
+                    operator=ConditionOperator(c["operator"]),
+                    value=c["value"],
+                )
+                for c in conditions_data
+            ]
         except (json.JSONDecodeError, TypeError):
             pass
         
         actions = []
         try:
-            actions_data = json.loads(record.get("actions", "[]"))
-            actions = [PolicyAction(**a) for a in actions_data]
+            actions_data = _loads(record.get("actions", "[]"))
+            # The decoded dicts are not reused, so convert the enum in place
+            # instead of copying each one
+            for a in actions_data:
+                a["action_type"] = ActionType(a["action_type"])
+            actions = [PolicyAction.model_construct(**a) for a in actions_data]
         except (json.JSONDecodeError, TypeError):
             pass
         
-        return Policy(
+        return Policy.model_construct(
             id=record.get("id", ""),
             name=record.get("name", ""),
             description=record.get("description", ""),
@@ -537,11 +852,9 @@ class PolicyManager:
     
     def _compliance_rule_from_record(self, record: dict) -> ComplianceRule:
         """Convert a Neo4j record to ComplianceRule object."""
-        import json
-        
         parameters = {}
         try:
-            parameters = json.loads(record.get("parameters", "{}"))
+            parameters = _loads(record.get("parameters", "{}"))
         except (json.JSONDecodeError, TypeError):
             pass
         
@@ -558,22 +871,31 @@ class PolicyManager:
         )
     
     def get_policy_summary(self) -> dict[str, Any]:
-        """Get summary of policies in the database."""
+        """
+        Get summary of policies in the database.
+        
+        Policies are counted per (status, policy_type) group and the totals
+        are folded together in Python, avoiding a DISTINCT collect over
+        every policy on the server.
+        """
         query = """
         MATCH (p:Policy)
-        RETURN count(p) as total,
-               count(CASE WHEN p.status = 'active' THEN 1 END) as active,
-               collect(DISTINCT p. policy_type) as types
+        RETURN p.status as status, p.policy_type as policy_type, count(*) as count
         """
         
-        result = self. client.execute_read(query)
-        
-        if not result:
-            return {"total": 0, "active": 0, "types": []}
+        total = 0
+        active = 0
+        types: list[str] = []
+        for row in self.client.execute_read(query):
+            count = row["count"]
+            total += count
+            if row["status"] == PolicyStatus.ACTIVE.value:
+                active += count
+            if row["policy_type"] not in types:
+                types.append(row["policy_type"])
         
-        r = result[0]
         return {
-            "total": r["total"],
-            "active": r["active"],
-            "types": r["types"],
+            "total": total,
+            "active": active,
+            "types": types,
         }
\ No newline at end of file
@@ -4,12 +4,342 @@ Topology Manager
 Manages network topology in Neo4j knowledge graph.
 """
 
-from typing import Any, Optional
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterator, Optional
 from datetime import datetime
+import json
+import time
 
-from src.knowledge_graph. client import Neo4jClient
+from src.knowledge_graph._json import dumps as _dumps, loads as _loads
+from src.knowledge_graph. client import AsyncNeo4jClient, Neo4jClient
 from src.models.network import Node, Link, NetworkTopology, NodeType, NodeStatus
-from src. simulator.network_sim import NetworkSimulator
+
+# Only needed for annotations; importing the simulator pulls in Faker
+if TYPE_CHECKING:
+    from src.simulator.network_sim import NetworkSimulator
+
+
+# Enum lookups by stored value for _node_from_record (dict hit instead of Enum.__call__)
+_NODE_TYPE_BY_VALUE = {m.value: m for m in NodeType}
+_NODE_STATUS_BY_VALUE = {m.value: m for m in NodeStatus}
+
+
+def _metadata_from_property(value: Optional[str]) -> dict[str, Any]:
+    """Parse a stored metadata property; unparseable legacy values give {}."""
+    if not value:
+        return {}
+    try:
+        metadata = _loads(value)
+    except json.JSONDecodeError:
+        # Nodes written before metadata was stored as JSON hold str(dict)
+        return {}
+    return metadata if isinstance(metadata, dict) else {}
+
+
+# =============================================================================
+# Read queries
+# =============================================================================
+
+# Upper bound for variable-length path expansion in find_path and
+# get_node_dependencies
+_MAX_PATH_HOPS = 15
+
+# Dependency depth used when the caller does not give one
+_DEFAULT_DEPENDENCY_DEPTH = 10
+
+_Q_GET_NODE = """
+MATCH (n:NetworkNode {id: $id})
+RETURN n {.*} as node
+"""
+
+_Q_GET_ALL_NODES = """
+MATCH (n:NetworkNode)
+RETURN n {.*} as node
+ORDER BY n.type, n.name
+"""
+
+_Q_ITER_NODES = """
+MATCH (n:NetworkNode)
+RETURN n {.*} as node
+ORDER BY n.type, n.name
+SKIP $skip LIMIT $limit
+"""
+
+_Q_GET_NODES_BY_TYPE = """
+MATCH (n:NetworkNode {type: $type})
+RETURN n {.*} as node
+ORDER BY n.name
+"""
+
+_Q_GET_NODES_BY_STATUS = """
+MATCH (n:NetworkNode {status: $status})
+RETURN n {.*} as node
+ORDER BY n.name
+"""
+
+_Q_GET_NODES_BY_LOCATION = """
+MATCH (n:NetworkNode)
+WHERE n.location CONTAINS $location
+RETURN n {.*} as node
+ORDER BY n.name
+"""
+
+_Q_GET_LINK = """
+MATCH (source:NetworkNode {id: $source_id})-[r:CONNECTS_TO]->(target:NetworkNode {id: $target_id})
+RETURN r {.*} as link, source.id as source_id, target.id as target_id
+"""
+
+_Q_GET_ALL_LINKS = """
+MATCH (source:NetworkNode)-[r:CONNECTS_TO]->(target:NetworkNode)
+RETURN r {.*} as link, source.id as source_id, target.id as target_id
+"""
+
+_Q_GET_CONNECTED_NODES = """
+MATCH (n:NetworkNode {id: $id})-[:CONNECTS_TO]-(connected:NetworkNode)
+RETURN DISTINCT connected {.*} as node
+"""
+
+_Q_GET_NODE_WITH_NEIGHBORS = """
+MATCH (n:NetworkNode {id: $id})
+OPTIONAL MATCH (n)-[:CONNECTS_TO]-(connected:NetworkNode)
+WITH n, collect(DISTINCT connected {.*}) as connected
+RETURN n {.*} as node, connected
+"""
+
+_Q_GET_UPSTREAM_NODES = """
+MATCH (upstream:NetworkNode)-[:CONNECTS_TO]->(n:NetworkNode {id: $id})
+RETURN upstream {.*} as node
+"""
+
+_Q_GET_DOWNSTREAM_NODES = """
+MATCH (n:NetworkNode {id: $id})-[:CONNECTS_TO]->(downstream:NetworkNode)
+RETURN downstream {.*} as node
+"""
+
+# Keyed by depth: Neo4j only prunes the expansion when the bound is part of
+# the pattern, and a bound cannot be a parameter
+_Q_GET_NODE_DEPENDENCIES = {
+    depth: f"""
+MATCH (n:NetworkNode {{id: $id}})<-[:CONNECTS_TO*1..{depth}]-(dependent:NetworkNode)
+WHERE dependent <> n
+RETURN DISTINCT dependent {{.*}} as node
+"""
+    for depth in range(1, _MAX_PATH_HOPS + 1)
+}
+
+# Dependents of `n` up to the default get_node_dependencies depth
+_DEPENDENCIES_SUBQUERY = f"""CALL {{
+    WITH n
+    OPTIONAL MATCH (n)<-[:CONNECTS_TO*1..{_DEFAULT_DEPENDENCY_DEPTH}]-(dependent:NetworkNode)
+    WHERE dependent <> n
+    RETURN collect(DISTINCT dependent {{.*}}) as dependencies
+}}"""
+
+_Q_GET_NODE_NEIGHBORHOOD = f"""
+MATCH (n:NetworkNode {{id: $id}})
+CALL {{
+    WITH n
+    OPTIONAL MATCH (n)<-[:CONNECTS_TO]-(upstream:NetworkNode)
+    RETURN collect(DISTINCT upstream {{.*}}) as upstream
+}}
+CALL {{
+    WITH n
+    OPTIONAL MATCH (n)-[:CONNECTS_TO]->(downstream:NetworkNode)
+    RETURN collect(DISTINCT downstream {{.*}}) as downstream
+}}
+{_DEPENDENCIES_SUBQUERY}
+RETURN n {{.*}} as node, upstream, downstream, dependencies
+"""
+
+# Just the node and its dependents, for callers that need no adjacent nodes
+_Q_GET_NODE_WITH_DEPENDENCIES = f"""
+MATCH (n:NetworkNode {{id: $id}})
+{_DEPENDENCIES_SUBQUERY}
+RETURN n {{.*}} as node, dependencies
+"""
+
+# n.degree is maintained by the link writes and delete_node (see refresh_degrees()).
+# The type and degree filters are separate UNION branches so each can use its index.
+_Q_GET_CRITICAL_NODES = """
+CALL {
+    MATCH (n:NetworkNode) WHERE n.type IN $critical_types RETURN n
+    UNION
+    MATCH (n:NetworkNode) WHERE n.degree > $min_degree RETURN n
+}
+RETURN n {.*} as node
+ORDER BY n.degree DESC
+LIMIT $limit
+"""
+
+# Independent subqueries: the counts come from the count store and the
+# distinct values from the type/location indexes, not from every node
+_Q_GET_TOPOLOGY_SUMMARY = """
+CALL { MATCH (n:NetworkNode) RETURN count(n) as nodeCount }
+CALL { MATCH ()-[r:CONNECTS_TO]->() RETURN count(r) as linkCount }
+CALL {
+    MATCH (n:NetworkNode) WHERE n.type IS NOT NULL
+    WITH DISTINCT n.type as type
+    RETURN collect(type) as types
+}
+CALL {
+    MATCH (n:NetworkNode) WHERE n.location IS NOT NULL
+    WITH DISTINCT n.location as location
+    RETURN collect(location) as locations
+}
+RETURN nodeCount, linkCount, types, locations
+"""
+
+_Q_GET_NODES_GROUPED_BY_TYPE = """
+MATCH (n:NetworkNode)
+WITH n ORDER BY n.name
+RETURN n.type as type, collect(n {.id, .name, .status}) as nodes
+ORDER BY type
+"""
+
+_Q_GET_TOPOLOGY_BUNDLE = """
+MATCH (n:NetworkNode)
+WITH n ORDER BY n.type, n.name
+WITH collect(n {.*}) as nodes
+OPTIONAL MATCH (source:NetworkNode)-[r:CONNECTS_TO]->(target:NetworkNode)
+RETURN nodes,
+       collect(CASE WHEN r IS NOT NULL
+                    THEN {link: r {.*}, source_id: source.id, target_id: target.id}
+               END) as links
+"""
+
+
+# =============================================================================
+# Write queries
+# =============================================================================
+
+_Q_CREATE_NODE = """
+MERGE (n:NetworkNode {id: $id})
+SET n.name = $name,
+    n.type = $type,
+    n.ip_address = $ip_address,
+    n.location = $location,
+    n.status = $status,
+    n.vendor = $vendor,
+    n.model = $model,
+    n.interfaces = $interfaces,
+    n.metadata = $metadata,
+    n.created_at = $created_at,
+    n.degree = coalesce(n.degree, size([(n)-[:CONNECTS_TO]-() | 1])),
+    n.updated_at = datetime()
+RETURN n {.*} as node
+"""
+
+_Q_UPDATE_NODE_STATUS = """
+MATCH (n:NetworkNode {id: $id})
+SET n.status = $status, n.updated_at = datetime()
+"""
+
+_Q_DELETE_NODE = """
+MATCH (n:NetworkNode {id: $id})
+OPTIONAL MATCH (n)-[:CONNECTS_TO]-(neighbor:NetworkNode)
+WHERE neighbor <> n
+SET neighbor.degree = neighbor.degree - 1
+WITH DISTINCT n
+DETACH DELETE n
+"""
+
+_Q_CREATE_LINK = """
+MATCH (source:NetworkNode {id: $source_id})
+MATCH (target:NetworkNode {id: $target_id})
+MERGE (source)-[r:CONNECTS_TO {id: $id}]->(target)
+ON CREATE SET source.degree = coalesce(source.degree + 1, size([(source)-[:CONNECTS_TO]-() | 1])),
+              target.degree = coalesce(target.degree + 1, size([(target)-[:CONNECTS_TO]-() | 1]))
+SET r.source_interface = $source_interface,
+    r.target_interface = $target_interface,
+    r.bandwidth_mbps = $bandwidth_mbps,
+    r.latency_ms = $latency_ms,
+    r.status = $status,
+    r.created_at = datetime()
+RETURN r {.*} as link, source.id as source_id, target.id as target_id
+"""
+
+_Q_UPDATE_LINK_STATUS = """
+MATCH (source:NetworkNode {id: $source_id})-[r:CONNECTS_TO]->(target:NetworkNode {id: $target_id})
+SET r.status = $status
+"""
+
+# Per-row bodies for _write_batches; `row` is bound by its UNWIND
+_Q_BULK_NODE_ROW = """
+MERGE (n:NetworkNode {id: row.id})
+SET n += row.props, n.degree = coalesce(n.degree, size([(n)-[:CONNECTS_TO]-() | 1])), n.updated_at = datetime()
+RETURN count(n) as count
+"""
+
+_Q_BULK_LINK_ROW = """
+MATCH (source:NetworkNode {id: row.source_id})
+MATCH (target:NetworkNode {id: row.target_id})
+MERGE (source)-[r:CONNECTS_TO {id: row.id}]->(target)
+ON CREATE SET source.degree = coalesce(source.degree + 1, size([(source)-[:CONNECTS_TO]-() | 1])),
+              target.degree = coalesce(target.degree + 1, size([(target)-[:CONNECTS_TO]-() | 1]))
+SET r += row.props, r.created_at = datetime()
+RETURN count(r) as count
+"""
+
+_Q_REFRESH_DEGREES = """
+MATCH (n:NetworkNode)
+SET n.degree = size([(n)-[:CONNECTS_TO]-() | 1])
+RETURN count(n) as count
+"""
+
+_Q_FILL_MISSING_DEGREES = """
+MATCH (n:NetworkNode) WHERE n.degree IS NULL
+SET n.degree = size([(n)-[:CONNECTS_TO]-() | 1])
+RETURN count(n) as count
+"""
+
+
+class _ReadCache:
+    """LRU cache whose entries also expire after a fixed time-to-live."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+
+    def get_or_load(self, key: tuple, loader: Callable[[], Any]) -> Any:
+        """Return the cached value for key, calling loader on a miss or expiry."""
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        value = loader()
+        self._entries[key] = (now + self.ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# The expansion bound is fixed so every call shares one query plan; the
+# caller's limit is applied to the (shortest) path found. The limit is a
+# separate WITH ... WHERE: a predicate attached to shortestPath() that the
+# shortest path fails makes Neo4j fall back to an exhaustive path search.
+_Q_FIND_PATH = f"""
+MATCH path = shortestPath(
+    (source:NetworkNode {{id: $source_id}})-[:CONNECTS_TO*1..{_MAX_PATH_HOPS}]-(target:NetworkNode {{id: $target_id}})
+)
+WITH path
+WHERE length(path) <= $max_hops
+RETURN [n IN nodes(path) | n {{.*}}] as nodes
+"""
 
 
 class TopologyManager:
@@ -31,20 +361,74 @@ class TopologyManager:
         >>> neighbors = topo_mgr.get_connected_nodes("router_core_01")
     """
 
-    def __init__(self, client: Neo4jClient):
+    # Upper bound for variable-length path expansion in find_path
+    MAX_PATH_HOPS = _MAX_PATH_HOPS
+
+    # Read cache size and entry lifetime (seconds); entries also expire so
+    # changes made outside this manager are picked up
+    CACHE_SIZE = 4096
+    CACHE_TTL = 30.0
+
+    # Rows sent per UNWIND query by bulk_create_nodes / bulk_create_links
+    IMPORT_BATCH_SIZE = 1000
+
+    # First server version supporting CALL { ... } IN CONCURRENT TRANSACTIONS
+    CONCURRENT_IMPORT_MIN_VERSION = (5, 21)
+
+    # Node types that are always treated as critical
+    CRITICAL_NODE_TYPES = ["router_core", "switch_distribution", "firewall", "load_balancer"]
+
+    def __init__(
+        self,
+        client: Neo4jClient,
+        batch_size: int = IMPORT_BATCH_SIZE,
+        concurrency: Optional[int] = None,
+    ):
         """
         Initialize TopologyManager.
 
+        On Neo4j 5.21+ bulk node imports run as CALL { ... } IN CONCURRENT
+        TRANSACTIONS, so the server commits batch_size rows per inner
+        transaction on several threads. Link imports use plain IN
+        TRANSACTIONS there, since every link also locks both endpoints to
+        update their degree. Older servers get one UNWIND query per batch.
+
         Args:
             client: Neo4jClient instance
+            batch_size: Rows per import transaction
+            concurrency: Concurrent import transactions (default: chosen by the server)
         """
         self.client = client
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+
+        # Per-instance read cache, cleared by clear_cache() and on every write
+        self._read_cache = _ReadCache(self.CACHE_SIZE, self.CACHE_TTL)
+
+    def clear_cache(self) -> None:
+        """Drop cached read results."""
+        self._read_cache.clear()
+
+    def cache_stats(self) -> dict[str, Any]:
+        """
+        Get read cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, size, maxsize and ttl
+        """
+        return {
+            "hits": self._read_cache.hits,
+            "misses": self._read_cache.misses,
+            "size": len(self._read_cache),
+            "maxsize": self._read_cache.maxsize,
+            "ttl": self._read_cache.ttl,
+        }
 
     # =========================================================================
     # Import Operations
     # =========================================================================
 
-    def import_from_simulator(self, simulator: NetworkSimulator) -> dict[str, int]:
+    def import_from_simulator(self, simulator: "NetworkSimulator") -> dict[str, int]:
         """
         Import network topology from simulator into Neo4j.
 
@@ -57,21 +441,107 @@ class TopologyManager:
         if simulator.topology is None:
             return {"nodes": 0, "links": 0}
 
-        nodes_imported = 0
-        links_imported = 0
-
-        # Import nodes
-        for node in simulator. get_all_nodes():
-            self. create_node(node)
-            nodes_imported += 1
+        # The MERGEs below need the ID constraint to avoid label scans
+        self.ensure_schema()
 
-        # Import links
-        for link in simulator.topology.links:
-            self. create_link(link)
-            links_imported += 1
+        # Nodes first, so the link batches can match both endpoints
+        nodes_imported = self.bulk_create_nodes(simulator.get_all_nodes())
+        links_imported = self.bulk_create_links(simulator.topology.links)
 
         return {"nodes": nodes_imported, "links": links_imported}
 
+    def ensure_schema(self) -> None:
+        """
+        Make sure the topology indexes and constraints exist, and give nodes
+        written before degrees were stored their degree.
+
+        Idempotent; the schema statements run at most once per client.
+        """
+        self.client.ensure_indexes()
+        self.refresh_degrees(missing_only=True)
+
+    def bulk_create_nodes(self, nodes: list[Node]) -> int:
+        """
+        Create or update many network nodes with one UNWIND query per batch.
+
+        Args:
+            nodes: Node objects to write
+
+        Returns:
+            Number of nodes written
+        """
+        rows = [{"id": node.id, "props": self._node_properties(node)} for node in nodes]
+        return self._write_batches(_Q_BULK_NODE_ROW, rows)
+
+    def bulk_create_links(self, links: list[Link]) -> int:
+        """
+        Create or update many links with one UNWIND query per batch.
+
+        Links whose source or target node does not exist are skipped.
+
+        Args:
+            links: Link objects to write
+
+        Returns:
+            Number of links written
+        """
+        rows = [
+            {
+                "id": link.id,
+                "source_id": link.source_node_id,
+                "target_id": link.target_node_id,
+                "props": self._link_properties(link),
+            }
+            for link in links
+        ]
+        # Links share a few hub endpoints, so concurrent batches would
+        # deadlock on their degree updates
+        return self._write_batches(_Q_BULK_LINK_ROW, rows, concurrent=False)
+
+    def _write_batches(self, body: str, rows: list[dict[str, Any]], concurrent: bool = True) -> int:
+        """
+        Apply a per-row write to every row in batches.
+
+        Args:
+            body: Cypher run for each `row`, returning a `count` column
+            rows: Row parameter maps
+            concurrent: Commit the batches on several server threads
+
+        Returns:
+            Sum of the counts returned for all rows
+        """
+        if not rows:
+            return 0
+
+        written = 0
+        if self.client.get_server_version() >= self.CONCURRENT_IMPORT_MIN_VERSION:
+            # CALL ... IN TRANSACTIONS has to run in an auto-commit transaction
+            if not concurrent:
+                mode = ""
+            elif self.concurrency:
+                mode = f"{int(self.concurrency)} CONCURRENT "
+            else:
+                mode = "CONCURRENT "
+            query = f"""
+            UNWIND $rows AS row
+            CALL {{
+                WITH row
+                {body}
+            }} IN {mode}TRANSACTIONS OF {int(self.batch_size)} ROWS
+            RETURN sum(count) as count
+            """
+            result = self.client.execute_query(query, {"rows": rows})
+            written = result[0]["count"] if result else 0
+        else:
+            query = "UNWIND $rows AS row" + body
+            for start in range(0, len(rows), self.batch_size):
+                batch = rows[start:start + self.batch_size]
+                record = self.client.execute_write_single(query, {"rows": batch})
+                written += record["count"] if record else 0
+
+        self.clear_cache()
+        return written
+
     # =========================================================================
     # Node Operations
     # =========================================================================
@@ -86,55 +556,33 @@ class TopologyManager:
         Returns:
             Created node properties
         """
-        query = """
-        MERGE (n:NetworkNode {id: $id})
-        SET n. name = $name,
-            n.type = $type,
-            n.ip_address = $ip_address,
-            n.location = $location,
-            n.status = $status,
-            n.vendor = $vendor,
-            n.model = $model,
-            n.interfaces = $interfaces,
-            n.metadata = $metadata,
-            n.created_at = $created_at,
-            n.updated_at = datetime()
-        RETURN n {.*} as node
-        """
-
-        parameters = {
-            "id": node.id,
-            "name": node.name,
-            "type": node.type.value,
-            "ip_address": node.ip_address,
-            "location": node. location,
-            "status": node.status.value,
-            "vendor": node. vendor,
-            "model": node.model,
-            "interfaces": node.interfaces,
-            "metadata": str(node.metadata),
-            "created_at": node.created_at. isoformat(),
-        }
+        parameters = {"id": node.id, **self._node_properties(node)}
 
-        result = self.client.execute_write(query, parameters)
+        result = self.client.execute_write(_Q_CREATE_NODE, parameters)
+        self.clear_cache()
         return result[0]["node"] if result else {}
 
     def get_node(self, node_id: str) -> Optional[Node]:
         """
         Get a node by ID.
 
+        Results are cached per manager for CACHE_TTL seconds or until the
+        next write or clear_cache(); the returned Node is shared between
+        callers and must not be mutated.
+
         Args:
             node_id: Node ID
 
         Returns:
             Node object or None if not found
         """
-        query = """
-        MATCH (n:NetworkNode {id: $id})
-        RETURN n {.*} as node
-        """
+        return self._read_cache.get_or_load(
+            ("node", node_id), lambda: self._fetch_node(node_id)
+        )
 
-        result = self.client. execute_read(query, {"id": node_id})
+    def _fetch_node(self, node_id: str) -> Optional[Node]:
+        """Query a node by ID (uncached)."""
+        result = self.client. execute_read(_Q_GET_NODE, {"id": node_id})
 
         if not result:
             return None
@@ -143,47 +591,55 @@ class TopologyManager:
 
     def get_all_nodes(self) -> list[Node]:
         """Get all network nodes."""
-        query = """
-        MATCH (n:NetworkNode)
-        RETURN n {.*} as node
-        ORDER BY n.type, n.name
+        return list(self.iter_all_nodes())
+
+    def iter_all_nodes(self) -> Iterator[Node]:
         """
+        Iterate over all network nodes as the driver streams them.
 
-        result = self. client.execute_read(query)
-        return [self._node_from_record(r["node"]) for r in result]
+        Each record is converted as it arrives, so callers that consume the
+        nodes once never hold the whole result set.
 
-    def get_nodes_by_type(self, node_type: NodeType) -> list[Node]:
-        """Get all nodes of a specific type."""
-        query = """
-        MATCH (n:NetworkNode {type: $type})
-        RETURN n {.*} as node
-        ORDER BY n.name
+        Yields:
+            Node objects ordered by type and name
         """
+        for r in self.client.execute_read_iter(_Q_GET_ALL_NODES):
+            yield self._node_from_record(r["node"])
 
-        result = self.client. execute_read(query, {"type": node_type.value})
-        return [self._node_from_record(r["node"]) for r in result]
+    def iter_nodes(self, page: int = 0, size: int = 500) -> Iterator[Node]:
+        """
+        Iterate over one page of network nodes.
 
-    def get_nodes_by_status(self, status: NodeStatus) -> list[Node]:
-        """Get all nodes with a specific status."""
-        query = """
-        MATCH (n:NetworkNode {status: $status})
-        RETURN n {.*} as node
-        ORDER BY n. name
+        Args:
+            page: Zero-based page number
+            size: Nodes per page
+
+        Yields:
+            Node objects ordered by type and name
         """
+        result = self.client.execute_read(_Q_ITER_NODES, {"skip": page * size, "limit": size})
+        for r in result:
+            yield self._node_from_record(r["node"])
+
+    def get_nodes_by_type(self, node_type: NodeType) -> list[Node]:
+        """Get all nodes of a specific type (cached, see get_node())."""
+        return list(self._read_cache.get_or_load(
+            ("nodes_by_type", node_type.value), lambda: self._fetch_nodes_by_type(node_type)
+        ))
+
+    def _fetch_nodes_by_type(self, node_type: NodeType) -> tuple[Node, ...]:
+        """Query all nodes of a specific type (uncached)."""
+        result = self.client. execute_read(_Q_GET_NODES_BY_TYPE, {"type": node_type.value})
+        return tuple(self._node_from_record(r["node"]) for r in result)
 
-        result = self.client.execute_read(query, {"status": status. value})
+    def get_nodes_by_status(self, status: NodeStatus) -> list[Node]:
+        """Get all nodes with a specific status."""
+        result = self.client.execute_read(_Q_GET_NODES_BY_STATUS, {"status": status. value})
         return [self._node_from_record(r["node"]) for r in result]
 
     def get_nodes_by_location(self, location: str) -> list[Node]:
         """Get all nodes in a specific location."""
-        query = """
-        MATCH (n:NetworkNode)
-        WHERE n. location CONTAINS $location
-        RETURN n {.*} as node
-        ORDER BY n.name
-        """
-
-        result = self.client.execute_read(query, {"location": location})
+        result = self.client.execute_read(_Q_GET_NODES_BY_LOCATION, {"location": location})
         return [self._node_from_record(r["node"]) for r in result]
 
     def update_node_status(self, node_id: str, status: NodeStatus) -> bool:
@@ -197,29 +653,37 @@ class TopologyManager:
         Returns:
             True if updated, False if node not found
         """
-        query = """
-        MATCH (n:NetworkNode {id: $id})
-        SET n. status = $status, n.updated_at = datetime()
-        RETURN n {.*} as node
-        """
-
-        result = self.client. execute_write(query, {
+        summary = self.client.execute_write_summary(_Q_UPDATE_NODE_STATUS, {
             "id": node_id,
             "status": status.value,
         })
 
-        return len(result) > 0
+        self.clear_cache()
+        return summary.counters.properties_set > 0
 
     def delete_node(self, node_id: str) -> bool:
         """Delete a node and its relationships."""
-        query = """
-        MATCH (n:NetworkNode {id: $id})
-        DETACH DELETE n
-        RETURN count(n) as deleted
+        summary = self.client.execute_write_summary(_Q_DELETE_NODE, {"id": node_id})
+        self.clear_cache()
+        return summary.counters.nodes_deleted > 0
+
+    def refresh_degrees(self, missing_only: bool = False) -> int:
         """
+        Recompute every node's stored degree from its CONNECTS_TO links.
+
+        Link writes and delete_node keep n.degree current; this is only
+        needed for data written by older versions or outside this manager.
+
+        Args:
+            missing_only: Only fill in nodes that have no stored degree
 
-        result = self.client.execute_write(query, {"id": node_id})
-        return result[0]["deleted"] > 0 if result else False
+        Returns:
+            Number of nodes updated
+        """
+        query = _Q_FILL_MISSING_DEGREES if missing_only else _Q_REFRESH_DEGREES
+        record = self.client.execute_write_single(query)
+        self.clear_cache()
+        return record["count"] if record else 0
 
     # =========================================================================
     # Link Operations
@@ -235,41 +699,20 @@ class TopologyManager:
         Returns:
             Created relationship properties
         """
-        query = """
-        MATCH (source:NetworkNode {id: $source_id})
-        MATCH (target:NetworkNode {id: $target_id})
-        MERGE (source)-[r:CONNECTS_TO {id: $id}]->(target)
-        SET r.source_interface = $source_interface,
-            r. target_interface = $target_interface,
-            r.bandwidth_mbps = $bandwidth_mbps,
-            r.latency_ms = $latency_ms,
-            r.status = $status,
-            r.created_at = datetime()
-        RETURN r {.*} as link, source. id as source_id, target.id as target_id
-        """
-
         parameters = {
             "id": link.id,
             "source_id": link.source_node_id,
             "target_id": link.target_node_id,
-            "source_interface": link. source_interface,
-            "target_interface": link.target_interface,
-            "bandwidth_mbps": link.bandwidth_mbps,
-            "latency_ms": link.latency_ms,
-            "status": link.status,
+            **self._link_properties(link),
         }
 
-        result = self.client.execute_write(query, parameters)
+        result = self.client.execute_write(_Q_CREATE_LINK, parameters)
+        self.clear_cache()
         return result[0]["link"] if result else {}
 
     def get_link(self, source_id: str, target_id: str) -> Optional[Link]:
         """Get a link between two nodes."""
-        query = """
-        MATCH (source:NetworkNode {id: $source_id})-[r:CONNECTS_TO]->(target:NetworkNode {id: $target_id})
-        RETURN r {.*} as link, source.id as source_id, target. id as target_id
-        """
-
-        result = self.client.execute_read(query, {
+        result = self.client.execute_read(_Q_GET_LINK, {
             "source_id": source_id,
             "target_id": target_id,
         })
@@ -281,68 +724,78 @@ class TopologyManager:
 
     def get_all_links(self) -> list[Link]:
         """Get all links in the topology."""
-        query = """
-        MATCH (source:NetworkNode)-[r:CONNECTS_TO]->(target:NetworkNode)
-        RETURN r {.*} as link, source.id as source_id, target.id as target_id
-        """
+        return list(self.iter_all_links())
 
-        result = self.client. execute_read(query)
-        return [self._link_from_record(r) for r in result]
+    def iter_all_links(self) -> Iterator[Link]:
+        """Iterate over all links as the driver streams them (see iter_all_nodes())."""
+        for r in self.client.execute_read_iter(_Q_GET_ALL_LINKS):
+            yield self._link_from_record(r)
 
     def update_link_status(self, source_id: str, target_id: str, status: str) -> bool:
         """Update link status (up/down)."""
-        query = """
-        MATCH (source:NetworkNode {id: $source_id})-[r:CONNECTS_TO]->(target:NetworkNode {id: $target_id})
-        SET r.status = $status
-        RETURN r {.*} as link
-        """
-
-        result = self. client.execute_write(query, {
+        summary = self.client.execute_write_summary(_Q_UPDATE_LINK_STATUS, {
             "source_id": source_id,
             "target_id": target_id,
             "status": status,
         })
 
-        return len(result) > 0
+        self.clear_cache()
+        return summary.counters.properties_set > 0
 
     # =========================================================================
     # Graph Queries
     # =========================================================================
 
     def get_connected_nodes(self, node_id: str) -> list[Node]:
-        """Get all nodes directly connected to a node."""
-        query = """
-        MATCH (n:NetworkNode {id: $id})-[:CONNECTS_TO]-(connected:NetworkNode)
-        RETURN DISTINCT connected {.*} as node
+        """Get all nodes directly connected to a node (cached, see get_node())."""
+        return list(self._read_cache.get_or_load(
+            ("connected", node_id), lambda: self._fetch_connected_nodes(node_id)
+        ))
+
+    def _fetch_connected_nodes(self, node_id: str) -> tuple[Node, ...]:
+        """Query all nodes directly connected to a node (uncached)."""
+        result = self.client. execute_read(_Q_GET_CONNECTED_NODES, {"id": node_id})
+        return tuple(self._node_from_record(r["node"]) for r in result)
+
+    def get_node_with_neighbors(self, node_id: str) -> tuple[Optional[Node], list[Node]]:
         """
+        Get a node and its directly connected nodes in one query.
 
-        result = self.client. execute_read(query, {"id": node_id})
-        return [self._node_from_record(r["node"]) for r in result]
+        Args:
+            node_id: Node ID
 
-    def get_upstream_nodes(self, node_id: str) -> list[Node]:
-        """Get nodes that connect TO this node (upstream)."""
-        query = """
-        MATCH (upstream:NetworkNode)-[:CONNECTS_TO]->(n:NetworkNode {id: $id})
-        RETURN upstream {.*} as node
+        Returns:
+            Tuple of (node, connected nodes); node is None if not found
         """
+        result = self.client.execute_read(_Q_GET_NODE_WITH_NEIGHBORS, {"id": node_id})
 
-        result = self.client.execute_read(query, {"id": node_id})
+        if not result:
+            return None, []
+
+        record = result[0]
+        return (
+            self._node_from_record(record["node"]),
+            [self._node_from_record(c) for c in record["connected"]],
+        )
+
+    def get_upstream_nodes(self, node_id: str) -> list[Node]:
+        """Get nodes that connect TO this node (upstream)."""
+        result = self.client.execute_read(_Q_GET_UPSTREAM_NODES, {"id": node_id})
         return [self._node_from_record(r["node"]) for r in result]
 
     def get_downstream_nodes(self, node_id: str) -> list[Node]:
         """Get nodes that this node connects to (downstream)."""
-        query = """
-        MATCH (n:NetworkNode {id: $id})-[:CONNECTS_TO]->(downstream:NetworkNode)
-        RETURN downstream {.*} as node
-        """
-
-        result = self.client.execute_read(query, {"id": node_id})
+        result = self.client.execute_read(_Q_GET_DOWNSTREAM_NODES, {"id": node_id})
         return [self._node_from_record(r["node"]) for r in result]
 
     def find_path(self, source_id: str, target_id: str, max_hops: int = 10) -> list[Node]:
         """
         Find shortest path between two nodes.
 
+        The whole path, including every hop's properties, comes back from a
+        single query. max_hops is clamped to 1..MAX_PATH_HOPS. Results are
+        cached (see get_node()).
+
         Args:
             source_id: Starting node ID
             target_id: Ending node ID
@@ -351,72 +804,193 @@ class TopologyManager:
         Returns:
             List of nodes in the path
         """
-        query = f"""
-        MATCH path = shortestPath(
-            (source:NetworkNode {{id: $source_id}})-[:CONNECTS_TO*1..{max_hops}]-(target:NetworkNode {{id: $target_id}})
-        )
-        RETURN [n IN nodes(path) | n {{.*}}] as nodes
-        """
-
-        result = self.client.execute_read(query, {
+        max_hops = max(1, min(int(max_hops), self.MAX_PATH_HOPS))
+        return list(self._read_cache.get_or_load(
+            ("path", source_id, target_id, max_hops),
+            lambda: self._fetch_path(source_id, target_id, max_hops),
+        ))
+
+    def _fetch_path(self, source_id: str, target_id: str, max_hops: int) -> tuple[Node, ...]:
+        """Query the shortest path between two nodes (uncached)."""
+        result = self.client.execute_read(_Q_FIND_PATH, {
             "source_id": source_id,
             "target_id": target_id,
+            "max_hops": max_hops,
         })
 
         if not result:
-            return []
+            return ()
 
-        return [self._node_from_record(n) for n in result[0]["nodes"]]
+        return tuple(self._node_from_record(n) for n in result[0]["nodes"])
 
-    def get_node_dependencies(self, node_id: str) -> list[Node]:
+    def get_node_dependencies(
+        self, node_id: str, max_depth: int = _DEFAULT_DEPENDENCY_DEPTH
+    ) -> list[Node]:
         """
         Get all nodes that depend on a given node (downstream impact).
 
         Useful for impact analysis - if this node fails, what else is affected?
+        The traversal is bounded so meshed topologies cannot blow it up;
+        max_depth is clamped to 1..MAX_PATH_HOPS.
+
+        Args:
+            node_id: Node ID
+            max_depth: Maximum number of links between the node and a dependent
+
+        Returns:
+            Dependent nodes, excluding the node itself
         """
-        query = """
-        MATCH (n:NetworkNode {id: $id})<-[:CONNECTS_TO*]-(dependent:NetworkNode)
-        RETURN DISTINCT dependent {.*} as node
+        max_depth = max(1, min(int(max_depth), self.MAX_PATH_HOPS))
+        result = self.client. execute_read(_Q_GET_NODE_DEPENDENCIES[max_depth], {"id": node_id})
+        return [self._node_from_record(r["node"]) for r in result]
+
+    def get_node_neighborhood(self, node_id: str) -> dict[str, Any]:
         """
+        Get a node with its upstream, downstream and dependent nodes in one query.
 
-        result = self.client. execute_read(query, {"id": node_id})
-        return [self._node_from_record(r["node"]) for r in result]
+        Dependents are found up to the default get_node_dependencies depth.
+        Saves the round trips of calling get_node, get_upstream_nodes,
+        get_downstream_nodes and get_node_dependencies separately.
+
+        Args:
+            node_id: Node ID
+
+        Returns:
+            Dictionary with "node" (None if not found), "upstream",
+            "downstream" and "dependencies" keys
+        """
+        result = self.client.execute_read(_Q_GET_NODE_NEIGHBORHOOD, {"id": node_id})
+        return self._neighborhood_from_result(result)
+
+    def get_node_with_dependencies(self, node_id: str) -> tuple[Optional[Node], list[Node]]:
+        """
+        Get a node and the nodes that depend on it in one query.
+
+        Like get_node_neighborhood without the upstream and downstream nodes.
+
+        Args:
+            node_id: Node ID
+
+        Returns:
+            Tuple of (node, dependent nodes); node is None if not found
+        """
+        result = self.client.execute_read(_Q_GET_NODE_WITH_DEPENDENCIES, {"id": node_id})
+        return self._dependencies_from_result(result)
 
-    def get_critical_nodes(self) -> list[Node]:
+    def get_critical_nodes(self, min_degree: int = 3, limit: int = 100) -> list[Node]:
         """
         Get nodes that are critical (high connectivity or core type).
 
         A node is critical if:
-        - It's a core router or distribution switch
-        - It has more than 3 connections
+        - It's a core router, distribution switch, firewall or load balancer
+        - It has more than min_degree connections
+
+        Degree is the stored n.degree property; nodes written before it
+        existed get theirs from ensure_schema(). Results are cached
+        (see get_node()).
+
+        Args:
+            min_degree: Connection count a node must exceed to be critical
+            limit: Maximum number of nodes to return
+
+        Returns:
+            Critical nodes, most connected first
         """
-        query = """
-        MATCH (n:NetworkNode)
-        WHERE n.type IN ['router_core', 'switch_distribution', 'firewall', 'load_balancer']
-           OR size([(n)-[:CONNECTS_TO]-() | 1]) > 3
-        RETURN n {.*} as node
-        ORDER BY size([(n)-[:CONNECTS_TO]-() | 1]) DESC
+        return list(self._read_cache.get_or_load(
+            ("critical", min_degree, limit),
+            lambda: self._fetch_critical_nodes(min_degree, limit),
+        ))
+
+    def _fetch_critical_nodes(self, min_degree: int, limit: int) -> tuple[Node, ...]:
+        """Query critical nodes (uncached)."""
+        result = self.client.execute_read(_Q_GET_CRITICAL_NODES, {
+            "critical_types": self.CRITICAL_NODE_TYPES,
+            "min_degree": min_degree,
+            "limit": limit,
+        })
+        return tuple(self._node_from_record(r["node"]) for r in result)
+
+    def get_topology_summary(self) -> dict[str, Any]:
+        """Get summary statistics about the topology (cached, see get_node())."""
+        summary = self._read_cache.get_or_load(("summary",), self._fetch_topology_summary)
+        return dict(summary)
+
+    def _fetch_topology_summary(self) -> dict[str, Any]:
+        """Query summary statistics about the topology (uncached)."""
+        result = self. client.execute_read(_Q_GET_TOPOLOGY_SUMMARY)
+        return self._summary_from_result(result)
+
+    def get_nodes_grouped_by_type(self) -> dict[str, list[dict[str, Any]]]:
         """
+        Get node id, name and status grouped by node type.
 
-        result = self.client.execute_read(query)
-        return [self._node_from_record(r["node"]) for r in result]
+        Grouping and projection happen in Cypher, so only the fields needed
+        for a per-type listing are transferred.
 
-    def get_topology_summary(self) -> dict[str, Any]:
-        """Get summary statistics about the topology."""
-        query = """
-        MATCH (n:NetworkNode)
-        WITH count(n) as nodeCount,
-             collect(DISTINCT n.type) as types,
-             collect(DISTINCT n.location) as locations
-        OPTIONAL MATCH ()-[r:CONNECTS_TO]->()
-        RETURN nodeCount, 
-               count(r) as linkCount,
-               types,
-               locations
+        Returns:
+            Dictionary of node type to node property dicts, sorted by name
         """
+        result = self.client.execute_read(_Q_GET_NODES_GROUPED_BY_TYPE)
+        return {r["type"]: r["nodes"] for r in result}
 
-        result = self. client.execute_read(query)
+    def get_topology_bundle(self) -> dict[str, Any]:
+        """
+        Get all nodes, all links and the topology summary in one query.
 
+        Saves the round trips of calling get_all_nodes, get_all_links and
+        get_topology_summary separately.
+
+        Returns:
+            Dictionary with "nodes", "links" and "summary" keys
+        """
+        result = self.client.execute_read(_Q_GET_TOPOLOGY_BUNDLE)
+        record = result[0] if result else {}
+
+        nodes = [self._node_from_record(n) for n in record.get("nodes", [])]
+        links = [self._link_from_record(r) for r in record.get("links", [])]
+
+        return {
+            "nodes": nodes,
+            "links": links,
+            "summary": {
+                "nodes": len(nodes),
+                "links": len(links),
+                "types": list(dict.fromkeys(n.type.value for n in nodes)),
+                "locations": list(dict.fromkeys(n.location for n in nodes)),
+            },
+        }
+
+    # =========================================================================
+    # Helper Methods
+    # =========================================================================
+
+    def _node_properties(self, node: Node) -> dict[str, Any]:
+        """Build the stored property map for a node (without its ID)."""
+        return {
+            "name": node.name,
+            "type": node.type.value,
+            "ip_address": node.ip_address,
+            "location": node. location,
+            "status": node.status.value,
+            "vendor": node. vendor,
+            "model": node.model,
+            "interfaces": node.interfaces,
+            "metadata": _dumps(node.metadata or {}),
+            "created_at": node.created_at. isoformat(),
+        }
+
+    def _link_properties(self, link: Link) -> dict[str, Any]:
+        """Build the stored property map for a link (without ID and endpoints)."""
+        return {
+            "source_interface": link. source_interface,
+            "target_interface": link.target_interface,
+            "bandwidth_mbps": link.bandwidth_mbps,
+            "latency_ms": link.latency_ms,
+            "status": link.status,
+        }
+
+    def _summary_from_result(self, result: list[dict[str, Any]]) -> dict[str, Any]:
+        """Convert the topology summary query result to a summary dict."""
         if not result:
             return {"nodes": 0, "links": 0, "types": [], "locations": []}
 
@@ -428,30 +1002,59 @@ class TopologyManager:
             "locations": r["locations"],
         }
 
-    # =========================================================================
-    # Helper Methods
-    # =========================================================================
+    def _neighborhood_from_result(self, result: list[dict[str, Any]]) -> dict[str, Any]:
+        """Convert the node neighborhood query result to a neighborhood dict."""
+        if not result:
+            return {"node": None, "upstream": [], "downstream": [], "dependencies": []}
+
+        r = result[0]
+        return {
+            "node": self._node_from_record(r["node"]),
+            "upstream": [self._node_from_record(n) for n in r["upstream"]],
+            "downstream": [self._node_from_record(n) for n in r["downstream"]],
+            "dependencies": [self._node_from_record(n) for n in r["dependencies"]],
+        }
+
+    def _dependencies_from_result(self, result: list[dict[str, Any]]) -> tuple[Optional[Node], list[Node]]:
+        """Convert the node dependencies query result to a (node, dependents) tuple."""
+        if not result:
+            return None, []
+
+        record = result[0]
+        return (
+            self._node_from_record(record["node"]),
+            [self._node_from_record(d) for d in record["dependencies"]],
+        )
 
     def _node_from_record(self, record: dict) -> Node:
-        """Convert a Neo4j node record to a Node object."""
+        """
+        Convert a Neo4j node record to a Node object.
+
+        Stored nodes were validated when written, so the model is built with
+        model_construct (no validation); enum fields are converted here since
+        model_construct does not coerce them. A stored type or status that is
+        not a known value still raises ValueError, like the enum constructors.
+        """
         if record is None:
             record = {}
 
-        return Node(
+        node_type = record.get("type", "server")
+        status = record.get("status", "unknown")
+        return Node.model_construct(
             id=record. get("id", ""),
             name=record.get("name", ""),
-            type=NodeType(record.get("type", "server")),
+            type=_NODE_TYPE_BY_VALUE.get(node_type) or NodeType(node_type),
             ip_address=record. get("ip_address", "0.0.0.0"),
             location=record.get("location", "unknown"),
-            status=NodeStatus(record. get("status", "unknown")),
+            status=_NODE_STATUS_BY_VALUE.get(status) or NodeStatus(status),
             vendor=record.get("vendor", "Unknown"),
             model=record.get("model", "Unknown"),
             interfaces=record. get("interfaces", []),
-            metadata={},
+            metadata=_metadata_from_property(record.get("metadata")),
         )
 
     def _link_from_record(self, record: dict) -> Link:
-        """Convert a Neo4j relationship record to a Link object."""
+        """Convert a Neo4j relationship record to a Link object (unvalidated, see _node_from_record())."""
         if record is None:
             record = {}
 
@@ -460,7 +1063,7 @@ class TopologyManager:
         if link_data is None:
             link_data = {}
 
-        return Link(
+        return Link.model_construct(
             id=link_data.get("id", ""),
             source_node_id=record.get("source_id", ""),
             target_node_id=record.get("target_id", ""),
@@ -469,4 +1072,131 @@ class TopologyManager:
             bandwidth_mbps=link_data.get("bandwidth_mbps", 1000),
             latency_ms=link_data.get("latency_ms", 1.0),
             status=link_data. get("status", "up"),
-        )
\ No newline at end of file
+        )
+
+
+class AsyncTopologyManager:
+    """
+    Read-only topology queries over the asyncio Neo4j driver.
+
+    Mirrors the TopologyManager read methods for callers running on an
+    event loop (such as the MCP tool handlers), so a query awaits its round
+    trip instead of blocking every other coroutine. Writes and imports stay
+    on the synchronous TopologyManager.
+
+    Example:
+        >>> topo_mgr = AsyncTopologyManager(AsyncNeo4jClient().connect())
+        >>> node = await topo_mgr.get_node("router_core_01")
+    """
+
+    MAX_PATH_HOPS = TopologyManager.MAX_PATH_HOPS
+    CRITICAL_NODE_TYPES = TopologyManager.CRITICAL_NODE_TYPES
+
+    # Record conversion is shared with the synchronous manager
+    _node_from_record = TopologyManager._node_from_record
+    _link_from_record = TopologyManager._link_from_record
+    _summary_from_result = TopologyManager._summary_from_result
+    _neighborhood_from_result = TopologyManager._neighborhood_from_result
+    _dependencies_from_result = TopologyManager._dependencies_from_result
+
+    def __init__(self, client: AsyncNeo4jClient):
+        """
+        Initialize AsyncTopologyManager.
+
+        Args:
+            client: AsyncNeo4jClient instance
+        """
+        self.client = client
+
+    async def get_node(self, node_id: str) -> Optional[Node]:
+        """Get a node by ID."""
+        result = await self.client.execute_read(_Q_GET_NODE, {"id": node_id})
+
+        if not result:
+            return None
+
+        return self._node_from_record(result[0]["node"])
+
+    async def get_all_nodes(self) -> list[Node]:
+        """Get all network nodes."""
+        return [node async for node in self.iter_all_nodes()]
+
+    async def iter_all_nodes(self) -> AsyncIterator[Node]:
+        """Iterate over all network nodes as the driver streams them."""
+        async for r in self.client.execute_read_iter(_Q_GET_ALL_NODES):
+            yield self._node_from_record(r["node"])
+
+    async def get_nodes_by_type(self, node_type: NodeType) -> list[Node]:
+        """Get all nodes of a specific type."""
+        result = await self.client.execute_read(_Q_GET_NODES_BY_TYPE, {"type": node_type.value})
+        return [self._node_from_record(r["node"]) for r in result]
+
+    async def get_all_links(self) -> list[Link]:
+        """Get all links in the topology."""
+        return [link async for link in self.iter_all_links()]
+
+    async def iter_all_links(self) -> AsyncIterator[Link]:
+        """Iterate over all links as the driver streams them."""
+        async for r in self.client.execute_read_iter(_Q_GET_ALL_LINKS):
+            yield self._link_from_record(r)
+
+    async def get_connected_nodes(self, node_id: str) -> list[Node]:
+        """Get all nodes directly connected to a node."""
+        result = await self.client.execute_read(_Q_GET_CONNECTED_NODES, {"id": node_id})
+        return [self._node_from_record(r["node"]) for r in result]
+
+    async def get_upstream_nodes(self, node_id: str) -> list[Node]:
+        """Get nodes that connect TO this node (upstream)."""
+        result = await self.client.execute_read(_Q_GET_UPSTREAM_NODES, {"id": node_id})
+        return [self._node_from_record(r["node"]) for r in result]
+
+    async def get_downstream_nodes(self, node_id: str) -> list[Node]:
+        """Get nodes that this node connects to (downstream)."""
+        result = await self.client.execute_read(_Q_GET_DOWNSTREAM_NODES, {"id": node_id})
+        return [self._node_from_record(r["node"]) for r in result]
+
+    async def find_path(self, source_id: str, target_id: str, max_hops: int = 10) -> list[Node]:
+        """Find shortest path between two nodes (max_hops clamped to 1..MAX_PATH_HOPS)."""
+        max_hops = max(1, min(int(max_hops), self.MAX_PATH_HOPS))
+        result = await self.client.execute_read(_Q_FIND_PATH, {
+            "source_id": source_id,
+            "target_id": target_id,
+            "max_hops": max_hops,
+        })
+
+        if not result:
+            return []
+
+        return [self._node_from_record(n) for n in result[0]["nodes"]]
+
+    async def get_node_dependencies(
+        self, node_id: str, max_depth: int = _DEFAULT_DEPENDENCY_DEPTH
+    ) -> list[Node]:
+        """Get all nodes that depend on a given node (max_depth clamped to 1..MAX_PATH_HOPS)."""
+        max_depth = max(1, min(int(max_depth), self.MAX_PATH_HOPS))
+        result = await self.client.execute_read(_Q_GET_NODE_DEPENDENCIES[max_depth], {"id": node_id})
+        return [self._node_from_record(r["node"]) for r in result]
+
+    async def get_node_neighborhood(self, node_id: str) -> dict[str, Any]:
+        """Get a node with its upstream, downstream and dependent nodes in one query."""
+        result = await self.client.execute_read(_Q_GET_NODE_NEIGHBORHOOD, {"id": node_id})
+        return self._neighborhood_from_result(result)
+
+    async def get_node_with_dependencies(self, node_id: str) -> tuple[Optional[Node], list[Node]]:
+        """Get a node and the nodes that depend on it in one query."""
+        result = await self.client.execute_read(_Q_GET_NODE_WITH_DEPENDENCIES, {"id": node_id})
+        return self._dependencies_from_result(result)
+
+    async def get_critical_nodes(self, min_degree: int = 3, limit: int = 100) -> list[Node]:
+        """Get critical nodes (core types or more than min_degree connections)."""
+        result = await self.client.execute_read(_Q_GET_CRITICAL_NODES, {
+            "critical_types": self.CRITICAL_NODE_TYPES,
+            "min_degree": min_degree,
+            "limit": limit,
+        })
+        return [self._node_from_record(r["node"]) for r in result]
+
+    async def get_topology_summary(self) -> dict[str, Any]:
+        """Get summary statistics about the topology."""
+        result = await self.client.execute_read(_Q_GET_TOPOLOGY_SUMMARY)
+        return self._summary_from_result(result)
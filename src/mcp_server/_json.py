@@ -0,0 +1,35 @@
+"""
+MCP JSON Encoding
+
+Serializes tool and server responses for the wire.
+"""
+
+import json
+from dataclasses import asdict
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from src.mcp_server.config import config
+
+# Compact JSON on the wire; indented only when MCP_PRETTY_JSON is set.
+# Non-string keys (e.g. in policy action parameters) are allowed, as with json.
+_INDENT = 2 if config.pretty_json else None
+_ORJSON_OPTION = (
+    orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if config.pretty_json else 0)
+    if orjson is not None else 0
+)
+
+
+def dumps(data: Any) -> str:
+    """
+    Serialize a response as JSON, using orjson when available.
+
+    Dataclasses (e.g. diagnosis issues) are written as plain objects.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=_ORJSON_OPTION).decode()
+    return json.dumps(data, indent=_INDENT, default=asdict)
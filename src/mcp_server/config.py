@@ -3,7 +3,8 @@ MCP Server Configuration
 """
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -11,21 +12,35 @@ load_dotenv()
 
 @dataclass
 class MCPConfig:
-    """Configuration for the MCP server."""
+    """Configuration for the MCP server (read from the environment when created)."""
 
     # Server info
-    server_name: str = os.getenv("MCP_SERVER_NAME", "network-automation-mcp")
-    server_version: str = os.getenv("MCP_SERVER_VERSION", "0.1.0")
+    server_name: str = field(default_factory=lambda: os.getenv("MCP_SERVER_NAME", "network-automation-mcp"))
+    server_version: str = field(default_factory=lambda: os.getenv("MCP_SERVER_VERSION", "0.1.0"))
 
     # Neo4j
-    neo4j_uri: str = os.getenv("NEO4J_URI", "bolt://localhost:7687")
-    neo4j_user: str = os.getenv("NEO4J_USER", "neo4j")
-    neo4j_password: str = os.getenv("NEO4J_PASSWORD", "password")
-    neo4j_database: str = os.getenv("NEO4J_DATABASE", "neo4j")
+    neo4j_uri: str = field(default_factory=lambda: os.getenv("NEO4J_URI", "bolt://localhost:7687"))
+    neo4j_user: str = field(default_factory=lambda: os.getenv("NEO4J_USER", "neo4j"))
+    neo4j_password: str = field(default_factory=lambda: os.getenv("NEO4J_PASSWORD", "password"))
+    neo4j_database: str = field(default_factory=lambda: os.getenv("NEO4J_DATABASE", "neo4j"))
 
     # Logging
-    log_level: str = os.getenv("MCP_LOG_LEVEL", "INFO")
+    log_level: str = field(default_factory=lambda: os.getenv("MCP_LOG_LEVEL", "INFO"))
+
+    # Tool responses are compact JSON unless pretty-printing is asked for (debugging)
+    pretty_json: bool = field(default_factory=lambda: os.getenv("MCP_PRETTY_JSON", "false").lower() == "true")
+
+
+@lru_cache(maxsize=1)
+def get_config() -> MCPConfig:
+    """
+    Get the shared MCP server configuration.
+
+    Built once per process; call get_config.cache_clear() to rebuild it
+    (e.g. in tests).
+    """
+    return MCPConfig()
 
 
 # Global config instance
-config = MCPConfig()
\ No newline at end of file
+config = get_config()
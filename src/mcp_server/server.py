@@ -6,7 +6,7 @@ Main entry point for the Model Context Protocol server.
 
 import asyncio
 import logging
-import json
+from types import MappingProxyType
 from typing import Any
 
 from mcp. server import Server
@@ -14,6 +14,7 @@ from mcp. server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
 from src.mcp_server.config import config
+from src.mcp_server._json import dumps as _dumps
 
 # Import tool handlers
 from src.mcp_server.tools import telemetry_handlers
@@ -30,6 +31,22 @@ logging. basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Tool modules, in registration order
+_TOOL_MODULES = (
+    telemetry_handlers,
+    topology_handlers,
+    policy_handlers,
+    execution_handlers,
+    diagnosis_handlers,
+)
+
+# Tool list and name -> handler dispatch table, assembled once at import and
+# shared by every server
+_ALL_TOOLS: list[Tool] = [tool for module in _TOOL_MODULES for tool in module.get_tools()]
+_TOOL_HANDLERS = MappingProxyType(
+    {name: handler for module in _TOOL_MODULES for name, handler in module.get_handlers().items()}
+)
+
 
 def create_server() -> Server:
     """
@@ -40,24 +57,11 @@ def create_server() -> Server:
     """
     server = Server(config.server_name)
 
-    # Collect all tools from all modules
-    all_tools = []
-    all_tools.extend(telemetry_handlers. get_tools())
-    all_tools.extend(topology_handlers.get_tools())
-    all_tools.extend(policy_handlers.get_tools())
-    all_tools.extend(execution_handlers. get_tools())
-    all_tools. extend(diagnosis_handlers.get_tools())
+    all_tools = _ALL_TOOLS
+    tool_handlers = _TOOL_HANDLERS
 
     logger.info(f"Registered {len(all_tools)} tools")
 
-    # Create tool lookup
-    tool_handlers = {}
-    tool_handlers.update(telemetry_handlers. get_handlers())
-    tool_handlers.update(topology_handlers.get_handlers())
-    tool_handlers.update(policy_handlers.get_handlers())
-    tool_handlers.update(execution_handlers. get_handlers())
-    tool_handlers. update(diagnosis_handlers.get_handlers())
-
     @server.list_tools()
     async def list_tools() -> list[Tool]:
         """List all available tools."""
@@ -66,23 +70,23 @@ def create_server() -> Server:
     @server.call_tool()
     async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
         """Route tool calls to appropriate handlers."""
-        logger.info(f"Tool called: {name} with arguments: {arguments}")
+        logger.info("Tool called: %s with arguments: %s", name, arguments)
 
         if name in tool_handlers:
             try:
                 result = await tool_handlers[name](arguments)
                 return result
             except Exception as e:
-                logger.error(f"Error in tool {name}: {e}")
-                return [TextContent(type="text", text=json.dumps({
+                logger.error("Error in tool %s: %s", name, e)
+                return [TextContent(type="text", text=_dumps({
                     "error": str(e),
                     "tool": name
-                }, indent=2))]
+                }))]
         else:
-            return [TextContent(type="text", text=json.dumps({
+            return [TextContent(type="text", text=_dumps({
                 "error": f"Unknown tool: {name}",
                 "available_tools": list(tool_handlers.keys())
-            }, indent=2))]
+            }))]
 
     logger.info(f"MCP Server '{config.server_name}' configured successfully")
 
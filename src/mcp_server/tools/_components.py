@@ -0,0 +1,33 @@
+"""
+Shared Simulator Components
+
+One simulated network, shared by every tool module that reads or mutates it.
+"""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+# The simulator (and Faker behind it) is imported on first use, so importing the
+# tools package stays cheap for callers that never touch simulated data.
+if TYPE_CHECKING:
+    from src.simulator.network_sim import NetworkSimulator
+    from src.simulator.log_generator import LogGenerator
+    from src.simulator.telemetry_generator import TelemetryGenerator
+    from src.simulator.anomaly_injector import AnomalyInjector
+
+
+@lru_cache(maxsize=1)
+def get_components() -> tuple["NetworkSimulator", "LogGenerator", "TelemetryGenerator", "AnomalyInjector"]:
+    """Get or initialize the simulator components (created on first use)."""
+    from src.simulator.network_sim import NetworkSimulator
+    from src.simulator.log_generator import LogGenerator
+    from src.simulator.telemetry_generator import TelemetryGenerator
+    from src.simulator.anomaly_injector import AnomalyInjector
+
+    network_sim = NetworkSimulator()
+    network_sim.create_default_topology()
+    log_generator = LogGenerator(network_sim)
+    telemetry_generator = TelemetryGenerator(network_sim)
+    anomaly_injector = AnomalyInjector(network_sim, telemetry_generator, log_generator)
+
+    return network_sim, log_generator, telemetry_generator, anomaly_injector
@@ -4,42 +4,86 @@ Diagnosis Tool Handlers
 MCP tools for network diagnosis.
 """
 
-import json
-import uuid
+import secrets
+from collections import Counter, defaultdict, deque
+from dataclasses import dataclass
+from itertools import count, islice
+from functools import lru_cache
 from typing import Any, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 
 from mcp.types import Tool, TextContent
 
-from src.simulator.network_sim import NetworkSimulator
-from src.simulator.log_generator import LogGenerator
-from src.simulator.telemetry_generator import TelemetryGenerator
-from src.simulator.anomaly_injector import AnomalyInjector
+from src.mcp_server._json import dumps as _dumps
+from src.mcp_server.tools._components import get_components as _get_components
 from src.models.network import MetricType, AnomalyType, AnomalySeverity
 
-_network_sim: Optional[NetworkSimulator] = None
-_log_generator: Optional[LogGenerator] = None
-_telemetry_generator: Optional[TelemetryGenerator] = None
-_anomaly_injector: Optional[AnomalyInjector] = None
-_diagnosis_history: list[dict] = []
-
-
-def _get_components():
-    """Get or initialize components."""
-    global _network_sim, _log_generator, _telemetry_generator, _anomaly_injector
-
-    if _network_sim is None:
-        _network_sim = NetworkSimulator()
-        _network_sim.create_default_topology()
-        _log_generator = LogGenerator(_network_sim)
-        _telemetry_generator = TelemetryGenerator(_network_sim)
-        _anomaly_injector = AnomalyInjector(_network_sim, _telemetry_generator, _log_generator)
-
-    return _network_sim, _log_generator, _telemetry_generator, _anomaly_injector
+# Diagnosis IDs: a random per-process prefix plus a counter (12 hex digits, as before)
+_DIAGNOSIS_ID_PREFIX = secrets.token_hex(2)
+_diagnosis_counter = count()
+
+# Most recent diagnosis reports; the oldest are dropped once the cap is reached
+MAX_DIAGNOSIS_HISTORY = 1000
+_diagnosis_history: deque[dict] = deque(maxlen=MAX_DIAGNOSIS_HISTORY)
+# The same reports by scope (node ID or "network-wide"), each capped separately
+_history_by_scope: defaultdict[str, deque[dict]] = defaultdict(lambda: deque(maxlen=MAX_DIAGNOSIS_HISTORY))
+
+# Anomaly severity value -> rank, for minimum-severity filters
+_SEVERITY_RANK = {"low": 0, "medium": 1, "high": 2, "critical": 3}
+
+# Enum member -> value, for per-anomaly loops (dict hit instead of the .value descriptor)
+_ANOMALY_TYPE_VALUE = {t: t.value for t in AnomalyType}
+_SEVERITY_VALUE = {s: s.value for s in AnomalySeverity}
+
+# Threshold checks run by run_diagnosis, in report order:
+# (check type, metric, issue type, ((above, severity), ...) highest tier first)
+_DIAGNOSIS_CHECKS = (
+    ("cpu", MetricType.CPU_UTILIZATION, "HIGH_CPU",
+     ((95, "critical"), (90, "high"), (80, "medium"))),
+    ("memory", MetricType.MEMORY_UTILIZATION, "MEMORY_LEAK",
+     ((95, "critical"), (90, "high"))),
+    ("network", MetricType.PACKET_LOSS, "PACKET_LOSS",
+     ((10, "critical"), (5, "high"))),
+    ("latency", MetricType.LATENCY, "HIGH_LATENCY",
+     ((100, "critical"), (50, "high"))),
+)
+
+
+@dataclass(slots=True)
+class Issue:
+    """A threshold breach found by run_diagnosis (serialized as a JSON object)."""
+    type: str
+    severity: str
+    node_id: str
+    value: float
+
+
+# get_anomalies response when nothing matches, serialized once
+_NO_ANOMALIES = TextContent(type="text", text=_dumps({"total_anomalies": 0, "anomalies": []}))
+
+
+def get_diagnosis_history(node_id: Optional[str] = None, limit: int = 10) -> list[dict]:
+    """
+    Get the most recent diagnosis reports, newest first.
+
+    Args:
+        node_id: Only reports for this node (default: all scopes)
+        limit: Maximum number of reports
+
+    Returns:
+        Diagnosis report dicts (their "issues" are Issue instances)
+    """
+    if node_id:
+        # .get() so unknown nodes do not create empty index entries
+        history = _history_by_scope.get(node_id, ())
+    else:
+        history = _diagnosis_history
+    return list(islice(reversed(history), limit))
 
 
+@lru_cache(maxsize=1)
 def get_tools() -> list[Tool]:
-    """Return list of diagnosis tools."""
+    """Return list of diagnosis tools (built once; callers must not mutate it)."""
     return [
         Tool(
             name="run_diagnosis",
@@ -130,8 +174,6 @@ def get_handlers() -> dict:
 
 async def handle_run_diagnosis(arguments: dict[str, Any]) -> list[TextContent]:
     """Run diagnosis."""
-    global _diagnosis_history
-
     network_sim, _, tel_gen, _ = _get_components()
 
     node_id = arguments.get("node_id")
@@ -142,64 +184,62 @@ async def handle_run_diagnosis(arguments: dict[str, Any]) -> list[TextContent]:
     if node_id:
         node = network_sim.get_node(node_id)
         if not node:
-            return [TextContent(type="text", text=json.dumps({"error": f"Node '{node_id}' not found"}, indent=2))]
+            return [TextContent(type="text", text=_dumps({"error": f"Node '{node_id}' not found"}))]
         nodes = [node]
     else:
         nodes = network_sim.get_all_nodes()
 
-    diagnosis_id = f"diag_{uuid.uuid4().hex[:12]}"
-    issues_found = []
-
-    for node in nodes:
-        snapshot = tel_gen.generate_snapshot(node)
-
-        if "cpu" in check_types:
-            cpu = snapshot.get_metric(MetricType.CPU_UTILIZATION)
-            if cpu and cpu.value > 90:
-                issues_found.append(
-                    {"type": "HIGH_CPU", "severity": "critical" if cpu.value > 95 else "high", "node_id": node.id,
-                     "value": cpu.value})
-            elif cpu and cpu.value > 80:
-                issues_found.append({"type": "HIGH_CPU", "severity": "medium", "node_id": node.id, "value": cpu.value})
-
-        if "memory" in check_types:
-            mem = snapshot.get_metric(MetricType.MEMORY_UTILIZATION)
-            if mem and mem.value > 90:
-                issues_found.append(
-                    {"type": "MEMORY_LEAK", "severity": "critical" if mem.value > 95 else "high", "node_id": node.id,
-                     "value": mem.value})
-
-        if "network" in check_types:
-            loss = snapshot.get_metric(MetricType.PACKET_LOSS)
-            if loss and loss.value > 5:
-                issues_found.append(
-                    {"type": "PACKET_LOSS", "severity": "critical" if loss.value > 10 else "high", "node_id": node.id,
-                     "value": loss.value})
-
-        if "latency" in check_types:
-            lat = snapshot.get_metric(MetricType.LATENCY)
-            if lat and lat.value > 50:
-                issues_found.append(
-                    {"type": "HIGH_LATENCY", "severity": "critical" if lat.value > 100 else "high", "node_id": node.id,
-                     "value": lat.value})
-
-    overall = "critical" if any(i["severity"] == "critical" for i in issues_found) else \
-        "high" if any(i["severity"] == "high" for i in issues_found) else \
+    diagnosis_id = f"diag_{_DIAGNOSIS_ID_PREFIX}{next(_diagnosis_counter):08x}"
+    issues_found: list[Issue] = []
+
+    # Select the enabled checks once instead of testing check_types per node,
+    # alongside its lowest tier, so healthy readings skip the tier scan
+    checks = [
+        (metric_type, issue_type, tiers, tiers[-1][0])
+        for check_type, metric_type, issue_type, tiers in _DIAGNOSIS_CHECKS
+        if check_type in check_types
+    ]
+    # Only generate the readings the enabled checks look at, all at one timestamp
+    metric_types = [check[0] for check in checks]
+    timestamp = datetime.now(timezone.utc)
+
+    for node in nodes if checks else ():
+        snapshot = tel_gen.generate_snapshot(node, timestamp, metric_types)
+        # One pass over the readings instead of a get_metric() scan per check
+        metrics_by_type = {m.metric_type: m for m in snapshot.metrics}
+
+        for metric_type, issue_type, tiers, floor in checks:
+            metric = metrics_by_type.get(metric_type)
+            if not metric or metric.value <= floor:
+                continue
+
+            value = metric.value
+            for threshold, severity in tiers:
+                if value > threshold:
+                    issues_found.append(Issue(issue_type, severity, node.id, value))
+                    break
+
+    # One pass over the issues for both the overall status and the counts
+    severity_counts = Counter(i.severity for i in issues_found)
+    overall = "critical" if severity_counts["critical"] else \
+        "high" if severity_counts["high"] else \
             "medium" if issues_found else "healthy"
 
     report = {
         "diagnosis_id": diagnosis_id,
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": timestamp.isoformat(),
         "scope": node_id or "network-wide",
         "nodes_analyzed": len(nodes),
         "overall_status": overall,
         "total_issues": len(issues_found),
+        "issues_by_severity": {s: severity_counts[s] for s in ("critical", "high", "medium")},
         "issues": issues_found,
     }
 
     _diagnosis_history.append(report)
+    _history_by_scope[report["scope"]].append(report)
 
-    return [TextContent(type="text", text=json.dumps(report, indent=2))]
+    return [TextContent(type="text", text=_dumps(report))]
 
 
 async def handle_get_anomalies(arguments: dict[str, Any]) -> list[TextContent]:
@@ -209,21 +249,25 @@ async def handle_get_anomalies(arguments: dict[str, Any]) -> list[TextContent]:
     severity_filter = arguments.get("severity")
     node_filter = arguments.get("node_id")
 
-    anomalies = anomaly_inj.get_active_anomalies()
+    it = iter(anomaly_inj.get_active_anomalies())
 
     if severity_filter:
-        severity_order = ["low", "medium", "high", "critical"]
-        min_idx = severity_order.index(severity_filter)
-        anomalies = [a for a in anomalies if severity_order.index(a.severity.value) >= min_idx]
+        min_rank = _SEVERITY_RANK[severity_filter]
+        it = (a for a in it if _SEVERITY_RANK[_SEVERITY_VALUE[a.severity]] >= min_rank)
 
     if node_filter:
-        anomalies = [a for a in anomalies if a.node_id == node_filter]
+        it = (a for a in it if a.node_id == node_filter)
+
+    anomalies = list(it)
+    if not anomalies:
+        return [_NO_ANOMALIES]
 
-    return [TextContent(type="text", text=json.dumps({
+    return [TextContent(type="text", text=_dumps({
         "total_anomalies": len(anomalies),
-        "anomalies": [{"id": a.id, "type": a.anomaly_type.value, "severity": a.severity.value, "node_id": a.node_id,
+        "anomalies": [{"id": a.id, "type": _ANOMALY_TYPE_VALUE[a.anomaly_type],
+                       "severity": _SEVERITY_VALUE[a.severity], "node_id": a.node_id,
                        "description": a.description} for a in anomalies]
-    }, indent=2))]
+    }))]
 
 
 async def handle_inject_test_anomaly(arguments: dict[str, Any]) -> list[TextContent]:
@@ -238,13 +282,13 @@ async def handle_inject_test_anomaly(arguments: dict[str, Any]) -> list[TextCont
 
     if not anomaly:
         return [TextContent(type="text",
-                            text=json.dumps({"success": False, "error": f"Node '{node_id}' not found"}, indent=2))]
+                            text=_dumps({"success": False, "error": f"Node '{node_id}' not found"}))]
 
-    return [TextContent(type="text", text=json.dumps({
+    return [TextContent(type="text", text=_dumps({
         "success": True,
         "anomaly": {"id": anomaly.id, "type": anomaly.anomaly_type.value, "severity": anomaly.severity.value,
                     "node_id": anomaly.node_id, "description": anomaly.description}
-    }, indent=2))]
+    }))]
 
 
 async def handle_clear_anomaly(arguments: dict[str, Any]) -> list[TextContent]:
@@ -257,13 +301,11 @@ async def handle_clear_anomaly(arguments: dict[str, Any]) -> list[TextContent]:
         success = anomaly_inj.clear_anomaly(anomaly_id)
         if success:
             return [TextContent(type="text",
-                                text=json.dumps({"success": True, "message": f"Anomaly '{anomaly_id}' cleared"},
-                                                indent=2))]
+                                text=_dumps({"success": True, "message": f"Anomaly '{anomaly_id}' cleared"}))]
         else:
             return [TextContent(type="text",
-                                text=json.dumps({"success": False, "error": f"Anomaly '{anomaly_id}' not found"},
-                                                indent=2))]
+                                text=_dumps({"success": False, "error": f"Anomaly '{anomaly_id}' not found"}))]
     else:
         count = anomaly_inj.clear_all_anomalies()
         return [TextContent(type="text",
-                            text=json.dumps({"success": True, "message": f"Cleared {count} anomalies"}, indent=2))]
\ No newline at end of file
+                            text=_dumps({"success": True, "message": f"Cleared {count} anomalies"}))]
\ No newline at end of file
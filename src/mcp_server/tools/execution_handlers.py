@@ -4,31 +4,51 @@ Execution Tool Handlers
 MCP tools for executing network actions.
 """
 
-import json
+import time
 import uuid
-from typing import Any, Optional
-from datetime import datetime
+from collections import defaultdict, deque
+from functools import lru_cache
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable
+from datetime import datetime, timezone
 
 from mcp.types import Tool, TextContent
 
-from src.simulator.network_sim import NetworkSimulator
-from src.models.network import NodeStatus
+from src.models.network import Node, NodeStatus
+from src.mcp_server._json import dumps as _dumps
+from src.mcp_server.tools._components import get_components
 
-_network_sim: Optional[NetworkSimulator] = None
-_execution_history: list[dict] = []
+if TYPE_CHECKING:
+    from src.simulator.network_sim import NetworkSimulator
 
+# Most recent executions; the oldest are dropped (and unindexed) once the cap is reached
+MAX_EXECUTION_HISTORY = 10000
+_execution_history: deque[dict] = deque(maxlen=MAX_EXECUTION_HISTORY)
+# The same records by execution ID, for get_execution_status
+_execution_index: dict[str, dict] = {}
+# The same records by target node and by action type, for filtered history queries
+_history_by_node: defaultdict[str, deque[dict]] = defaultdict(deque)
+_history_by_action: defaultdict[str, deque[dict]] = defaultdict(deque)
 
-def _get_network_sim() -> NetworkSimulator:
-    """Get or initialize network simulator."""
-    global _network_sim
-    if _network_sim is None:
-        _network_sim = NetworkSimulator()
-        _network_sim.create_default_topology()
-    return _network_sim
 
+def _unindex(record: dict) -> None:
+    """Drop the oldest history record from the secondary indexes."""
+    del _execution_index[record["execution_id"]]
+    for index, key in ((_history_by_node, record["target_node_id"]), (_history_by_action, record["action_type"])):
+        records = index[key]
+        records.popleft()
+        if not records:
+            del index[key]
 
+
+def _get_network_sim() -> "NetworkSimulator":
+    """Get the network simulator shared with the telemetry and diagnosis tools."""
+    return get_components()[0]
+
+
+@lru_cache(maxsize=1)
 def get_tools() -> list[Tool]:
-    """Return list of execution tools."""
+    """Return list of execution tools (built once; callers must not mutate it)."""
     return [
         Tool(
             name="execute_action",
@@ -87,6 +107,10 @@ def get_tools() -> list[Tool]:
                         "type": "string",
                         "description": "Optional: Filter by node ID"
                     },
+                    "action_type": {
+                        "type": "string",
+                        "description": "Optional: Filter by action type"
+                    },
                     "limit": {
                         "type": "integer",
                         "description": "Max records (default: 50)",
@@ -122,17 +146,21 @@ async def handle_execute_action(arguments: dict[str, Any]) -> list[TextContent]:
     node = network_sim.get_node(target_node_id)
     if not node:
         return [TextContent(type="text",
-                            text=json.dumps({"success": False, "error": f"Node '{target_node_id}' not found"},
-                                            indent=2))]
+                            text=_dumps({"success": False, "error": f"Node '{target_node_id}' not found"}))]
 
     execution_id = f"exec_{uuid.uuid4().hex[:12]}"
-    started_at = datetime.utcnow()
+    started_at = datetime.now(timezone.utc)
+    # Durations come from the monotonic clock, immune to wall-clock jumps
+    start_ns = time.monotonic_ns()
 
     # Simulate action
-    result = await _simulate_action(network_sim, action_type, target_node_id, parameters)
+    result = await _simulate_action(network_sim, action_type, node, parameters)
 
-    completed_at = datetime.utcnow()
-    duration_ms = int((completed_at - started_at).total_seconds() * 1000)
+    duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
+    completed_at = datetime.now(timezone.utc)
+    # Formatted once; readers parse these back with datetime.fromisoformat
+    started_iso = started_at.isoformat()
+    completed_iso = completed_at.isoformat()
 
     record = {
         "execution_id": execution_id,
@@ -145,69 +173,103 @@ async def handle_execute_action(arguments: dict[str, Any]) -> list[TextContent]:
         "status": result["status"],
         "message": result["message"],
         "duration_ms": duration_ms,
-        "started_at": started_at.isoformat(),
-        "completed_at": completed_at.isoformat(),
+        "started_at": started_iso,
+        "completed_at": completed_iso,
     }
 
+    if len(_execution_history) == _execution_history.maxlen:
+        _unindex(_execution_history[0])
     _execution_history.append(record)
+    _execution_index[execution_id] = record
+    _history_by_node[target_node_id].append(record)
+    _history_by_action[action_type].append(record)
 
-    return [TextContent(type="text", text=json.dumps({
+    return [TextContent(type="text", text=_dumps({
         "execution_id": execution_id,
         "success": result["status"] == "SUCCESS",
         "action": {"type": action_type, "target": target_node_id, "parameters": parameters},
         "result": result,
         "duration_ms": duration_ms,
-    }, indent=2))]
+        "started_at": started_iso,
+        "completed_at": completed_iso,
+    }))]
 
 
-async def _simulate_action(network_sim: NetworkSimulator, action_type: str, target_node_id: str,
-                           parameters: dict) -> dict:
-    """Simulate action execution."""
-    node = network_sim.get_node(target_node_id)
+def _restart_service(network_sim: "NetworkSimulator", node: Node, parameters: dict) -> dict:
+    """Restart a service; the node passes through maintenance."""
+    network_sim.update_node_status(node.id, NodeStatus.MAINTENANCE)
+    network_sim.update_node_status(node.id, NodeStatus.HEALTHY)
+    return {"status": "SUCCESS", "message": f"Service restarted on {node.name}"}
 
-    if action_type == "restart_service":
-        network_sim.update_node_status(target_node_id, NodeStatus.MAINTENANCE)
-        network_sim.update_node_status(target_node_id, NodeStatus.HEALTHY)
-        return {"status": "SUCCESS", "message": f"Service restarted on {node.name}"}
 
-    elif action_type == "restart_node":
-        network_sim.update_node_status(target_node_id, NodeStatus.MAINTENANCE)
-        network_sim.update_node_status(target_node_id, NodeStatus.HEALTHY)
-        return {"status": "SUCCESS", "message": f"Node {node.name} restarted"}
+def _restart_node(network_sim: "NetworkSimulator", node: Node, parameters: dict) -> dict:
+    """Restart a node; it passes through maintenance."""
+    network_sim.update_node_status(node.id, NodeStatus.MAINTENANCE)
+    network_sim.update_node_status(node.id, NodeStatus.HEALTHY)
+    return {"status": "SUCCESS", "message": f"Node {node.name} restarted"}
 
-    elif action_type == "failover":
-        return {"status": "SUCCESS", "message": f"Failover initiated for {node.name}"}
 
-    elif action_type == "clear_cache":
-        return {"status": "SUCCESS", "message": f"Cache cleared on {node.name}"}
+def _failover(network_sim: "NetworkSimulator", node: Node, parameters: dict) -> dict:
+    """Fail traffic over away from a node."""
+    return {"status": "SUCCESS", "message": f"Failover initiated for {node.name}"}
 
-    elif action_type == "rate_limit":
-        return {"status": "SUCCESS", "message": f"Rate limiting applied to {node.name}"}
 
-    else:
+def _clear_cache(network_sim: "NetworkSimulator", node: Node, parameters: dict) -> dict:
+    """Clear caches on a node."""
+    return {"status": "SUCCESS", "message": f"Cache cleared on {node.name}"}
+
+
+def _rate_limit(network_sim: "NetworkSimulator", node: Node, parameters: dict) -> dict:
+    """Apply rate limiting to a node."""
+    return {"status": "SUCCESS", "message": f"Rate limiting applied to {node.name}"}
+
+
+# Action type -> simulated effect; other action types only report success
+_ACTION_HANDLERS: dict[str, Callable[["NetworkSimulator", Node, dict], dict]] = {
+    "restart_service": _restart_service,
+    "restart_node": _restart_node,
+    "failover": _failover,
+    "clear_cache": _clear_cache,
+    "rate_limit": _rate_limit,
+}
+
+
+async def _simulate_action(network_sim: "NetworkSimulator", action_type: str, node: Node,
+                           parameters: dict) -> dict:
+    """Simulate action execution on an already looked-up node."""
+    handler = _ACTION_HANDLERS.get(action_type)
+    if handler is None:
         return {"status": "SUCCESS", "message": f"Action {action_type} executed on {node.name}"}
+    return handler(network_sim, node, parameters)
 
 
 async def handle_get_execution_status(arguments: dict[str, Any]) -> list[TextContent]:
     """Get execution status."""
     execution_id = arguments.get("execution_id")
 
-    for record in reversed(_execution_history):
-        if record.get("execution_id") == execution_id:
-            return [TextContent(type="text", text=json.dumps(record, indent=2))]
+    record = _execution_index.get(execution_id)
+    if record is not None:
+        return [TextContent(type="text", text=_dumps(record))]
 
-    return [TextContent(type="text", text=json.dumps({"error": f"Execution '{execution_id}' not found"}, indent=2))]
+    return [TextContent(type="text", text=_dumps({"error": f"Execution '{execution_id}' not found"}))]
 
 
 async def handle_get_execution_history(arguments: dict[str, Any]) -> list[TextContent]:
     """Get execution history."""
     node_id = arguments.get("node_id")
+    action_type = arguments.get("action_type")
     limit = arguments.get("limit", 50)
 
-    filtered = _execution_history.copy()
+    # Start from the narrowest index; .get() so unknown keys do not create entries
     if node_id:
-        filtered = [r for r in filtered if r.get("target_node_id") == node_id]
+        records = reversed(_history_by_node.get(node_id, ()))
+        if action_type:
+            records = (r for r in records if r["action_type"] == action_type)
+    elif action_type:
+        records = reversed(_history_by_action.get(action_type, ()))
+    else:
+        records = reversed(_execution_history)
 
-    filtered = list(reversed(filtered))[:limit]
+    filtered = list(islice(records, limit))
 
-    return [TextContent(type="text", text=json.dumps({"total": len(filtered), "executions": filtered}, indent=2))]
\ No newline at end of file
+    return [TextContent(type="text", text=_dumps({"total": len(filtered), "executions": filtered}))]
\ No newline at end of file
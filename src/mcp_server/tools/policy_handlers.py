@@ -4,7 +4,6 @@ Policy Tool Handlers
 MCP tools for policy management and evaluation.
 """
 
-import json
 from typing import Any, Optional
 from datetime import datetime
 
@@ -12,6 +11,7 @@ from mcp.types import Tool, TextContent
 
 from src.knowledge_graph.client import Neo4jClient
 from src.knowledge_graph.policies import PolicyManager
+from src.mcp_server._json import dumps as _dumps
 from src.mcp_server.config import config
 
 _policy_manager: Optional[PolicyManager] = None
@@ -177,14 +177,14 @@ async def handle_get_policies(arguments: dict[str, Any]) -> list[TextContent]:
     else:
         policies = policy_mgr.get_all_policies(PolicyStatus.ACTIVE)
 
-    return [TextContent(type="text", text=json.dumps({
+    return [TextContent(type="text", text=_dumps({
         "total_policies": len(policies),
         "policies": [
             {"id": p.id, "name": p.name, "type": p.policy_type.value, "status": p.status.value, "priority": p.priority,
              "description": p.description}
             for p in policies
         ]
-    }, indent=2))]
+    }))]
 
 
 async def handle_get_policy_details(arguments: dict[str, Any]) -> list[TextContent]:
@@ -194,9 +194,9 @@ async def handle_get_policy_details(arguments: dict[str, Any]) -> list[TextConte
 
     policy = policy_mgr.get_policy(policy_id)
     if not policy:
-        return [TextContent(type="text", text=json.dumps({"error": f"Policy '{policy_id}' not found"}, indent=2))]
+        return [TextContent(type="text", text=_dumps({"error": f"Policy '{policy_id}' not found"}))]
 
-    return [TextContent(type="text", text=json.dumps({
+    return [TextContent(type="text", text=_dumps({
         "id": policy.id,
         "name": policy.name,
         "description": policy.description,
@@ -208,7 +208,7 @@ async def handle_get_policy_details(arguments: dict[str, Any]) -> list[TextConte
                     policy.actions],
         "applies_to_node_types": policy.applies_to_node_types or ["all"],
         "tags": policy.tags,
-    }, indent=2))]
+    }))]
 
 
 async def handle_evaluate_policies(arguments: dict[str, Any]) -> list[TextContent]:
@@ -241,14 +241,14 @@ async def handle_evaluate_policies(arguments: dict[str, Any]) -> list[TextConten
                 "parameters": action.parameters,
             })
 
-    return [TextContent(type="text", text=json.dumps({
+    return [TextContent(type="text", text=_dumps({
         "context": context,
         "matched_policies": [
             {"policy_id": r.policy_id, "policy_name": r.policy_name, "conditions_met": r.conditions_met} for r in
             matched],
         "matched_count": len(matched),
         "recommended_actions": all_actions,
-    }, indent=2))]
+    }))]
 
 
 async def handle_validate_action(arguments: dict[str, Any]) -> list[TextContent]:
@@ -288,11 +288,11 @@ async def handle_validate_action(arguments: dict[str, Any]) -> list[TextContent]
 
     approved = len(violations) == 0
 
-    return [TextContent(type="text", text=json.dumps({
+    return [TextContent(type="text", text=_dumps({
         "action": {"type": action_type, "target_node_id": target_node_id, "reason": reason},
         "validation_result": {"approved": approved, "status": "APPROVED" if approved else "DENIED",
                               "violations": violations, "warnings": warnings},
-    }, indent=2))]
+    }))]
 
 
 async def handle_get_compliance_rules(arguments: dict[str, Any]) -> list[TextContent]:
@@ -302,8 +302,8 @@ async def handle_get_compliance_rules(arguments: dict[str, Any]) -> list[TextCon
 
     rules = policy_mgr.get_compliance_rules(regulation)
 
-    return [TextContent(type="text", text=json.dumps({
+    return [TextContent(type="text", text=_dumps({
         "total_rules": len(rules),
         "rules": [{"id": r.id, "name": r.name, "regulation": r.regulation, "check_type": r.check_type,
                    "enforcement": r.enforcement} for r in rules]
-    }, indent=2))]
\ No newline at end of file
+    }))]
\ No newline at end of file
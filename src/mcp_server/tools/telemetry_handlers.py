@@ -4,37 +4,17 @@ Telemetry Tool Handlers
 MCP tools for accessing network telemetry and logs.
 """
 
-import json
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any
 
 from mcp.types import Tool, TextContent
 
-from src.simulator.network_sim import NetworkSimulator
-from src.simulator.log_generator import LogGenerator
-from src.simulator.telemetry_generator import TelemetryGenerator
-from src.simulator.anomaly_injector import AnomalyInjector
+from src.mcp_server._json import dumps as _dumps
+from src.mcp_server.tools._components import get_components as _get_components
 from src.models.network import MetricType
 
-# Global instances (initialized lazily)
-_network_sim: Optional[NetworkSimulator] = None
-_log_generator: Optional[LogGenerator] = None
-_telemetry_generator: Optional[TelemetryGenerator] = None
-_anomaly_injector: Optional[AnomalyInjector] = None
-
-
-def _get_components():
-    """Get or initialize simulator components."""
-    global _network_sim, _log_generator, _telemetry_generator, _anomaly_injector
-
-    if _network_sim is None:
-        _network_sim = NetworkSimulator()
-        _network_sim.create_default_topology()
-        _log_generator = LogGenerator(_network_sim)
-        _telemetry_generator = TelemetryGenerator(_network_sim)
-        _anomaly_injector = AnomalyInjector(_network_sim, _telemetry_generator, _log_generator)
-
-    return _network_sim, _log_generator, _telemetry_generator, _anomaly_injector
+# Anomaly severity value -> rank, for minimum-severity filters
+_SEVERITY_RANK = {"low": 0, "medium": 1, "high": 2, "critical": 3}
 
 
 def get_tools() -> list[Tool]:
@@ -158,7 +138,7 @@ async def handle_get_network_logs(arguments: dict[str, Any]) -> list[TextContent
     if node_id:
         node = network_sim.get_node(node_id)
         if not node:
-            return [TextContent(type="text", text=json.dumps({"error": f"Node '{node_id}' not found"}, indent=2))]
+            return [TextContent(type="text", text=_dumps({"error": f"Node '{node_id}' not found"}))]
         nodes = [node]
     else:
         nodes = network_sim.get_all_nodes()
@@ -182,11 +162,11 @@ async def handle_get_network_logs(arguments: dict[str, Any]) -> list[TextContent
         for log in logs[-count:]
     ]
 
-    return [TextContent(type="text", text=json.dumps({
+    return [TextContent(type="text", text=_dumps({
         "total_logs": len(log_entries),
         "time_range_minutes": time_range,
         "logs": log_entries
-    }, indent=2))]
+    }))]
 
 
 async def handle_get_node_metrics(arguments: dict[str, Any]) -> list[TextContent]:
@@ -203,7 +183,7 @@ async def handle_get_node_metrics(arguments: dict[str, Any]) -> list[TextContent
     if node_id:
         node = network_sim.get_node(node_id)
         if not node:
-            return [TextContent(type="text", text=json.dumps({"error": f"Node '{node_id}' not found"}, indent=2))]
+            return [TextContent(type="text", text=_dumps({"error": f"Node '{node_id}' not found"}))]
         snapshots = [tel_gen.generate_snapshot(node, metric_types=selected_metrics)]
     else:
         snapshots = tel_gen.generate_all_snapshots()
@@ -223,11 +203,11 @@ async def handle_get_node_metrics(arguments: dict[str, Any]) -> list[TextContent
             "metrics": metrics
         })
 
-    return [TextContent(type="text", text=json.dumps({
+    return [TextContent(type="text", text=_dumps({
         "node_count": len(nodes_data),
         "timestamp": datetime.utcnow().isoformat(),
         "nodes": nodes_data
-    }, indent=2))]
+    }))]
 
 
 async def handle_get_metric_history(arguments: dict[str, Any]) -> list[TextContent]:
@@ -240,7 +220,7 @@ async def handle_get_metric_history(arguments: dict[str, Any]) -> list[TextConte
 
     node = network_sim.get_node(node_id)
     if not node:
-        return [TextContent(type="text", text=json.dumps({"error": f"Node '{node_id}' not found"}, indent=2))]
+        return [TextContent(type="text", text=_dumps({"error": f"Node '{node_id}' not found"}))]
 
     metric_type = MetricType(metric_type_str)
     timeseries = tel_gen.generate_timeseries(node, duration_minutes=duration, interval_seconds=60,
@@ -253,7 +233,7 @@ async def handle_get_metric_history(arguments: dict[str, Any]) -> list[TextConte
             data_points.append(
                 {"timestamp": snapshot.timestamp.isoformat(), "value": metric.value, "unit": metric.unit})
 
-    return [TextContent(type="text", text=json.dumps({
+    return [TextContent(type="text", text=_dumps({
         "node_id": node_id,
         "metric_type": metric_type_str,
         "data_points": data_points,
@@ -262,7 +242,7 @@ async def handle_get_metric_history(arguments: dict[str, Any]) -> list[TextConte
             "max": max(d["value"] for d in data_points) if data_points else None,
             "avg": sum(d["value"] for d in data_points) / len(data_points) if data_points else None,
         }
-    }, indent=2))]
+    }))]
 
 
 async def handle_get_alerts(arguments: dict[str, Any]) -> list[TextContent]:
@@ -272,17 +252,18 @@ async def handle_get_alerts(arguments: dict[str, Any]) -> list[TextContent]:
     severity_filter = arguments.get("severity")
     node_filter = arguments.get("node_id")
 
-    anomalies = anomaly_inj.get_active_anomalies()
+    it = iter(anomaly_inj.get_active_anomalies())
 
     if severity_filter:
-        severity_order = ["low", "medium", "high", "critical"]
-        min_idx = severity_order.index(severity_filter)
-        anomalies = [a for a in anomalies if severity_order.index(a.severity.value) >= min_idx]
+        min_rank = _SEVERITY_RANK[severity_filter]
+        it = (a for a in it if _SEVERITY_RANK[a.severity.value] >= min_rank)
 
     if node_filter:
-        anomalies = [a for a in anomalies if a.node_id == node_filter]
+        it = (a for a in it if a.node_id == node_filter)
+
+    anomalies = list(it)
 
-    return [TextContent(type="text", text=json.dumps({
+    return [TextContent(type="text", text=_dumps({
         "total_alerts": len(anomalies),
         "timestamp": datetime.utcnow().isoformat(),
         "alerts": [
@@ -292,8 +273,8 @@ async def handle_get_alerts(arguments: dict[str, Any]) -> list[TextContent]:
                 "severity": a.severity.value,
                 "node_id": a.node_id,
                 "description": a.description,
-                "started_at": a.started_at.isoformat(),
+                "started_at": a.started_at_iso,
             }
             for a in anomalies
         ]
-    }, indent=2))]
\ No newline at end of file
+    }))]
\ No newline at end of file
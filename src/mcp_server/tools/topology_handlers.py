@@ -4,31 +4,46 @@ Topology Tool Handlers
 MCP tools for querying network topology.
 """
 
-import json
+import asyncio
+from contextlib import suppress
 from typing import Any, Optional
 
 from mcp.types import Tool, TextContent
 
-from src.knowledge_graph.client import Neo4jClient
-from src.knowledge_graph.topology import TopologyManager
+from src.knowledge_graph.client import AsyncNeo4jClient
+from src.knowledge_graph.topology import AsyncTopologyManager
+from src.mcp_server._json import dumps as _dumps
 from src.mcp_server.config import config
+from src.models.network import Link, Node, NodeType
 
-_topology_manager: Optional[TopologyManager] = None
+_topology_manager: Optional[AsyncTopologyManager] = None
+_topology_loop: Optional[asyncio.AbstractEventLoop] = None
 
 
-def _get_topology_manager() -> TopologyManager:
-    """Get or initialize topology manager."""
-    global _topology_manager
+async def _get_topology_manager() -> AsyncTopologyManager:
+    """Get or initialize topology manager for the running event loop."""
+    global _topology_manager, _topology_loop
 
-    if _topology_manager is None:
-        client = Neo4jClient(
+    # Async driver connections belong to the loop that opened them, so a new
+    # loop (e.g. a later asyncio.run() in the same process) gets its own client
+    loop = asyncio.get_running_loop()
+    if _topology_manager is None or _topology_loop is not loop:
+        if _topology_manager is not None:
+            # Release the previous loop's driver and pool before replacing it;
+            # if that loop is already closed its sockets can't be shut down cleanly
+            with suppress(Exception):
+                await _topology_manager.client.close()
+            _topology_manager = None
+
+        client = AsyncNeo4jClient(
             uri=config.neo4j_uri,
             user=config.neo4j_user,
             password=config.neo4j_password,
             database=config.neo4j_database,
         )
         client.connect()
-        _topology_manager = TopologyManager(client)
+        _topology_manager = AsyncTopologyManager(client)
+        _topology_loop = loop
 
     return _topology_manager
 
@@ -145,136 +160,145 @@ def get_handlers() -> dict:
     }
 
 
+def _node_row(n: Node) -> dict[str, Any]:
+    """Project a node to the fields listed by get_network_topology."""
+    return {"id": n.id, "name": n.name, "type": n.type.value, "ip_address": n.ip_address, "status": n.status.value,
+            "location": n.location}
+
+
+def _link_row(link: Link) -> dict[str, Any]:
+    """Project a link to the fields listed by get_network_topology."""
+    return {"source": link.source_node_id, "target": link.target_node_id, "bandwidth_mbps": link.bandwidth_mbps,
+            "status": link.status}
+
+
 async def handle_get_network_topology(arguments: dict[str, Any]) -> list[TextContent]:
     """Get network topology."""
-    topo_mgr = _get_topology_manager()
+    topo_mgr = await _get_topology_manager()
 
     include_links = arguments.get("include_links", True)
     node_type_filter = arguments.get("node_type")
 
-    summary = topo_mgr.get_topology_summary()
+    # Rows are projected as the driver streams records, so the full Node
+    # list is never held alongside the JSON-ready rows
+    async def collect_nodes() -> list[dict[str, Any]]:
+        if node_type_filter:
+            return [_node_row(n) for n in await topo_mgr.get_nodes_by_type(NodeType(node_type_filter))]
+        return [_node_row(n) async for n in topo_mgr.iter_all_nodes()]
+
+    async def collect_links() -> list[dict[str, Any]]:
+        return [_link_row(link) async for link in topo_mgr.iter_all_links()]
 
-    if node_type_filter:
-        from src.models.network import NodeType
-        nodes = topo_mgr.get_nodes_by_type(NodeType(node_type_filter))
+    # The queries are independent, so their round trips overlap
+    if include_links:
+        summary, nodes, links = await asyncio.gather(
+            topo_mgr.get_topology_summary(), collect_nodes(), collect_links()
+        )
     else:
-        nodes = topo_mgr.get_all_nodes()
-
-    result = {
-        "summary": summary,
-        "nodes": [
-            {"id": n.id, "name": n.name, "type": n.type.value, "ip_address": n.ip_address, "status": n.status.value,
-             "location": n.location}
-            for n in nodes
-        ],
-    }
+        summary, nodes = await asyncio.gather(topo_mgr.get_topology_summary(), collect_nodes())
+
+    result = {"summary": summary, "nodes": nodes}
 
     if include_links:
-        links = topo_mgr.get_all_links()
-        result["links"] = [
-            {"source": l.source_node_id, "target": l.target_node_id, "bandwidth_mbps": l.bandwidth_mbps,
-             "status": l.status}
-            for l in links
-        ]
+        result["links"] = links
 
-    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+    return [TextContent(type="text", text=_dumps(result))]
 
 
 async def handle_get_node_details(arguments: dict[str, Any]) -> list[TextContent]:
     """Get node details."""
-    topo_mgr = _get_topology_manager()
+    topo_mgr = await _get_topology_manager()
     node_id = arguments.get("node_id")
 
-    node = topo_mgr.get_node(node_id)
+    node = await topo_mgr.get_node(node_id)
     if not node:
-        return [TextContent(type="text", text=json.dumps({"error": f"Node '{node_id}' not found"}, indent=2))]
+        return [TextContent(type="text", text=_dumps({"error": f"Node '{node_id}' not found"}))]
 
-    connected = topo_mgr.get_connected_nodes(node_id)
+    connected = await topo_mgr.get_connected_nodes(node_id)
 
-    return [TextContent(type="text", text=json.dumps({
+    return [TextContent(type="text", text=_dumps({
         "node": {"id": node.id, "name": node.name, "type": node.type.value, "ip_address": node.ip_address,
                  "status": node.status.value, "vendor": node.vendor, "model": node.model},
         "connections": [{"id": c.id, "name": c.name, "type": c.type.value} for c in connected],
         "connection_count": len(connected),
-    }, indent=2))]
+    }))]
 
 
 async def handle_get_connected_nodes(arguments: dict[str, Any]) -> list[TextContent]:
     """Get connected nodes."""
-    topo_mgr = _get_topology_manager()
+    topo_mgr = await _get_topology_manager()
     node_id = arguments.get("node_id")
     direction = arguments.get("direction", "all")
 
-    node = topo_mgr.get_node(node_id)
+    node = await topo_mgr.get_node(node_id)
     if not node:
-        return [TextContent(type="text", text=json.dumps({"error": f"Node '{node_id}' not found"}, indent=2))]
+        return [TextContent(type="text", text=_dumps({"error": f"Node '{node_id}' not found"}))]
 
     if direction == "upstream":
-        connected = topo_mgr.get_upstream_nodes(node_id)
+        connected = await topo_mgr.get_upstream_nodes(node_id)
     elif direction == "downstream":
-        connected = topo_mgr.get_downstream_nodes(node_id)
+        connected = await topo_mgr.get_downstream_nodes(node_id)
     else:
-        connected = topo_mgr.get_connected_nodes(node_id)
+        connected = await topo_mgr.get_connected_nodes(node_id)
 
-    return [TextContent(type="text", text=json.dumps({
+    return [TextContent(type="text", text=_dumps({
         "node_id": node_id,
         "direction": direction,
         "connected_nodes": [{"id": c.id, "name": c.name, "type": c.type.value, "status": c.status.value} for c in
                             connected],
-    }, indent=2))]
+    }))]
 
 
 async def handle_find_network_path(arguments: dict[str, Any]) -> list[TextContent]:
     """Find network path."""
-    topo_mgr = _get_topology_manager()
+    topo_mgr = await _get_topology_manager()
     source_id = arguments.get("source_node_id")
     target_id = arguments.get("target_node_id")
 
-    source = topo_mgr.get_node(source_id)
+    source = await topo_mgr.get_node(source_id)
     if not source:
-        return [TextContent(type="text", text=json.dumps({"error": f"Source node '{source_id}' not found"}, indent=2))]
+        return [TextContent(type="text", text=_dumps({"error": f"Source node '{source_id}' not found"}))]
 
-    target = topo_mgr.get_node(target_id)
+    target = await topo_mgr.get_node(target_id)
     if not target:
-        return [TextContent(type="text", text=json.dumps({"error": f"Target node '{target_id}' not found"}, indent=2))]
+        return [TextContent(type="text", text=_dumps({"error": f"Target node '{target_id}' not found"}))]
 
-    path = topo_mgr.find_path(source_id, target_id)
+    path = await topo_mgr.find_path(source_id, target_id)
 
     if not path:
         return [TextContent(type="text",
-                            text=json.dumps({"source": source_id, "target": target_id, "path_found": False}, indent=2))]
+                            text=_dumps({"source": source_id, "target": target_id, "path_found": False}))]
 
-    return [TextContent(type="text", text=json.dumps({
+    return [TextContent(type="text", text=_dumps({
         "source": source_id,
         "target": target_id,
         "path_found": True,
         "hop_count": len(path) - 1,
         "path": [{"hop": i, "node_id": n.id, "node_name": n.name, "type": n.type.value} for i, n in enumerate(path)]
-    }, indent=2))]
+    }))]
 
 
 async def handle_get_critical_nodes(arguments: dict[str, Any]) -> list[TextContent]:
     """Get critical nodes."""
-    topo_mgr = _get_topology_manager()
-    critical = topo_mgr.get_critical_nodes()
+    topo_mgr = await _get_topology_manager()
+    critical = await topo_mgr.get_critical_nodes()
 
-    return [TextContent(type="text", text=json.dumps({
+    return [TextContent(type="text", text=_dumps({
         "critical_node_count": len(critical),
         "critical_nodes": [{"id": n.id, "name": n.name, "type": n.type.value, "status": n.status.value} for n in
                            critical]
-    }, indent=2))]
+    }))]
 
 
 async def handle_get_node_impact(arguments: dict[str, Any]) -> list[TextContent]:
     """Analyze node impact."""
-    topo_mgr = _get_topology_manager()
+    topo_mgr = await _get_topology_manager()
     node_id = arguments.get("node_id")
 
-    node = topo_mgr.get_node(node_id)
+    # The node and its dependents come back from one query
+    node, dependencies = await topo_mgr.get_node_with_dependencies(node_id)
     if not node:
-        return [TextContent(type="text", text=json.dumps({"error": f"Node '{node_id}' not found"}, indent=2))]
-
-    dependencies = topo_mgr.get_node_dependencies(node_id)
+        return [TextContent(type="text", text=_dumps({"error": f"Node '{node_id}' not found"}))]
 
     by_type = {}
     for dep in dependencies:
@@ -283,11 +307,11 @@ async def handle_get_node_impact(arguments: dict[str, Any]) -> list[TextContent]
             by_type[type_name] = []
         by_type[type_name].append({"id": dep.id, "name": dep.name})
 
-    return [TextContent(type="text", text=json.dumps({
+    return [TextContent(type="text", text=_dumps({
         "node_id": node_id,
         "node_name": node.name,
         "total_affected_nodes": len(dependencies),
         "affected_by_type": by_type,
         "severity": "critical" if len(dependencies) > 5 else "high" if len(
             dependencies) > 2 else "medium" if dependencies else "low"
-    }, indent=2))]
\ No newline at end of file
+    }))]
\ No newline at end of file
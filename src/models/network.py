@@ -4,6 +4,7 @@ Network data models using Pydantic for type safety and validation.
 
 from datetime import datetime, timezone
 from enum import Enum
+from functools import cached_property
 from typing import Any, Optional
 from pydantic import BaseModel, Field
 import uuid
@@ -221,6 +222,11 @@ class Anomaly(BaseModel):
     affected_metrics: list[MetricType] = Field(default_factory=list)
     metadata: dict[str, Any] = Field(default_factory=dict)
     
+    @cached_property
+    def started_at_iso(self) -> str:
+        """ISO-8601 start time, formatted once per anomaly."""
+        return self.started_at.isoformat()
+    
     def end(self) -> None:
         """Mark the anomaly as ended."""
         self.is_active = False
@@ -5,8 +5,10 @@ Policy data models for the network automation system.
 from datetime import timezone
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 from pydantic import BaseModel, Field
+import operator
+import re
 import uuid
 
 
@@ -97,6 +99,59 @@ class Condition(BaseModel):
             return bool(re.match(self.value, str(field_value)))
         
         return False
+    
+    def compile_evaluator(self) -> Callable[[dict[str, Any]], bool]:
+        """
+        Build an evaluator specialized for this condition's operator and value.
+        
+        The returned function gives the same result as evaluate(), but operator
+        dispatch (and regex compilation) happens once here instead of on every
+        call. It captures the current field, operator and value.
+        
+        Returns:
+            Function taking a context dict and returning whether it matches
+        """
+        field = self.field
+        value = self.value
+        
+        if self.operator == ConditionOperator.REGEX:
+            try:
+                match = re.compile(value).match
+            except (re.error, TypeError):
+                # Keep the original behaviour of failing at evaluation time
+                def match(text: str) -> Optional[re.Match]:
+                    return re.match(value, text)
+            
+            def compare(field_value: Any, _: Any) -> bool:
+                return bool(match(str(field_value)))
+        else:
+            compare = _CONDITION_OPERATORS.get(self.operator)
+            if compare is None:
+                def never(context: dict[str, Any]) -> bool:
+                    return False
+                
+                return never
+        
+        def evaluator(context: dict[str, Any]) -> bool:
+            field_value = context.get(field)
+            return field_value is not None and compare(field_value, value)
+        
+        return evaluator
+
+
+# Comparison for each operator as (field_value, condition_value) -> bool
+_CONDITION_OPERATORS: dict[ConditionOperator, Callable[[Any, Any], bool]] = {
+    ConditionOperator.EQUALS: operator.eq,
+    ConditionOperator.NOT_EQUALS: operator.ne,
+    ConditionOperator.GREATER_THAN: operator.gt,
+    ConditionOperator.LESS_THAN: operator.lt,
+    ConditionOperator.GREATER_THAN_OR_EQUAL: operator.ge,
+    ConditionOperator.LESS_THAN_OR_EQUAL: operator.le,
+    ConditionOperator.CONTAINS: lambda field_value, value: value in field_value,
+    ConditionOperator.NOT_CONTAINS: lambda field_value, value: value not in field_value,
+    ConditionOperator.IN: lambda field_value, value: field_value in value,
+    ConditionOperator.NOT_IN: lambda field_value, value: field_value not in value,
+}
 
 
 class PolicyAction(BaseModel):
@@ -121,6 +121,14 @@ DEFAULT_BASELINE = {
     MetricType.TEMPERATURE: {"min": 30, "max": 50, "unit": "°C"},
 }
 
+# Status thresholds by metric: (critical above, warning above)
+STATUS_THRESHOLDS = {
+    MetricType.CPU_UTILIZATION: (95, 80),
+    MetricType.MEMORY_UTILIZATION: (95, 85),
+    MetricType.PACKET_LOSS: (5, 1),
+    MetricType.LATENCY: (100, 50),
+}
+
 
 class TelemetryGenerator:
     """
@@ -302,26 +310,14 @@ class TelemetryGenerator:
         warning_count = 0
 
         for metric in metrics:
-            if metric.metric_type == MetricType.CPU_UTILIZATION:
-                if metric.value > 95:
-                    critical_count += 1
-                elif metric.value > 80:
-                    warning_count += 1
-            elif metric.metric_type == MetricType. MEMORY_UTILIZATION:
-                if metric.value > 95:
-                    critical_count += 1
-                elif metric. value > 85:
-                    warning_count += 1
-            elif metric.metric_type == MetricType.PACKET_LOSS:
-                if metric.value > 5:
-                    critical_count += 1
-                elif metric.value > 1:
-                    warning_count += 1
-            elif metric.metric_type == MetricType. LATENCY:
-                if metric.value > 100:
-                    critical_count += 1
-                elif metric.value > 50:
-                    warning_count += 1
+            thresholds = STATUS_THRESHOLDS.get(metric.metric_type)
+            if thresholds is None:
+                continue
+            critical, warning = thresholds
+            if metric.value > critical:
+                critical_count += 1
+            elif metric.value > warning:
+                warning_count += 1
 
         if critical_count > 0:
             return NodeStatus. CRITICAL
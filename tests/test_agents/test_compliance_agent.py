@@ -1,7 +1,7 @@
 """Tests for the Compliance Agent."""
 
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from src.agents.compliance.agent import ComplianceAgent
 from src.agents.compliance.models import (
@@ -295,6 +295,30 @@ class TestComplianceChecker:
         assert violation is not None
         assert violation.violation_type == ViolationType.RATE_LIMIT_EXCEEDED
 
+    def test_rate_limit_check_mixed_timestamps(self, checker):
+        """Test rate limit check with offset-aware and naive UTC timestamps."""
+        action = RecommendedAction(
+            action_type="restart_service",
+            target_node_id="node_01",
+        )
+
+        now = datetime.now(timezone.utc)
+        recent_actions = [
+            {"target_node_id": "node_01", "completed_at": now.isoformat()}
+            for _ in range(6)
+        ] + [
+            {"target_node_id": "node_01", "completed_at": datetime.utcnow().isoformat()}
+            for _ in range(6)
+        ] + [
+            {"target_node_id": "node_01", "completed_at": (now - timedelta(hours=2)).isoformat()}
+            for _ in range(20)
+        ]
+
+        violation = checker.check_rate_limit(action, recent_actions)
+
+        assert violation is not None
+        assert "12 actions" in violation.reason
+
     def test_node_criticality_check(self, checker):
         """Test node criticality check for critical nodes."""
         action = RecommendedAction(action_type="restart_node")
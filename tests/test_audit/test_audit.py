@@ -1,5 +1,7 @@
 """Tests for the Audit system."""
 
+import hashlib
+import json
 import pytest
 from datetime import datetime
 
@@ -45,6 +47,16 @@ class TestAuditRecord:
         hash2 = record.compute_hash()
         assert hash1 == hash2
 
+    def test_compute_hash_matches_canonical_json(self):
+        """Test the hash covers the sorted-key JSON form of the content."""
+        record = AuditRecord(agent_name="test", details={"b": 1, "a": [1, 2]})
+
+        data = record.to_dict()
+        content = {k: data[k] for k in data if k not in ("metadata", "content_hash")}
+        expected = hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()
+
+        assert record.compute_hash() == expected
+
     def test_to_dict(self):
         """Test converting record to dictionary."""
         record = AuditRecord(
@@ -74,6 +86,16 @@ class TestAuditRecord:
         assert record.id == "audit_123"
         assert record.record_type == AuditRecordType.RESULT
 
+    def test_timestamp_round_trip(self):
+        """Test timestamps survive to_dict/from_dict unchanged."""
+        for ts in (datetime(2024, 1, 15, 10, 0, 0), datetime(2024, 1, 15, 10, 0, 0, 1234)):
+            record = AuditRecord(timestamp=ts)
+
+            data = record.to_dict()
+
+            assert data["timestamp"] == ts.isoformat()
+            assert AuditRecord.from_dict(data).timestamp == ts
+
 
 class TestIntentRecord:
     """Test cases for IntentRecord model."""
@@ -246,6 +268,22 @@ class TestAuditLogger:
         assert result["verified"] is True
         assert "record_id" in result
 
+    def test_make_intent_logger(self, logger):
+        """Test logging an intent through a pre-bound intent logger."""
+        log_intent = logger.make_intent_logger(agent_name="execution", approved_by="system")
+
+        result = log_intent(action_type="restart_service", target_node_id="router_core_01")
+
+        assert result["verified"] is True
+        stored = logger.get_record(result["key"], verify=False)["value"]
+        assert stored["agent_name"] == "execution"
+        assert stored["approved_by"] == "system"
+
+    def test_make_intent_logger_rejects_unknown_args(self, logger):
+        """Test that unknown frozen arguments are rejected up front."""
+        with pytest.raises(TypeError):
+            logger.make_intent_logger(not_an_arg=1)
+
     def test_log_result(self, logger):
         """Test logging a result."""
         result = logger.log_result(
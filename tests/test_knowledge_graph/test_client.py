@@ -0,0 +1,89 @@
+"""Tests for the Neo4j client."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+from neo4j.exceptions import ClientError, TransientError
+
+from src.knowledge_graph.client import Neo4jClient
+
+
+class TestNeo4jClient:
+    """Test cases for Neo4jClient."""
+
+    @pytest.fixture(autouse=True)
+    def mock_driver_factory(self):
+        """Patch driver creation and start from an empty driver registry."""
+        Neo4jClient._driver_registry.clear()
+        with patch("src.knowledge_graph.client.GraphDatabase.driver") as factory:
+            factory.side_effect = lambda *args, **kwargs: MagicMock()
+            yield factory
+        Neo4jClient._driver_registry.clear()
+
+    def test_clients_share_driver(self, mock_driver_factory):
+        """Test that clients for the same target share one driver."""
+        first = Neo4jClient("bolt://db:7687", "neo4j", "secret").connect()
+        second = Neo4jClient("bolt://db:7687", "neo4j", "secret").connect()
+
+        assert first.driver is second.driver
+        mock_driver_factory.assert_called_once()
+
+    def test_different_credentials_get_own_driver(self, mock_driver_factory):
+        """Test that different credentials do not share a driver."""
+        first = Neo4jClient("bolt://db:7687", "neo4j", "secret").connect()
+        second = Neo4jClient("bolt://db:7687", "neo4j", "other").connect()
+
+        assert first.driver is not second.driver
+        assert mock_driver_factory.call_count == 2
+
+    def test_driver_closed_by_last_client(self):
+        """Test that the shared driver is only closed when no client uses it."""
+        first = Neo4jClient("bolt://db:7687", "neo4j", "secret").connect()
+        second = Neo4jClient("bolt://db:7687", "neo4j", "secret").connect()
+        driver = first.driver
+
+        first.close()
+        driver.close.assert_not_called()
+
+        second.close()
+        driver.close.assert_called_once()
+        assert Neo4jClient._driver_registry == {}
+
+    def test_ensure_indexes_runs_once(self):
+        """Test that ensure_indexes only creates the schema the first time."""
+        client = Neo4jClient("bolt://db:7687", "neo4j", "secret").connect()
+
+        with patch.object(client, "execute_write") as execute_write:
+            client.ensure_indexes()
+            statements = execute_write.call_count
+            client.ensure_indexes()
+
+            assert statements > 0
+            assert execute_write.call_count == statements
+
+    def test_ensure_indexes_retries_after_failure(self):
+        """Test that a failed schema statement is raised and retried on the next call."""
+        client = Neo4jClient("bolt://db:7687", "neo4j", "secret").connect()
+        failures = [TransientError("lock timeout")]
+
+        def execute_write(query, parameters=None):
+            if "node_type " in query and failures:
+                raise failures.pop()
+            return []
+
+        with patch.object(client, "execute_write", side_effect=execute_write):
+            with pytest.raises(TransientError):
+                client.ensure_indexes()
+            client.ensure_indexes()
+
+        assert client._indexes_created is True
+
+    def test_create_indexes_ignores_existing_rules(self):
+        """Test that an equivalent existing index does not fail schema setup."""
+        client = Neo4jClient("bolt://db:7687", "neo4j", "secret").connect()
+        code = "Neo.ClientError.Schema.EquivalentSchemaRuleAlreadyExists"
+
+        with patch.object(ClientError, "code", code), \
+                patch.object(client, "execute_write", side_effect=ClientError("exists")):
+            client.create_indexes()
+
+        assert client._indexes_created is True
@@ -30,6 +30,8 @@ class TestPolicyManager:
         client = MagicMock(spec=Neo4jClient)
         client.execute_write = MagicMock(return_value=[{"p": {}}])
         client.execute_read = MagicMock(return_value=[])
+        client.execute_read_iter = MagicMock(return_value=iter([]))
+        client.execute_write_single = MagicMock(return_value=None)
         return client
     
     @pytest.fixture
@@ -73,7 +75,45 @@ class TestPolicyManager:
         """Test creating a policy."""
         result = policy_mgr.create_policy(sample_policy)
         
-        policy_mgr.client.execute_write.assert_called()
+        # Policy and APPLIES_TO edges are written in one round-trip
+        policy_mgr.client.execute_write.assert_called_once()
+        query, params = policy_mgr.client.execute_write.call_args[0]
+        assert "APPLIES_TO" in query
+        assert params["applies_to_node_types"] == ["router_core"]
+    
+    def test_create_policies_batches_writes(self, policy_mgr, mock_client, sample_policy):
+        """Test that many policies are written with a single UNWIND query."""
+        mock_client.execute_write.return_value = [{"id": "POL-TEST-001"}, {"id": "POL-TEST-002"}]
+        other = sample_policy.model_copy(update={"id": "POL-TEST-002"})
+        
+        count = policy_mgr.create_policies([sample_policy, other])
+        
+        assert count == 2
+        mock_client.execute_write.assert_called_once()
+        query, params = mock_client.execute_write.call_args[0]
+        assert "UNWIND $rows" in query
+        assert [row["id"] for row in params["rows"]] == ["POL-TEST-001", "POL-TEST-002"]
+    
+    def test_create_policies_empty(self, policy_mgr, mock_client):
+        """Test that an empty batch skips the database."""
+        assert policy_mgr.create_policies([]) == 0
+        mock_client.execute_write.assert_not_called()
+    
+    def test_load_policies_from_yaml_batches_compliance_rules(self, policy_mgr, mock_client, tmp_path):
+        """Test that compliance rules from YAML are written in one query."""
+        path = tmp_path / "rules.yaml"
+        path.write_text(
+            "compliance_rules:\n"
+            "  - id: COMP-1\n    name: Rule 1\n    regulation: SOX\n    check_type: audit\n"
+            "  - id: COMP-2\n    name: Rule 2\n    regulation: SOX\n    check_type: audit\n"
+        )
+        
+        policy_mgr.load_policies_from_yaml(str(path))
+        
+        mock_client.execute_write.assert_called_once()
+        query, params = mock_client.execute_write.call_args[0]
+        assert "ComplianceRule" in query
+        assert [row["id"] for row in params["rows"]] == ["COMP-1", "COMP-2"]
     
     def test_get_policy_found(self, policy_mgr, mock_client):
         """Test getting a policy that exists."""
@@ -109,6 +149,151 @@ class TestPolicyManager:
         assert policy.name == "Test Policy"
         assert len(policy.conditions) == 1
     
+    def test_policy_from_record_round_trip(self, policy_mgr, sample_policy):
+        """Test that stored policies decode to the same models without validation."""
+        record = policy_mgr._policy_parameters(sample_policy)
+        
+        policy = policy_mgr._policy_from_record(record)
+        
+        assert policy.conditions == sample_policy.conditions
+        assert policy.actions == sample_policy.actions
+        assert policy.conditions[0].operator is ConditionOperator.EQUALS
+        assert policy.actions[0].action_type is ActionType.RESTART_SERVICE
+        assert policy.model_dump(exclude={"created_at", "updated_at"}) == \
+            sample_policy.model_dump(exclude={"created_at", "updated_at"})
+    
+    def test_evaluate_policies_for_node_type_filters_active(self, policy_mgr, mock_client):
+        """Test node-type evaluation only fetches active policies."""
+        policy_mgr.evaluate_policies({"anomaly_type": "HIGH_CPU"}, node_type="router_core")
+        
+        query, params = mock_client.execute_read_iter.call_args[0]
+        assert params["node_type"] == "router_core"
+        assert params["status"] == "active"
+        assert "$weekday IN p.active_days" in query
+    
+    def test_get_policy_listing_condition_count(self, policy_mgr, mock_client):
+        """Test listing rows use the stored condition count when present."""
+        mock_client.execute_read.return_value = [
+            {"policy": {"id": "POL-1", "name": "A", "policy_type": "remediation",
+                        "priority": 10, "status": "active", "condition_count": 2,
+                        "conditions": None}},
+            {"policy": {"id": "POL-2", "name": "B", "policy_type": "remediation",
+                        "priority": 20, "status": "active", "condition_count": None,
+                        "conditions": '[{"field": "x"}]'}},
+        ]
+        
+        rows = policy_mgr.get_policy_listing(PolicyStatus.ACTIVE)
+        
+        assert [r["condition_count"] for r in rows] == [2, 1]
+        assert all("conditions" not in r for r in rows)
+        assert mock_client.execute_read.call_args[0][1] == {"status": "active"}
+    
+    def test_get_all_policies_cached_until_write(self, policy_mgr, mock_client):
+        """Test that policy lists are served from cache until a write."""
+        mock_client.execute_read.return_value = []
+        
+        policy_mgr.get_all_policies(PolicyStatus.ACTIVE)
+        reads = mock_client.execute_read.call_count
+        policy_mgr.get_all_policies(PolicyStatus.ACTIVE)
+        assert mock_client.execute_read.call_count == reads
+        
+        policy_mgr.update_policy_status("POL-1", PolicyStatus.INACTIVE)
+        policy_mgr.get_all_policies(PolicyStatus.ACTIVE)
+        assert mock_client.execute_read.call_count > reads
+    
+    def test_get_all_policies_reloads_when_version_changes(self, policy_mgr, mock_client):
+        """Test that changes made outside this manager are picked up."""
+        mock_client.execute_read.side_effect = [
+            [{"count": 0, "updated_at": None}],
+            [{"count": 1, "updated_at": "t1"}],
+        ]
+        mock_client.execute_read_iter.return_value = iter([])
+        policy_mgr.get_all_policies()
+        
+        mock_client.execute_read_iter.return_value = iter([])
+        policy_mgr._cache_checked_at = float("-inf")
+        policy_mgr.get_all_policies()
+        
+        # Version check plus a fresh policy query each time
+        assert mock_client.execute_read.call_count == 2
+        assert mock_client.execute_read_iter.call_count == 2
+    
+    def test_get_policies_for_node_type_uses_index(self, policy_mgr, sample_policy):
+        """Test that node type lookups are served from the cached policy list."""
+        catch_all = sample_policy.model_copy(update={
+            "id": "POL-TEST-000", "priority": 1, "applies_to_node_types": [],
+        })
+        server = sample_policy.model_copy(update={
+            "id": "POL-TEST-002", "applies_to_node_types": ["server"],
+        })
+        policy_mgr._fetch_all_policies = MagicMock(return_value=[catch_all, sample_policy, server])
+        
+        core = policy_mgr.get_policies_for_node_type("router_core")
+        servers = policy_mgr.get_policies_for_node_type("server")
+        
+        assert [p.id for p in core] == ["POL-TEST-000", "POL-TEST-001"]
+        assert [p.id for p in servers] == ["POL-TEST-000", "POL-TEST-002"]
+        policy_mgr._fetch_all_policies.assert_called_once()
+    
+    def test_get_matching_policies_single_fetch(self, policy_mgr, sample_policy):
+        """Test that matching policies are returned from one policy fetch."""
+        other = sample_policy.model_copy(update={"id": "POL-TEST-002", "conditions": [
+            Condition(field="anomaly_type", operator=ConditionOperator.EQUALS, value="HIGH_MEMORY"),
+        ]})
+        policy_mgr._fetch_active_policies_at = MagicMock(return_value=[sample_policy, other])
+        
+        matches = policy_mgr.get_matching_policies({"anomaly_type": "HIGH_CPU", "severity": "critical"})
+        
+        assert [p.id for p in matches] == ["POL-TEST-001"]
+        policy_mgr._fetch_active_policies_at.assert_called_once()
+    
+    def test_evaluate_policies_without_diagnostics(self, policy_mgr, sample_policy):
+        """Test that diagnostics can be skipped while keeping match results."""
+        policy_mgr._fetch_active_policies_at = MagicMock(return_value=[sample_policy])
+        context = {"anomaly_type": "HIGH_CPU", "severity": "critical"}
+        
+        full = policy_mgr.evaluate_policies(context)
+        fast = policy_mgr.evaluate_policies(context, collect_diagnostics=False)
+        
+        assert [r.matched for r in fast] == [r.matched for r in full] == [True]
+        assert full[0].conditions_met == [
+            "anomaly_type equals HIGH_CPU",
+            "severity in ['critical', 'high']",
+        ]
+        assert fast[0].conditions_met == [] and fast[0].conditions_not_met == []
+        assert fast[0].recommended_actions == sample_policy.actions
+    
+    def test_evaluate_policies_orders_matches_first(self, policy_mgr, sample_policy):
+        """Test that matched policies come first, each group in priority order."""
+        miss_high = sample_policy.model_copy(update={"id": "POL-MISS-1", "priority": 1, "conditions": [
+            Condition(field="anomaly_type", operator=ConditionOperator.EQUALS, value="HIGH_MEMORY"),
+        ]})
+        miss_low = miss_high.model_copy(update={"id": "POL-MISS-2", "priority": 50})
+        hit_low = sample_policy.model_copy(update={"id": "POL-HIT-2", "priority": 20})
+        policy_mgr._fetch_active_policies_at = MagicMock(
+            return_value=[miss_high, sample_policy, hit_low, miss_low]
+        )
+        
+        results = policy_mgr.evaluate_policies({"anomaly_type": "HIGH_CPU", "severity": "high"})
+        
+        assert [r.policy_id for r in results] == [
+            "POL-TEST-001", "POL-HIT-2", "POL-MISS-1", "POL-MISS-2",
+        ]
+    
+    def test_get_active_policies_at_drops_old_buckets(self, policy_mgr):
+        """Test that schedule buckets are cached and replaced when the hour changes."""
+        policy_mgr._fetch_active_policies_at = MagicMock(return_value=[])
+        monday_9 = datetime(2024, 1, 1, 9, 30, tzinfo=timezone.utc)
+        monday_10 = datetime(2024, 1, 1, 10, 5, tzinfo=timezone.utc)
+        
+        policy_mgr.get_active_policies_at(monday_9)
+        policy_mgr.get_active_policies_at(monday_9)
+        policy_mgr.get_active_policies_at(monday_10)
+        
+        assert policy_mgr._fetch_active_policies_at.call_args_list[0][0][:2] == (0, 9)
+        assert policy_mgr._fetch_active_policies_at.call_count == 2
+        assert list(policy_mgr._policy_cache) == [("active@0:10", None)]
+    
     def test_get_policy_not_found(self, policy_mgr, mock_client):
         """Test getting a policy that doesn't exist."""
         mock_client.execute_read.return_value = []
@@ -214,6 +399,25 @@ class TestPolicyManager:
         assert cond.evaluate({"message": "All good"}) is True
         assert cond.evaluate({"message": "An error occurred"}) is False
     
+    def test_compiled_condition_matches_evaluate(self):
+        """Test that compiled evaluators agree with Condition.evaluate."""
+        cases = [
+            (ConditionOperator.EQUALS, "critical", ["critical", "warning"]),
+            (ConditionOperator.NOT_EQUALS, "healthy", ["critical", "healthy"]),
+            (ConditionOperator.GREATER_THAN, 90, [95, 90]),
+            (ConditionOperator.LESS_THAN_OR_EQUAL, 50, [50, 51]),
+            (ConditionOperator.IN, ["router", "switch"], ["router", "server"]),
+            (ConditionOperator.NOT_CONTAINS, "error", ["All good", "An error"]),
+            (ConditionOperator.REGEX, r"^core-", ["core-rtr-01", "edge-01"]),
+        ]
+        
+        for op, value, samples in cases:
+            cond = Condition(field="f", operator=op, value=value)
+            evaluate = cond.compile_evaluator()
+            for sample in samples + [None]:
+                context = {} if sample is None else {"f": sample}
+                assert evaluate(context) == cond.evaluate(context), (op, sample)
+    
     def test_condition_missing_field(self):
         """Test condition with missing field returns False."""
         cond = Condition(field="missing", operator=ConditionOperator.EQUALS, value="test")
@@ -314,6 +518,23 @@ policies:
         finally:
             Path(temp_path). unlink()
     
+    def test_load_yaml_cached_reparses_on_change(self, tmp_path):
+        """Test that parsed YAML is reused until the file changes."""
+        import os
+        from src.knowledge_graph.policies import _load_yaml_cached
+        
+        path = tmp_path / "policies.yaml"
+        path.write_text("policies: []\n")
+        
+        first = _load_yaml_cached(path)
+        assert _load_yaml_cached(path) is first
+        
+        path.write_text("policies:\n  - id: POL-1\n")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        
+        assert _load_yaml_cached(path)["policies"] == [{"id": "POL-1"}]
+    
     def test_load_policies_file_not_found(self, policy_mgr):
         """Test loading from non-existent file."""
         with pytest.raises(FileNotFoundError):
@@ -321,33 +542,52 @@ policies:
     
     def test_get_policy_summary(self, policy_mgr, mock_client):
         """Test getting policy summary."""
-        mock_client.execute_read.return_value = [{
-            "total": 10,
-            "active": 8,
-            "types": ["remediation", "escalation", "compliance"],
-        }]
+        mock_client.execute_read.return_value = [
+            {"status": "active", "policy_type": "remediation", "count": 5},
+            {"status": "inactive", "policy_type": "remediation", "count": 2},
+            {"status": "active", "policy_type": "escalation", "count": 2},
+            {"status": "active", "policy_type": "compliance", "count": 1},
+        ]
         
         summary = policy_mgr.get_policy_summary()
         
         assert summary["total"] == 10
         assert summary["active"] == 8
-        assert "remediation" in summary["types"]
+        assert summary["types"] == ["remediation", "escalation", "compliance"]
+    
+    def test_get_policy_summary_empty(self, policy_mgr, mock_client):
+        """Test policy summary with no policies."""
+        mock_client.execute_read.return_value = []
+        
+        summary = policy_mgr.get_policy_summary()
+        
+        assert summary == {"total": 0, "active": 0, "types": []}
     
     def test_update_policy_status(self, policy_mgr, mock_client):
         """Test updating policy status."""
-        mock_client. execute_write.return_value = [{"p": {"id": "POL-001"}}]
+        mock_client.execute_write_single.return_value = {"id": "POL-001"}
         
         result = policy_mgr.update_policy_status("POL-001", PolicyStatus.INACTIVE)
         
         assert result is True
     
+    def test_update_policy_status_not_found(self, policy_mgr, mock_client):
+        """Test updating the status of a missing policy."""
+        assert policy_mgr.update_policy_status("POL-404", PolicyStatus.INACTIVE) is False
+    
     def test_delete_policy(self, policy_mgr, mock_client):
         """Test deleting a policy."""
-        mock_client.execute_write.return_value = [{"deleted": 1}]
+        mock_client.execute_write_summary.return_value.counters.nodes_deleted = 1
         
         result = policy_mgr.delete_policy("POL-001")
         
         assert result is True
+    
+    def test_delete_policy_not_found(self, policy_mgr, mock_client):
+        """Test deleting a policy that does not exist."""
+        mock_client.execute_write_summary.return_value.counters.nodes_deleted = 0
+        
+        assert policy_mgr.delete_policy("POL-404") is False
 
 
 class TestComplianceRule:
@@ -1,10 +1,10 @@
 """Tests for the topology manager."""
 
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from src.knowledge_graph.client import Neo4jClient
-from src.knowledge_graph.topology import TopologyManager
+from src.knowledge_graph.client import AsyncNeo4jClient, Neo4jClient
+from src.knowledge_graph.topology import AsyncTopologyManager, TopologyManager
 from src.simulator. network_sim import NetworkSimulator
 from src.models.network import Node, NodeType, NodeStatus, Link
 
@@ -20,6 +20,11 @@ class TestTopologyManager:
         # Default responses for different operations
         client.execute_write = MagicMock(side_effect=self._mock_execute_write)
         client.execute_read = MagicMock(return_value=[])
+        client.execute_write_single = MagicMock(
+            side_effect=lambda query, parameters=None: {"count": len((parameters or {}).get("rows", []))}
+        )
+        client.get_server_version = MagicMock(return_value=(5, 20))
+        client.execute_write_summary = MagicMock()
         return client
 
     def _mock_execute_write(self, query, parameters=None):
@@ -87,6 +92,17 @@ class TestTopologyManager:
         assert "id" in result
         topo_mgr. client.execute_write.assert_called_once()
 
+    def test_create_node_reuses_query(self, topo_mgr, mock_client, sample_node):
+        """Test that every create_node call passes the same query string."""
+        mock_client.execute_write.side_effect = None
+        mock_client.execute_write.return_value = [{"node": {"id": sample_node.id}}]
+
+        topo_mgr.create_node(sample_node)
+        topo_mgr.create_node(sample_node)
+
+        first, second = [c[0][0] for c in mock_client.execute_write.call_args_list]
+        assert first is second
+
     def test_get_node_found(self, topo_mgr, mock_client):
         """Test getting a node that exists."""
         mock_client.execute_read.return_value = [{
@@ -119,7 +135,7 @@ class TestTopologyManager:
 
     def test_get_all_nodes(self, topo_mgr, mock_client):
         """Test getting all nodes."""
-        mock_client.execute_read.return_value = [
+        mock_client.execute_read_iter.return_value = [
             {"n": {"id": "node1", "name": "Node 1", "type": "router_core", "ip_address": "10.0.0.1", "location": "dc1", "status": "healthy", "vendor": "Cisco", "model": "ASR", "interfaces": []}},
             {"n": {"id": "node2", "name": "Node 2", "type": "switch_access", "ip_address": "10.0.0.2", "location": "dc1", "status": "healthy", "vendor": "Juniper", "model": "QFX", "interfaces": []}},
         ]
@@ -132,19 +148,17 @@ class TestTopologyManager:
 
     def test_update_node_status(self, topo_mgr, mock_client):
         """Test updating node status."""
-        # Override the side_effect for this specific test
-        mock_client.execute_write.side_effect = None
-        mock_client.execute_write.return_value = [{"n": {"id": "node1"}}]
+        mock_client.execute_write_summary.return_value.counters.properties_set = 2
 
         result = topo_mgr.update_node_status("node1", NodeStatus. CRITICAL)
 
         assert result is True
-        mock_client. execute_write.assert_called_once()
+        mock_client.execute_write_summary.assert_called_once()
+        assert "RETURN" not in mock_client.execute_write_summary.call_args[0][0]
 
     def test_update_node_status_not_found(self, topo_mgr, mock_client):
         """Test updating status of non-existent node."""
-        mock_client.execute_write.side_effect = None
-        mock_client.execute_write.return_value = []
+        mock_client.execute_write_summary.return_value.counters.properties_set = 0
 
         result = topo_mgr.update_node_status("nonexistent", NodeStatus.CRITICAL)
 
@@ -168,10 +182,63 @@ class TestTopologyManager:
 
         result = topo_mgr.import_from_simulator(sim)
 
-        assert result["nodes"] > 0
-        assert result["links"] > 0
-        # Verify execute_write was called for nodes and links
-        assert mock_client.execute_write.call_count > 0
+        assert result["nodes"] == len(sim.get_all_nodes())
+        assert result["links"] == len(sim.topology.links)
+        # The missing-degree backfill, then one UNWIND batch for the nodes and one for the links
+        assert mock_client.execute_write_single.call_count == 3
+        mock_client.execute_write.assert_not_called()
+
+    def test_import_ensures_schema_first(self, topo_mgr, mock_client):
+        """Test that importing creates the indexes before writing."""
+        sim = NetworkSimulator()
+        sim.create_default_topology()
+
+        topo_mgr.import_from_simulator(sim)
+
+        first_call = mock_client.method_calls[0][0]
+        assert first_call == "ensure_indexes"
+
+    def test_bulk_create_nodes_batches(self, topo_mgr, mock_client, sample_node):
+        """Test that bulk node writes are split into batches."""
+        topo_mgr.batch_size = 2
+        nodes = [sample_node.model_copy(update={"id": f"node{i}"}) for i in range(5)]
+
+        written = topo_mgr.bulk_create_nodes(nodes)
+
+        assert written == 5
+        batches = [c[0][1]["rows"] for c in mock_client.execute_write_single.call_args_list]
+        assert [len(b) for b in batches] == [2, 2, 1]
+        assert batches[0][0]["id"] == "node0"
+        assert batches[0][0]["props"]["type"] == "router_core"
+
+    def test_bulk_create_nodes_concurrent_transactions(self, mock_client, sample_node):
+        """Test that newer servers import through CALL IN CONCURRENT TRANSACTIONS."""
+        mock_client.get_server_version.return_value = (5, 21)
+        mock_client.execute_query.return_value = [{"count": 3}]
+        topo_mgr = TopologyManager(mock_client, batch_size=2, concurrency=4)
+        nodes = [sample_node.model_copy(update={"id": f"node{i}"}) for i in range(3)]
+
+        written = topo_mgr.bulk_create_nodes(nodes)
+
+        assert written == 3
+        query, params = mock_client.execute_query.call_args[0]
+        assert "IN 4 CONCURRENT TRANSACTIONS OF 2 ROWS" in query
+        assert len(params["rows"]) == 3
+        mock_client.execute_write_single.assert_not_called()
+
+    def test_bulk_create_links_serial_transactions(self, mock_client):
+        """Test that link imports commit their batches one at a time."""
+        mock_client.get_server_version.return_value = (5, 21)
+        mock_client.execute_query.return_value = [{"count": 2}]
+        topo_mgr = TopologyManager(mock_client, batch_size=2, concurrency=4)
+        links = [Link(id=f"l{i}", source_node_id="node1", target_node_id=f"node{i + 2}") for i in range(2)]
+
+        written = topo_mgr.bulk_create_links(links)
+
+        assert written == 2
+        query = mock_client.execute_query.call_args[0][0]
+        assert "IN TRANSACTIONS OF 2 ROWS" in query
+        assert "CONCURRENT" not in query
 
     def test_import_from_empty_simulator(self, topo_mgr):
         """Test importing from simulator with no topology."""
@@ -265,6 +332,15 @@ class TestTopologyManager:
         assert summary["links"] == 10
         assert "router_core" in summary["types"]
 
+    def test_get_topology_summary_single_round_trip(self, topo_mgr, mock_client):
+        """Test that the summary aggregates run as subqueries of one query."""
+        topo_mgr.get_topology_summary()
+
+        query = mock_client.execute_read.call_args[0][0]
+        mock_client.execute_read.assert_called_once()
+        assert query.count("CALL {") == 4
+        assert "collect(DISTINCT" not in query
+
     def test_get_topology_summary_empty(self, topo_mgr, mock_client):
         """Test getting topology summary when empty."""
         mock_client.execute_read.return_value = []
@@ -276,8 +352,7 @@ class TestTopologyManager:
 
     def test_delete_node(self, topo_mgr, mock_client):
         """Test deleting a node."""
-        mock_client. execute_write.side_effect = None
-        mock_client. execute_write.return_value = [{"deleted": 1}]
+        mock_client.execute_write_summary.return_value.counters.nodes_deleted = 1
 
         result = topo_mgr.delete_node("router_core_01")
 
@@ -285,8 +360,7 @@ class TestTopologyManager:
 
     def test_delete_node_not_found(self, topo_mgr, mock_client):
         """Test deleting a node that doesn't exist."""
-        mock_client.execute_write. side_effect = None
-        mock_client.execute_write. return_value = [{"deleted": 0}]
+        mock_client.execute_write_summary.return_value.counters.nodes_deleted = 0
 
         result = topo_mgr.delete_node("nonexistent")
 
@@ -370,10 +444,19 @@ class TestTopologyManager:
 
         assert len(deps) == 2
 
+    def test_get_node_dependencies_bounded(self, topo_mgr, mock_client):
+        """Test that the dependency traversal is depth-bounded and excludes the node."""
+        topo_mgr.get_node_dependencies("router_core_01", max_depth=3)
+        topo_mgr.get_node_dependencies("router_core_01", max_depth=1000)
+
+        (shallow, _), (deep, _) = [c[0] for c in mock_client.execute_read.call_args_list]
+        assert "[:CONNECTS_TO*1..3]" in shallow
+        assert f"[:CONNECTS_TO*1..{TopologyManager.MAX_PATH_HOPS}]" in deep
+        assert "WHERE dependent <> n" in shallow
+
     def test_update_link_status(self, topo_mgr, mock_client):
         """Test updating link status."""
-        mock_client.execute_write.side_effect = None
-        mock_client.execute_write.return_value = [{"r": {"id": "link1"}}]
+        mock_client.execute_write_summary.return_value.counters.properties_set = 1
 
         result = topo_mgr. update_link_status("node1", "node2", "down")
 
@@ -381,8 +464,7 @@ class TestTopologyManager:
 
     def test_update_link_status_not_found(self, topo_mgr, mock_client):
         """Test updating status of non-existent link."""
-        mock_client.execute_write.side_effect = None
-        mock_client.execute_write.return_value = []
+        mock_client.execute_write_summary.return_value.counters.properties_set = 0
 
         result = topo_mgr.update_link_status("node1", "nonexistent", "down")
 
@@ -390,7 +472,7 @@ class TestTopologyManager:
 
     def test_get_all_links(self, topo_mgr, mock_client):
         """Test getting all links."""
-        mock_client.execute_read.return_value = [
+        mock_client.execute_read_iter.return_value = [
             {
                 "r": {"id": "link1", "source_interface": "eth0", "target_interface": "eth1", "bandwidth_mbps": 10000, "latency_ms": 0.5, "status": "up"},
                 "source_id": "node1",
@@ -407,4 +489,375 @@ class TestTopologyManager:
 
         assert len(links) == 2
         assert links[0].source_node_id == "node1"
-        assert links[1].source_node_id == "node2"
\ No newline at end of file
+        assert links[1].source_node_id == "node2"
+
+    def test_get_topology_bundle(self, topo_mgr, mock_client):
+        """Test getting nodes, links and summary in one query."""
+        mock_client.execute_read.return_value = [{
+            "nodes": [
+                {"id": "node1", "name": "Node 1", "type": "router_core", "ip_address": "10.0.0.1", "location": "dc1", "status": "healthy", "vendor": "Cisco", "model": "ASR", "interfaces": []},
+                {"id": "node2", "name": "Node 2", "type": "server", "ip_address": "10.0.0.2", "location": "dc2", "status": "healthy", "vendor": "Dell", "model": "R750", "interfaces": []},
+            ],
+            "links": [
+                {"link": {"id": "link1", "status": "up"}, "source_id": "node1", "target_id": "node2"},
+            ],
+        }]
+
+        bundle = topo_mgr.get_topology_bundle()
+
+        assert [n.id for n in bundle["nodes"]] == ["node1", "node2"]
+        assert bundle["links"][0].target_node_id == "node2"
+        assert bundle["summary"] == {
+            "nodes": 2,
+            "links": 1,
+            "types": ["router_core", "server"],
+            "locations": ["dc1", "dc2"],
+        }
+        mock_client.execute_read.assert_called_once()
+
+    def test_find_path_clamps_max_hops(self, topo_mgr, mock_client):
+        """Test that path expansion depth is bounded."""
+        mock_client.execute_read.return_value = []
+
+        topo_mgr.find_path("node1", "node2", max_hops=1000)
+
+        query, params = mock_client.execute_read.call_args[0]
+        assert f"*1..{TopologyManager.MAX_PATH_HOPS}]" in query
+        assert params["max_hops"] == TopologyManager.MAX_PATH_HOPS
+
+    def test_find_path_shares_query_across_hop_limits(self, topo_mgr, mock_client):
+        """Test that the hop limit is a parameter, not part of the query text."""
+        mock_client.execute_read.return_value = []
+
+        topo_mgr.find_path("node1", "node2", max_hops=3)
+        topo_mgr.find_path("node1", "node2", max_hops=7)
+
+        (first, first_params), (second, second_params) = [
+            c[0] for c in mock_client.execute_read.call_args_list
+        ]
+        assert first == second
+        assert (first_params["max_hops"], second_params["max_hops"]) == (3, 7)
+        # The hop limit filters the matched path rather than the shortestPath() pattern
+        assert "WITH path\nWHERE length(path) <= $max_hops" in first
+
+    def test_get_nodes_grouped_by_type(self, topo_mgr, mock_client):
+        """Test grouping nodes by type in Cypher."""
+        mock_client.execute_read.return_value = [
+            {"type": "router_core", "nodes": [{"id": "r1", "name": "Router 1", "status": "healthy"}]},
+            {"type": "server", "nodes": [{"id": "s1", "name": "Server 1", "status": "down"}]},
+        ]
+
+        grouped = topo_mgr.get_nodes_grouped_by_type()
+
+        assert list(grouped) == ["router_core", "server"]
+        assert grouped["server"][0]["status"] == "down"
+
+    def test_iter_nodes_pages(self, topo_mgr, mock_client):
+        """Test iterating over a page of nodes."""
+        mock_client.execute_read.return_value = [
+            {"node": {"id": "node3", "name": "Node 3", "type": "server", "ip_address": "10.0.0.3", "location": "dc1", "status": "healthy", "vendor": "Dell", "model": "R750", "interfaces": []}},
+        ]
+
+        nodes = list(topo_mgr.iter_nodes(page=2, size=10))
+
+        assert [n.id for n in nodes] == ["node3"]
+        assert mock_client.execute_read.call_args[0][1] == {"skip": 20, "limit": 10}
+
+    def test_find_path_cached_until_write(self, topo_mgr, mock_client):
+        """Test that path results are cached until the topology changes."""
+        mock_client.execute_read.return_value = [{
+            "nodes": [
+                {"id": "node1", "name": "Node 1", "type": "router_core", "ip_address": "10.0.0.1", "location": "dc1", "status": "healthy", "vendor": "Cisco", "model": "ASR", "interfaces": []},
+            ]
+        }]
+
+        topo_mgr.find_path("node1", "node1")
+        topo_mgr.find_path("node1", "node1")
+        assert mock_client.execute_read.call_count == 1
+
+        mock_client.execute_write_summary.return_value.counters.properties_set = 2
+        topo_mgr.update_node_status("node1", NodeStatus.CRITICAL)
+
+        topo_mgr.find_path("node1", "node1")
+        assert mock_client.execute_read.call_count == 2
+
+    def test_read_cache_expires_after_ttl(self, topo_mgr, mock_client):
+        """Test that cached reads are refreshed once their TTL has passed."""
+        with patch("src.knowledge_graph.topology.time.monotonic", return_value=100.0):
+            topo_mgr.get_connected_nodes("node1")
+            topo_mgr.get_connected_nodes("node1")
+        assert mock_client.execute_read.call_count == 1
+
+        with patch("src.knowledge_graph.topology.time.monotonic",
+                   return_value=100.0 + topo_mgr.CACHE_TTL):
+            topo_mgr.get_connected_nodes("node1")
+        assert mock_client.execute_read.call_count == 2
+
+        stats = topo_mgr.cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["size"] == 1
+
+    def test_read_cache_evicts_least_recently_used(self, topo_mgr, mock_client):
+        """Test that the read cache is bounded."""
+        topo_mgr._read_cache.maxsize = 2
+
+        topo_mgr.get_node("a")
+        topo_mgr.get_node("b")
+        topo_mgr.get_node("a")
+        topo_mgr.get_node("c")
+        topo_mgr.get_node("a")
+        topo_mgr.get_node("b")
+
+        # "b" was evicted when "c" was added; "a" stayed cached
+        assert mock_client.execute_read.call_count == 4
+
+    def test_get_critical_nodes_parameters(self, topo_mgr, mock_client):
+        """Test that criticality thresholds are passed as query parameters."""
+        mock_client.execute_read.return_value = []
+
+        topo_mgr.get_critical_nodes(min_degree=5, limit=10)
+
+        params = mock_client.execute_read.call_args[0][1]
+        assert params["min_degree"] == 5
+        assert params["limit"] == 10
+        assert "router_core" in params["critical_types"]
+
+    def test_get_critical_nodes_uses_stored_degree(self, topo_mgr, mock_client):
+        """Test that criticality filters on n.degree without counting links."""
+        topo_mgr.get_critical_nodes()
+
+        query = mock_client.execute_read.call_args[0][0]
+        assert "WHERE n.degree > $min_degree" in query
+        assert "UNION" in query
+        assert "CONNECTS_TO" not in query
+
+    def test_ensure_schema_fills_missing_degrees(self, topo_mgr, mock_client):
+        """Test that nodes written before degrees were stored get one from their links."""
+        mock_client.execute_write_single.side_effect = None
+        mock_client.execute_write_single.return_value = {"count": 2}
+
+        topo_mgr.ensure_schema()
+
+        mock_client.ensure_indexes.assert_called_once()
+        query = mock_client.execute_write_single.call_args[0][0]
+        assert "WHERE n.degree IS NULL" in query
+        assert "SET n.degree = size([(n)-[:CONNECTS_TO]-() | 1])" in query
+
+    def test_writes_initialize_missing_degree_from_links(self, topo_mgr, mock_client, sample_node):
+        """Test that node and link writes count existing links when no degree is stored."""
+        mock_client.execute_write.side_effect = None
+        mock_client.execute_write.return_value = [{"node": {"id": sample_node.id}}]
+
+        topo_mgr.create_node(sample_node)
+        node_query = mock_client.execute_write.call_args[0][0]
+        mock_client.execute_write.return_value = [{"link": {"id": "l1"}}]
+        topo_mgr.create_link(Link(id="l1", source_node_id="a", target_node_id="b"))
+        link_query = mock_client.execute_write.call_args[0][0]
+
+        assert "n.degree = coalesce(n.degree, size([(n)-[:CONNECTS_TO]-() | 1]))" in node_query
+        assert "coalesce(source.degree + 1, size([(source)-[:CONNECTS_TO]-() | 1]))" in link_query
+
+    def test_link_writes_maintain_degree(self, topo_mgr, mock_client):
+        """Test that link creation and node deletion keep degrees current."""
+        mock_client.execute_write.side_effect = None
+        mock_client.execute_write.return_value = [{"link": {"id": "l1"}}]
+        mock_client.execute_write_summary.return_value.counters.nodes_deleted = 1
+
+        topo_mgr.create_link(Link(id="l1", source_node_id="a", target_node_id="b"))
+        topo_mgr.delete_node("a")
+
+        create_query = mock_client.execute_write.call_args[0][0]
+        delete_query = mock_client.execute_write_summary.call_args[0][0]
+        assert "ON CREATE SET source.degree" in create_query
+        assert "neighbor.degree = neighbor.degree - 1" in delete_query
+
+    def test_refresh_degrees(self, topo_mgr, mock_client):
+        """Test recomputing stored degrees."""
+        mock_client.execute_write_single.side_effect = None
+        mock_client.execute_write_single.return_value = {"count": 7}
+
+        assert topo_mgr.refresh_degrees() == 7
+
+    def test_get_node_with_neighbors(self, topo_mgr, mock_client):
+        """Test getting a node and its neighbors in one query."""
+        mock_client.execute_read.return_value = [{
+            "node": {"id": "node1", "name": "Node 1", "type": "router_core", "ip_address": "10.0.0.1", "location": "dc1", "status": "healthy", "vendor": "Cisco", "model": "ASR", "interfaces": []},
+            "connected": [
+                {"id": "node2", "name": "Node 2", "type": "switch_access", "ip_address": "10.0.0.2", "location": "dc1", "status": "healthy", "vendor": "Juniper", "model": "QFX", "interfaces": []},
+            ],
+        }]
+
+        node, connected = topo_mgr.get_node_with_neighbors("node1")
+
+        assert node.id == "node1"
+        assert [c.id for c in connected] == ["node2"]
+        mock_client.execute_read.assert_called_once()
+
+    def test_get_node_with_neighbors_not_found(self, topo_mgr, mock_client):
+        """Test getting a missing node with neighbors."""
+        mock_client.execute_read.return_value = []
+
+        assert topo_mgr.get_node_with_neighbors("nonexistent") == (None, [])
+
+    def test_get_node_neighborhood(self, topo_mgr, mock_client):
+        """Test getting upstream, downstream and dependent nodes in one query."""
+        mock_client.execute_read.return_value = [{
+            "node": {"id": "node2", "type": "switch_distribution", "status": "healthy"},
+            "upstream": [{"id": "node1", "type": "router_core", "status": "healthy"}],
+            "downstream": [{"id": "node3", "type": "server", "status": "healthy"}],
+            "dependencies": [
+                {"id": "node1", "type": "router_core", "status": "healthy"},
+                {"id": "node0", "type": "firewall", "status": "healthy"},
+            ],
+        }]
+
+        neighborhood = topo_mgr.get_node_neighborhood("node2")
+
+        assert neighborhood["node"].id == "node2"
+        assert [n.id for n in neighborhood["upstream"]] == ["node1"]
+        assert [n.id for n in neighborhood["downstream"]] == ["node3"]
+        assert [n.id for n in neighborhood["dependencies"]] == ["node1", "node0"]
+        mock_client.execute_read.assert_called_once()
+
+    def test_get_node_neighborhood_not_found(self, topo_mgr, mock_client):
+        """Test the neighborhood of a missing node."""
+        neighborhood = topo_mgr.get_node_neighborhood("nonexistent")
+
+        assert neighborhood == {"node": None, "upstream": [], "downstream": [], "dependencies": []}
+
+    def test_get_node_with_dependencies(self, topo_mgr, mock_client):
+        """Test getting a node and its dependents without its adjacent nodes."""
+        mock_client.execute_read.return_value = [{
+            "node": {"id": "node2", "type": "switch_distribution", "status": "healthy"},
+            "dependencies": [{"id": "node1", "type": "router_core", "status": "healthy"}],
+        }]
+
+        node, dependencies = topo_mgr.get_node_with_dependencies("node2")
+
+        assert node.id == "node2"
+        assert [d.id for d in dependencies] == ["node1"]
+        query = mock_client.execute_read.call_args[0][0]
+        assert "upstream" not in query and "downstream" not in query
+
+    def test_node_metadata_round_trip(self, topo_mgr, sample_node):
+        """Test that stored metadata is JSON and is parsed back on read."""
+        sample_node.metadata = {"rack": "A1", "ports": [1, 2]}
+
+        props = topo_mgr._node_properties(sample_node)
+        node = topo_mgr._node_from_record({"id": sample_node.id, **props})
+
+        assert props["metadata"] == '{"rack":"A1","ports":[1,2]}'
+        assert node.metadata == {"rack": "A1", "ports": [1, 2]}
+
+    def test_node_from_record_matches_validated_model(self, topo_mgr, sample_node):
+        """Test that the unvalidated Node equals one built with validation."""
+        props = topo_mgr._node_properties(sample_node)
+
+        node = topo_mgr._node_from_record({"id": sample_node.id, **props})
+        validated = Node.model_validate(node.model_dump())
+
+        assert node.model_dump(exclude={"created_at"}) == validated.model_dump(exclude={"created_at"})
+        assert node.type is NodeType.ROUTER_CORE
+
+    def test_node_legacy_metadata_ignored(self, topo_mgr):
+        """Test that metadata stored as str(dict) reads back as empty."""
+        node = topo_mgr._node_from_record({"id": "node1", "metadata": "{'rack': 'A1'}"})
+
+        assert node.metadata == {}
+
+    def test_node_from_record_enum_defaults(self, topo_mgr):
+        """Test that missing type/status values fall back to defaults."""
+        node = topo_mgr._node_from_record({"id": "node1"})
+
+        assert node.type == NodeType.SERVER
+        assert node.status == NodeStatus.UNKNOWN
+
+    def test_node_from_record_rejects_unknown_type(self, topo_mgr):
+        """Test that an unknown stored type raises instead of becoming a server."""
+        with pytest.raises(ValueError):
+            topo_mgr._node_from_record({"id": "node1", "type": "mainframe"})
+
+    def test_iter_all_nodes_streams(self, topo_mgr, mock_client):
+        """Test that nodes are yielded before the driver result is exhausted."""
+        fetched = []
+
+        def records(query, parameters=None):
+            for node_id in ("node1", "node2"):
+                fetched.append(node_id)
+                yield {"node": {"id": node_id, "type": "server", "status": "healthy"}}
+
+        mock_client.execute_read_iter.side_effect = records
+
+        nodes = topo_mgr.iter_all_nodes()
+
+        assert next(nodes).id == "node1"
+        assert fetched == ["node1"]
+        assert [n.id for n in nodes] == ["node2"]
+
+
+class TestAsyncTopologyManager:
+    """Test cases for AsyncTopologyManager."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Create a mock async Neo4j client."""
+        client = MagicMock(spec=AsyncNeo4jClient)
+        client.execute_read = AsyncMock(return_value=[])
+        return client
+
+    @pytest.fixture
+    def topo_mgr(self, mock_client):
+        """Create AsyncTopologyManager with mock client."""
+        return AsyncTopologyManager(mock_client)
+
+    @pytest.mark.asyncio
+    async def test_get_node(self, topo_mgr, mock_client):
+        """Test getting a node through the async client."""
+        mock_client.execute_read.return_value = [{
+            "node": {"id": "node1", "name": "Node 1", "type": "router_core", "ip_address": "10.0.0.1", "location": "dc1", "status": "healthy", "vendor": "Cisco", "model": "ASR", "interfaces": []},
+        }]
+
+        node = await topo_mgr.get_node("node1")
+
+        assert node.id == "node1"
+        assert node.type == NodeType.ROUTER_CORE
+        mock_client.execute_read.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_get_node_not_found(self, topo_mgr):
+        """Test getting a missing node."""
+        assert await topo_mgr.get_node("nonexistent") is None
+
+    @pytest.mark.asyncio
+    async def test_get_node_with_dependencies_not_found(self, topo_mgr):
+        """Test the dependencies of a missing node."""
+        assert await topo_mgr.get_node_with_dependencies("nonexistent") == (None, [])
+
+    @pytest.mark.asyncio
+    async def test_get_topology_summary_empty(self, topo_mgr):
+        """Test the summary of an empty topology."""
+        summary = await topo_mgr.get_topology_summary()
+
+        assert summary == {"nodes": 0, "links": 0, "types": [], "locations": []}
+
+    @pytest.mark.asyncio
+    async def test_find_path_clamps_hops(self, topo_mgr, mock_client):
+        """Test that the async path query uses the clamped hop limit."""
+        await topo_mgr.find_path("a", "b", max_hops=100)
+
+        params = mock_client.execute_read.call_args[0][1]
+        assert params["max_hops"] == AsyncTopologyManager.MAX_PATH_HOPS
+
+    @pytest.mark.asyncio
+    async def test_get_all_nodes_streams(self, topo_mgr, mock_client):
+        """Test that all nodes are read through the streaming client call."""
+        async def records(query, parameters=None):
+            yield {"node": {"id": "node1", "type": "router_core", "status": "healthy"}}
+
+        mock_client.execute_read_iter = MagicMock(side_effect=records)
+
+        nodes = await topo_mgr.get_all_nodes()
+
+        assert [n.id for n in nodes] == ["node1"]
+        mock_client.execute_read.assert_not_called()
@@ -2,6 +2,7 @@
 
 import pytest
 import json
+from collections import defaultdict, deque
 from unittest.mock import MagicMock, patch, AsyncMock
 
 from src.simulator.network_sim import NetworkSimulator
@@ -91,6 +92,24 @@ class TestTelemetryTools:
 
         assert len(anomaly_inj.get_active_anomalies()) == 0
 
+    @pytest.mark.asyncio
+    async def test_telemetry_responses_follow_pretty_setting(self, setup_simulator):
+        """Test that telemetry responses use the shared JSON settings."""
+        from src.mcp_server import _json
+        from src.mcp_server.tools import telemetry_handlers
+
+        arguments = {"node_id": "router_core_01"}
+
+        with patch.object(telemetry_handlers, "_get_components", return_value=setup_simulator):
+            with patch.object(_json, "_INDENT", None), patch.object(_json, "_ORJSON_OPTION", 0):
+                compact = await telemetry_handlers.handle_get_node_metrics(arguments)
+            with patch.object(_json, "_INDENT", 2), \
+                    patch.object(_json, "_ORJSON_OPTION", _json.orjson.OPT_INDENT_2 if _json.orjson else 0):
+                pretty = await telemetry_handlers.handle_get_node_metrics(arguments)
+
+        assert "\n" not in compact[0].text
+        assert "\n  " in pretty[0].text
+
 
 class TestDiagnosisLogic:
     """Test diagnosis logic."""
@@ -146,6 +165,142 @@ class TestDiagnosisLogic:
         loss_metric = snapshot.get_metric(MetricType.PACKET_LOSS)
         assert loss_metric.value > 5
 
+    @pytest.mark.asyncio
+    async def test_run_diagnosis_reports_threshold_issues(self, setup_simulator):
+        """Test that run_diagnosis applies the threshold checks to a node."""
+        from src.mcp_server.tools import diagnosis_handlers
+
+        _, _, _, anomaly_inj = setup_simulator
+        anomaly_inj.inject_anomaly("router_core_01", AnomalyType.HIGH_CPU, AnomalySeverity.CRITICAL)
+
+        with patch.object(diagnosis_handlers, "_get_components", return_value=setup_simulator):
+            result = await diagnosis_handlers.handle_run_diagnosis(
+                {"node_id": "router_core_01", "check_types": ["cpu"]}
+            )
+
+        report = json.loads(result[0].text)
+        assert report["nodes_analyzed"] == 1
+        assert {i["type"] for i in report["issues"]} == {"HIGH_CPU"}
+        assert report["issues"][0]["severity"] in ("high", "critical")
+        assert report["overall_status"] == report["issues"][0]["severity"]
+        assert sum(report["issues_by_severity"].values()) == report["total_issues"]
+
+    @pytest.mark.asyncio
+    async def test_run_diagnosis_generates_checked_metrics_only(self, setup_simulator):
+        """Test that run_diagnosis only generates the metrics its checks read."""
+        from src.mcp_server.tools import diagnosis_handlers
+
+        _, _, tel_gen, _ = setup_simulator
+
+        with patch.object(diagnosis_handlers, "_get_components", return_value=setup_simulator), \
+                patch.object(tel_gen, "generate_snapshot", wraps=tel_gen.generate_snapshot) as snapshot:
+            result = await diagnosis_handlers.handle_run_diagnosis(
+                {"node_id": "router_core_01", "check_types": ["cpu", "latency"]}
+            )
+
+        _, timestamp, metric_types = snapshot.call_args.args
+        assert metric_types == [MetricType.CPU_UTILIZATION, MetricType.LATENCY]
+        # The report carries the same aware UTC time its readings were taken at
+        assert json.loads(result[0].text)["timestamp"] == timestamp.isoformat()
+        assert timestamp.tzinfo is not None
+
+    def test_issue_serializes_without_orjson(self):
+        """Test that the json fallback writes issues as plain objects."""
+        from src.mcp_server import _json
+        from src.mcp_server.tools import diagnosis_handlers
+
+        issue = diagnosis_handlers.Issue("HIGH_CPU", "high", "router_core_01", 91.5)
+
+        with patch.object(_json, "orjson", None):
+            text = _json.dumps({"issues": [issue]})
+
+        assert json.loads(text) == {"issues": [
+            {"type": "HIGH_CPU", "severity": "high", "node_id": "router_core_01", "value": 91.5}
+        ]}
+
+    @pytest.mark.asyncio
+    async def test_get_anomalies_minimum_severity(self, setup_simulator):
+        """Test that the severity filter keeps anomalies at or above it."""
+        from src.mcp_server.tools import diagnosis_handlers
+
+        _, _, _, anomaly_inj = setup_simulator
+        anomaly_inj.inject_anomaly("router_core_01", AnomalyType.HIGH_CPU, AnomalySeverity.LOW)
+        anomaly_inj.inject_anomaly("router_core_02", AnomalyType.PACKET_LOSS, AnomalySeverity.CRITICAL)
+
+        with patch.object(diagnosis_handlers, "_get_components", return_value=setup_simulator):
+            result = await diagnosis_handlers.handle_get_anomalies({"severity": "high"})
+
+        anomalies = json.loads(result[0].text)["anomalies"]
+        assert [a["severity"] for a in anomalies] == ["critical"]
+
+    @pytest.mark.asyncio
+    async def test_get_anomalies_empty_response(self, setup_simulator):
+        """Test that an empty result reuses the prebuilt response."""
+        from src.mcp_server.tools import diagnosis_handlers
+
+        with patch.object(diagnosis_handlers, "_get_components", return_value=setup_simulator):
+            first = await diagnosis_handlers.handle_get_anomalies({})
+            second = await diagnosis_handlers.handle_get_anomalies({"node_id": "router_core_01"})
+
+        assert first[0] is second[0]
+        assert json.loads(first[0].text) == {"total_anomalies": 0, "anomalies": []}
+
+    @pytest.fixture
+    def diagnosis_handlers(self, setup_simulator):
+        """Route the diagnosis tools to a fresh simulator and empty history."""
+        from src.mcp_server.tools import diagnosis_handlers
+
+        with patch.object(diagnosis_handlers, "_get_components", return_value=setup_simulator), \
+                patch.object(diagnosis_handlers, "_diagnosis_history", deque(maxlen=100)), \
+                patch.object(diagnosis_handlers, "_history_by_scope", defaultdict(lambda: deque(maxlen=100))):
+            yield diagnosis_handlers
+
+    @pytest.mark.asyncio
+    async def test_diagnosis_history_by_node(self, diagnosis_handlers):
+        """Test that history is returned newest first and filtered by scope."""
+        await diagnosis_handlers.handle_run_diagnosis({"node_id": "router_core_01"})
+        await diagnosis_handlers.handle_run_diagnosis({})
+        await diagnosis_handlers.handle_run_diagnosis({"node_id": "router_core_01"})
+
+        latest = diagnosis_handlers.get_diagnosis_history(limit=2)
+        node_history = diagnosis_handlers.get_diagnosis_history(node_id="router_core_01")
+
+        assert [r["scope"] for r in latest] == ["router_core_01", "network-wide"]
+        assert len(node_history) == 2
+        assert node_history[0] is latest[0]
+        assert diagnosis_handlers.get_diagnosis_history(node_id="unknown") == []
+
+    @pytest.mark.asyncio
+    async def test_diagnosis_ids_unique(self, diagnosis_handlers):
+        """Test that diagnosis IDs keep their shape and never repeat."""
+        results = [
+            await diagnosis_handlers.handle_run_diagnosis({"node_id": "router_core_01"})
+            for _ in range(3)
+        ]
+
+        ids = [json.loads(r[0].text)["diagnosis_id"] for r in results]
+        assert len(set(ids)) == 3
+        assert all(i.startswith("diag_") and len(i) == len("diag_") + 12 for i in ids)
+
+    def test_tools_import_without_simulator(self):
+        """Test that importing the tool modules defers loading the simulator."""
+        import subprocess
+        import sys
+
+        code = "import sys, src.mcp_server.tools; print('src.simulator' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == "False"
+
+    def test_tool_modules_share_components(self):
+        """Test that telemetry, diagnosis and execution tools use one simulator."""
+        from src.mcp_server.tools import diagnosis_handlers, execution_handlers, telemetry_handlers
+
+        components = telemetry_handlers._get_components()
+
+        assert diagnosis_handlers._get_components() is components
+        assert execution_handlers._get_network_sim() is components[0]
+
 
 class TestPolicyEvaluation:
     """Test policy evaluation logic."""
@@ -225,4 +380,126 @@ class TestExecutionSimulation:
         # Restore to healthy
         network_sim.update_node_status("router_core_01", NodeStatus.HEALTHY)
         node = network_sim.get_node("router_core_01")
-        assert node.status == NodeStatus.HEALTHY
\ No newline at end of file
+        assert node.status == NodeStatus.HEALTHY
+
+    @pytest.fixture
+    def execution_handlers(self, setup_simulator):
+        """Route the execution tools to a fresh simulator and empty history."""
+        from src.mcp_server.tools import execution_handlers
+
+        with patch.object(execution_handlers, "_get_network_sim", return_value=setup_simulator), \
+                patch.object(execution_handlers, "_execution_history", deque(maxlen=100)), \
+                patch.object(execution_handlers, "_execution_index", {}), \
+                patch.object(execution_handlers, "_history_by_node", defaultdict(deque)), \
+                patch.object(execution_handlers, "_history_by_action", defaultdict(deque)):
+            yield execution_handlers
+
+    @pytest.mark.asyncio
+    async def test_execution_status_lookup(self, execution_handlers):
+        """Test that executions can be looked up by ID."""
+        result = await execution_handlers.handle_execute_action(
+            {"action_type": "clear_cache", "target_node_id": "router_core_01"}
+        )
+        execution_id = json.loads(result[0].text)["execution_id"]
+
+        status = await execution_handlers.handle_get_execution_status({"execution_id": execution_id})
+        missing = await execution_handlers.handle_get_execution_status({"execution_id": "exec_unknown"})
+
+        record = json.loads(status[0].text)
+        assert record["execution_id"] == execution_id
+        assert record["target_node_id"] == "router_core_01"
+        assert "error" in json.loads(missing[0].text)
+
+    @pytest.mark.asyncio
+    async def test_execution_history_filters(self, execution_handlers):
+        """Test that history filters by node and action type, newest first."""
+        for action_type, node_id in [("clear_cache", "router_core_01"), ("failover", "router_core_01"),
+                                     ("clear_cache", "router_core_02"), ("clear_cache", "router_core_01")]:
+            await execution_handlers.handle_execute_action({"action_type": action_type, "target_node_id": node_id})
+
+        async def history(**arguments):
+            result = await execution_handlers.handle_get_execution_history(arguments)
+            return [(r["action_type"], r["target_node_id"]) for r in json.loads(result[0].text)["executions"]]
+
+        assert await history(node_id="router_core_01", action_type="clear_cache") == \
+            [("clear_cache", "router_core_01")] * 2
+        assert await history(action_type="failover") == [("failover", "router_core_01")]
+        assert await history(limit=2) == [("clear_cache", "router_core_01"), ("clear_cache", "router_core_02")]
+        assert await history(node_id="unknown") == []
+        assert "unknown" not in execution_handlers._history_by_node
+
+    @pytest.mark.asyncio
+    async def test_simulated_actions(self, execution_handlers):
+        """Test known and unknown action types through the dispatch table."""
+        restart = await execution_handlers.handle_execute_action(
+            {"action_type": "restart_node", "target_node_id": "router_core_01"}
+        )
+        custom = await execution_handlers.handle_execute_action(
+            {"action_type": "reroute_traffic", "target_node_id": "router_core_01"}
+        )
+
+        assert json.loads(restart[0].text)["result"]["message"].endswith("restarted")
+        assert json.loads(custom[0].text)["result"]["message"].startswith("Action reroute_traffic executed")
+
+    @pytest.mark.asyncio
+    async def test_execution_history_evicts_oldest(self, execution_handlers):
+        """Test that the capped history also drops evicted records from its indexes."""
+        with patch.object(execution_handlers, "_execution_history", deque(maxlen=2)):
+            ids = []
+            for node_id in ("router_core_01", "router_core_02", "router_core_01"):
+                result = await execution_handlers.handle_execute_action(
+                    {"action_type": "clear_cache", "target_node_id": node_id}
+                )
+                ids.append(json.loads(result[0].text)["execution_id"])
+
+            history = await execution_handlers.handle_get_execution_history({})
+            evicted = await execution_handlers.handle_get_execution_status({"execution_id": ids[0]})
+
+        assert [r["execution_id"] for r in json.loads(history[0].text)["executions"]] == ids[:0:-1]
+        assert "error" in json.loads(evicted[0].text)
+        assert [len(execution_handlers._history_by_node[n]) for n in ("router_core_01", "router_core_02")] == [1, 1]
+        assert len(execution_handlers._history_by_action["clear_cache"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_execution_responses_compact_unless_pretty(self, execution_handlers):
+        """Test that responses are compact JSON unless pretty output is configured."""
+        from src.mcp_server import _json
+
+        arguments = {"action_type": "clear_cache", "target_node_id": "router_core_01"}
+
+        with patch.object(_json, "_INDENT", None), patch.object(_json, "_ORJSON_OPTION", 0):
+            compact = await execution_handlers.handle_execute_action(arguments)
+        with patch.object(_json, "_INDENT", 2), \
+                patch.object(_json, "_ORJSON_OPTION", _json.orjson.OPT_INDENT_2 if _json.orjson else 0):
+            pretty = await execution_handlers.handle_execute_action(arguments)
+
+        assert "\n" not in compact[0].text
+        assert "\n  " in pretty[0].text
+
+
+class TestTopologyTools:
+    """Tests for topology tool setup."""
+
+    def test_topology_client_closed_when_loop_changes(self):
+        """Test that a new event loop closes the previous loop's client."""
+        import asyncio
+        from src.mcp_server.tools import topology_handlers
+
+        clients = []
+
+        def make_client(**kwargs):
+            client = MagicMock()
+            client.close = AsyncMock()
+            clients.append(client)
+            return client
+
+        with patch.object(topology_handlers, "AsyncNeo4jClient", side_effect=make_client), \
+                patch.object(topology_handlers, "_topology_manager", None), \
+                patch.object(topology_handlers, "_topology_loop", None):
+            first = asyncio.run(topology_handlers._get_topology_manager())
+            second = asyncio.run(topology_handlers._get_topology_manager())
+
+        assert first is not second
+        assert len(clients) == 2
+        clients[0].close.assert_awaited_once()
+        clients[1].close.assert_not_awaited()
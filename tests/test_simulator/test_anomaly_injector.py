@@ -272,4 +272,14 @@ class TestAnomalyInjector:
         # Should affect CPU, latency, and packet loss
         assert MetricType.CPU_UTILIZATION in anomaly.affected_metrics
         assert MetricType. LATENCY in anomaly.affected_metrics
-        assert MetricType.PACKET_LOSS in anomaly. affected_metrics
\ No newline at end of file
+        assert MetricType.PACKET_LOSS in anomaly. affected_metrics
+    
+    def test_anomaly_started_at_iso(self, setup):
+        """Test the cached ISO start time matches started_at and stays out of dumps."""
+        sim, log_gen, tel_gen, injector = setup
+        
+        anomaly = injector.inject_anomaly("router_core_01", AnomalyType.HIGH_CPU)
+        
+        assert anomaly.started_at_iso == anomaly.started_at.isoformat()
+        assert anomaly.started_at_iso is anomaly.started_at_iso
+        assert "started_at_iso" not in anomaly.model_dump()